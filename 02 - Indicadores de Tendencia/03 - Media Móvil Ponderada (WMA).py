@@ -7,7 +7,7 @@ import mplfinance as mpf
 import matplotlib.pyplot as plt
 
 # Indicador: Media Móvil Ponderada (WMA)
-def Media_Movil_Ponderada(df: pd.DataFrame, longitud: int = 9, columna: str = "Close") -> pd.Series:
+def Media_Movil_Ponderada(df: pd.DataFrame, longitud: int = 9, columna: str = "Close", bloque: int = 64) -> pd.Series:
     
     """
     La Media Móvil Ponderada (WMA) es un indicador técnico que asigna un mayor peso a los puntos de datos más recientes,
@@ -20,35 +20,73 @@ def Media_Movil_Ponderada(df: pd.DataFrame, longitud: int = 9, columna: str = "C
         La WMA se opera de la misma manera que la SMA. La principal diferencia entre estas dos es la importancia que la WMA
         da a los datos más recientes.
         
+    Cálculo:
+        
+        Cada ventana se obtiene de la anterior con una suma acumulada (S1) y una suma acumulada ponderada por la posición
+        (S2): la suma ponderada de la ventana que termina en t es (S2[t] - S2[t-n]) - (t-n) * (S1[t] - S1[t-n]), por lo que
+        el costo es O(n) sin importar la longitud. Para que el error de redondeo no crezca en series intradía largas, las
+        sumas acumuladas se reinician en cada bloque de 'bloque' ventanas y se calculan sobre la diferencia de los precios
+        con el primer precio del bloque (que se vuelve a sumar al final, ya que los pesos suman 1). Todos los bloques se
+        calculan a la vez como filas de un arreglo 2D.
+        
     ----------    
     Parámetros
     ----------
     param : pd.DataFrame : df : Datos históricos del activo financiero.
     ----------
-    param : int : longitud : Ventana a utilizar en el cálculo de la WMA (por defecto, se establece en 9).
+    param : int|list : longitud : Ventana (o lista de ventanas) a utilizar en el cálculo de la WMA (por defecto, se establece en 9).
     ----------
     param : str : columna : Columna a utilizar en el cálculo de la WMA (por defecto, se establece en 'Close').
     ----------
+    param : int : bloque : Número de ventanas entre reinicios de las sumas acumuladas (por defecto, se establece en 64).
+    ----------
     Salida:
     ----------
-    return : pd.Series : Cálculo de la Media Móvil Ponderada.
+    return : pd.Series|pd.DataFrame : Cálculo de la Media Móvil Ponderada (si 'longitud' es una lista, un pd.DataFrame con
+                                      una columna 'WMA {longitud}' por ventana).
     """
     
     # Calcular
-    df = df[columna]
-    pesos = np.arange(1, longitud + 1) / np.arange(1, longitud + 1).sum()
-    func = lambda x: np.sum(pesos * x)
-    WMA = df.rolling(window=longitud, min_periods=longitud).apply(func, raw=True)
-    WMA.name = "WMA"
+    serie = df[columna]
+    longitudes = [longitud] if np.isscalar(longitud) else list(longitud)
+    x = serie.to_numpy(dtype=np.float64)
+    faltantes = np.isnan(x)
+    x = np.where(faltantes, 0.0, x)
+    # Número de valores faltantes acumulados (una ventana con algún faltante da NaN, igual que rolling)
+    conteo_faltantes = np.concatenate([[0], np.cumsum(faltantes)])
+    n = x.shape[0]
+    WMA = {}
+    for n_ventana in longitudes:
+        resultado = np.full(n, np.nan)
+        pesos_totales = n_ventana * (n_ventana + 1) / 2
+        n_salidas = n - n_ventana + 1
+        if n_salidas > 0:
+            # Bloques de 'bloque' ventanas: cada fila incluye las n_ventana - 1 velas previas para completar su primera ventana
+            n_bloques = -(-n_salidas // bloque)
+            relleno = np.concatenate([x, np.zeros(n_bloques * bloque - n_salidas)])
+            tramos = np.lib.stride_tricks.sliding_window_view(relleno, bloque + n_ventana - 1)[::bloque]
+            referencia = tramos[:, :1]
+            tramos = tramos - referencia
+            posiciones = np.arange(1, bloque + n_ventana)
+            S1 = np.concatenate([np.zeros((n_bloques, 1)), np.cumsum(tramos, axis=1)], axis=1)
+            S2 = np.concatenate([np.zeros((n_bloques, 1)), np.cumsum(tramos * posiciones, axis=1)], axis=1)
+            t = np.arange(n_ventana, bloque + n_ventana)
+            suma_ponderada = (S2[:, t] - S2[:, t - n_ventana]) - (t - n_ventana) * (S1[:, t] - S1[:, t - n_ventana])
+            resultado[n_ventana - 1:] = (suma_ponderada / pesos_totales + referencia).ravel()[:n_salidas]
+            resultado[n_ventana - 1:][conteo_faltantes[n_ventana:] - conteo_faltantes[:n_salidas] > 0] = np.nan
+        WMA[n_ventana] = pd.Series(resultado, index=serie.index, name="WMA")
+    
+    if np.isscalar(longitud):
+        return WMA[longitud]
     
-    return WMA
+    return pd.DataFrame({f"WMA {n_ventana}": WMA[n_ventana] for n_ventana in longitudes}, index=serie.index)
 
 # Obtener Datos
 df = yf.download("META", start="2023-01-01", end="2025-07-01", interval="1d", multi_level_index=False)
 
 # Calcular Indicador
-wma_9 = Media_Movil_Ponderada(df, longitud=9, columna="Close")
-wma_12 = Media_Movil_Ponderada(df, longitud=12, columna="Close")
+wma = Media_Movil_Ponderada(df, longitud=[9, 12], columna="Close")
+wma_9, wma_12 = wma["WMA 9"], wma["WMA 12"]
 
 # Graficar
 wma_plots = [
@@ -68,3 +106,5 @@ plt.show()
 #   - Las WMA comunes son las de 9 y 12 periodos. La WMA se utiliza para identificar la tendencia y generar señales de compra o venta.
 #   - La WMA se puede operar de manera similar a la SMA, pero es más reactiva a los cambios recientes en el precio.
 #   - Para evitar malas interpretaciones, es útil usar la WMA en combinación con otra WMA de diferente longitud.
+#   - Se pueden calcular varias WMA en una sola llamada (por ejemplo, longitud=[9, 12] para un cruce), y cada una se obtiene en
+#     O(n) a partir de sumas acumuladas, por lo que también sirve para medias derivadas como la Media Móvil de Hull.
@@ -5,6 +5,37 @@ import yfinance as yf
 import matplotlib.pyplot as plt
 import numpy as np
 
+# Suavizado de Wilder
+def Suavizado_Wilder(valores: np.ndarray, longitud: int, semilla: float, suma: bool = False) -> np.ndarray:
+    
+    """
+    Suavizado de Wilder como filtro recursivo lineal (media exponencial con alpha = 1 / longitud), sin ciclos de Python.
+    Con suma=False calcula y[k] = (y[k-1] * (longitud - 1) + x[k]) / longitud y con suma=True calcula las sumas suavizadas
+    S[k] = S[k-1] * (1 - 1 / longitud) + x[k] (que son 'longitud' veces el promedio).
+    
+    -----------
+    Parámetros:
+    -----------
+    param : np.ndarray : valores : Valores a suavizar.
+    -----------
+    param : int : longitud : Ventana del suavizado.
+    -----------
+    param : float : semilla : Valor inicial del suavizado.
+    -----------
+    param : bool : suma : Si es True, se calculan las sumas suavizadas (por defecto, se establece en False).
+    -----------
+    Salida:
+    -----------
+    return : np.ndarray : Valores suavizados, empezando por la semilla.
+    """
+    
+    valores = np.concatenate([[semilla / longitud if suma else semilla], np.asarray(valores, dtype=np.float64)])
+    suavizado = pd.Series(valores).ewm(alpha=1 / longitud, adjust=False).mean().to_numpy()
+    # Un valor faltante hace que todos los valores siguientes sean faltantes (igual que en la recursión)
+    suavizado[np.logical_or.accumulate(np.isnan(valores))] = np.nan
+    
+    return suavizado * longitud if suma else suavizado
+
 # Indicador: Índice de Movimiento Direccional
 def Indice_Movimiento_Direccional(df: pd.DataFrame, suavizado_ADX: int = 14, longitud_DI: int = 14) -> pd.DataFrame:
     
@@ -48,27 +79,19 @@ def Indice_Movimiento_Direccional(df: pd.DataFrame, suavizado_ADX: int = 14, lon
     plus_DM = pre_PDM.where((pre_PDM > pre_MDM.values) & (pre_PDM > 0), 0)
     minus_DM = pre_MDM.where((pre_MDM > pre_PDM.values) & (pre_MDM > 0), 0)
     
-    # Calcular los valores iniciales para las sumas suavizadas de TR, +DM, -DM
-    TRL = [np.nansum(TR[:suavizado_ADX + 1])]
-    PDML = [plus_DM[:suavizado_ADX].sum()]
-    MDML = [minus_DM[:suavizado_ADX].sum()]
-    factor = 1 - 1 / suavizado_ADX
-
-    # Calcular las sumas suavizadas de TR, +DM y -DM utilizando el método Wilder
-    for i in range(0, int(df.shape[0] - suavizado_ADX - 1)):
-        TRL.append(TRL[i] * factor + TR[suavizado_ADX + i + 1])
-        PDML.append(PDML[i] * factor + plus_DM[suavizado_ADX + i])
-        MDML.append(MDML[i] * factor + minus_DM[suavizado_ADX + i])
+    # Calcular las sumas suavizadas de TR, +DM y -DM utilizando el método Wilder (a partir de sus valores iniciales)
+    TRL = Suavizado_Wilder(TR.to_numpy()[suavizado_ADX + 1:], suavizado_ADX, semilla=np.nansum(TR[:suavizado_ADX + 1]), suma=True)
+    PDML = Suavizado_Wilder(plus_DM.to_numpy()[suavizado_ADX:], suavizado_ADX, semilla=plus_DM[:suavizado_ADX].sum(), suma=True)
+    MDML = Suavizado_Wilder(minus_DM.to_numpy()[suavizado_ADX:], suavizado_ADX, semilla=minus_DM[:suavizado_ADX].sum(), suma=True)
         
     # Calcular los Indicadores Direccionales (+DI y -DI)
-    PDI = np.array(PDML) / np.array(TRL) * 100
-    MDI = np.array(MDML) / np.array(TRL) * 100
+    PDI = PDML / TRL * 100
+    MDI = MDML / TRL * 100
     # Calcular el Indice Direccional (DX)
     DX = np.abs(PDI - MDI) / (PDI + MDI) * 100
-    ADX = [DX[:suavizado_ADX].mean()]
     
     # Calcular el Índice Direccional Promedio (ADX) utilizando la longitud_DI
-    _ = [ADX.append((ADX[i] * (longitud_DI - 1) + DX[longitud_DI + i])/longitud_DI) for i in range(int(len(DX) - longitud_DI))]
+    ADX = Suavizado_Wilder(DX[longitud_DI:], longitud_DI, semilla=DX[:suavizado_ADX].mean())
     ADXI = pd.DataFrame(PDI, columns=["+DI"], index=df.index[-len(PDI):])
     ADXI["-DI"] = MDI
     ADX = pd.DataFrame(ADX, columns=["ADX"], index=df.index[-len(ADX):])
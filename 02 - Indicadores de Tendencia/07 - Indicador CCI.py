@@ -5,6 +5,42 @@ import numpy as np
 import yfinance as yf
 import matplotlib.pyplot as plt
 
+# Desviación Media Móvil
+def Desviacion_Media_Movil(valores: np.ndarray, longitud: int, elementos_bloque: int = 2 ** 22) -> np.ndarray:
+    
+    """
+    Desviación media absoluta móvil: mean(|x - mean(x)|) de cada ventana de 'longitud' valores, sin llamar a una función de
+    Python por ventana. Las ventanas se obtienen como vistas del arreglo (sliding_window_view, sin copiar los datos) y se
+    procesan por bloques de filas para que la memoria temporal no dependa del tamaño de la serie ni del número de activos.
+    Una ventana con algún valor faltante da NaN (igual que rolling(...).apply con min_periods=longitud).
+    
+    -----------
+    Parámetros:
+    -----------
+    param : np.ndarray : valores : Serie (1D) o panel de series (2D, una columna por activo).
+    -----------
+    param : int : longitud : Ventana de la desviación media.
+    -----------
+    param : int : elementos_bloque : Número máximo de elementos de las ventanas que se procesan a la vez (por defecto, 2 ** 22).
+    -----------
+    Salida:
+    -----------
+    return : np.ndarray : Desviación media de cada ventana (NaN en las primeras longitud - 1 filas), con la forma de 'valores'.
+    """
+    
+    valores = np.asarray(valores, dtype=np.float64)
+    resultado = np.full(valores.shape, np.nan)
+    if valores.shape[0] < longitud:
+        return resultado
+    ventanas = np.lib.stride_tricks.sliding_window_view(valores, longitud, axis=0)
+    filas_bloque = max(1, elementos_bloque // (longitud * int(np.prod(valores.shape[1:]))))
+    for inicio in range(0, ventanas.shape[0], filas_bloque):
+        bloque = ventanas[inicio:inicio + filas_bloque]
+        media = bloque.mean(axis=-1, keepdims=True)
+        resultado[longitud - 1 + inicio:longitud - 1 + inicio + bloque.shape[0]] = np.abs(bloque - media).mean(axis=-1)
+    
+    return resultado
+
 # Indicador: Índice de Canal de Materias Primas (CCI)
 def CCI(df: pd.DataFrame, longitud: int = 20, constante: float = 0.015) -> pd.Series:
     
@@ -22,7 +58,8 @@ def CCI(df: pd.DataFrame, longitud: int = 20, constante: float = 0.015) -> pd.Se
     -----------
     Parámetros:
     -----------
-    param : pd.DataFrame : df : Datos históricos del activo financiero.
+    param : pd.DataFrame : df : Datos históricos del activo financiero (o de varios activos, con columnas (columna, activo) como las
+                                de yf.download).
     -----------
     param : int : longitud : Ventana a utilizar en el cálculo del CCI (por defecto, se establece en 20).
     -----------
@@ -30,13 +67,19 @@ def CCI(df: pd.DataFrame, longitud: int = 20, constante: float = 0.015) -> pd.Se
     -----------
     Salida:
     -----------
-    return : pd.Series : Cálculo del Índice de Canal de Materias Primas.
+    return : pd.Series|pd.DataFrame : Cálculo del Índice de Canal de Materias Primas (un pd.DataFrame con una columna por activo si
+                                      los datos tienen varios activos).
     """
     
     # Calcular el Precio Tí­pico
     precio_tipico = (df["High"] + df["Low"] + df["Close"]) / 3
     tp_rolling = precio_tipico.rolling(window=longitud, min_periods=longitud)
-    desviacion_media = tp_rolling.apply(lambda x: np.abs(x - x.mean()).mean(), raw=True)
+    # Calcular la Desviación Media (de todos los activos a la vez)
+    desviacion_media = Desviacion_Media_Movil(precio_tipico.to_numpy(), longitud)
+    if isinstance(precio_tipico, pd.DataFrame):
+        desviacion_media = pd.DataFrame(desviacion_media, index=precio_tipico.index, columns=precio_tipico.columns)
+    else:
+        desviacion_media = pd.Series(desviacion_media, index=precio_tipico.index)
     CCI_ = (precio_tipico - tp_rolling.mean()) / (constante * desviacion_media)
     CCI_.name = "CCI"
     
@@ -74,3 +117,5 @@ plt.show()
 #   - El CCI ayuda a identificar condiciones de sobrecompra y sobreventa, destacando niveles extremos en el gráfico. Las zonas en verde claro
 #     indican sobrecompra y las zonas en rojo salmon indican sobreventa.
 #   - Utiliza los niveles de 100 y -100 como referencias para las condiciones extremas.
+#   - El CCI se puede calcular para muchos activos en una sola llamada (por ejemplo, con los datos de yf.download de varios tickers):
+#     la desviación media se calcula para todas las columnas a la vez con Desviacion_Media_Movil.
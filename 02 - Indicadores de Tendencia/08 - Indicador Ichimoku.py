@@ -1,9 +1,58 @@
 # -*- coding: utf-8 -*-
 # Importar librerías
 import pandas as pd
+import numpy as np
 import yfinance as yf
 import matplotlib.pyplot as plt
 
+# Máximos y mínimos móviles de varias ventanas
+def Extremos_Moviles(serie: pd.Series, longitudes: list, tipo: str = "max") -> dict:
+    
+    """
+    Calcula los máximos (o mínimos) móviles de una serie para varias ventanas en una sola pasada. Primero se construye una tabla con
+    los extremos de las ventanas de 1, 2, 4, 8, ... barras (cada nivel combina dos ventanas del nivel anterior), y el extremo de una
+    ventana de cualquier longitud se obtiene combinando las dos ventanas de la tabla que la cubren. Todas las ventanas comparten la
+    tabla y todo se calcula con operaciones de NumPy (también funciona con un pd.DataFrame de varias series).
+    
+    -----------
+    Parámetros:
+    -----------
+    param : pd.Series : serie : Serie de precios (o pd.DataFrame con una columna por activo).
+    -----------
+    param : list : longitudes : Longitudes de las ventanas.
+    -----------
+    param : str : tipo : 'max' para máximos o 'min' para mínimos (por defecto, se establece en 'max').
+    -----------
+    Salida:
+    -----------
+    return : dict : Diccionario {longitud: pd.Series} con el mismo resultado que rolling(window=longitud, min_periods=longitud).
+    """
+    
+    funcion = np.maximum if tipo == "max" else np.minimum
+    arreglo = serie.to_numpy(dtype=np.float64)
+    n = arreglo.shape[0]
+    # Construir los niveles necesarios de la tabla (extremos de las ventanas de 2^k barras)
+    niveles = {int(longitud).bit_length() - 1 for longitud in longitudes if 0 < longitud <= n}
+    tabla, tablas = arreglo, {}
+    for k in range(max(niveles, default=-1) + 1):
+        if k > 0:
+            tabla = funcion(tabla[:-(1 << (k - 1))], tabla[1 << (k - 1):])
+        if k in niveles:
+            tablas[k] = tabla
+    # Combinar las dos ventanas de 2^k barras que cubren cada ventana
+    extremos = {}
+    for longitud in longitudes:
+        resultado = np.full(arreglo.shape, np.nan)
+        if 0 < longitud <= n:
+            k = int(longitud).bit_length() - 1
+            resultado[longitud - 1:] = funcion(tablas[k][:n - longitud + 1], tablas[k][longitud - (1 << k):n - (1 << k) + 1])
+        if isinstance(serie, pd.DataFrame):
+            extremos[longitud] = pd.DataFrame(resultado, index=serie.index, columns=serie.columns)
+        else:
+            extremos[longitud] = pd.Series(resultado, index=serie.index, name=serie.name)
+    
+    return extremos
+
 # Indicador: Nube de Ichimoku
 def Ichimoku_Cloud(df: pd.DataFrame, periodo_tenkan: int = 9, periodo_kijun: int = 26, offset: bool = False) -> pd.DataFrame:
     
@@ -40,23 +89,26 @@ def Ichimoku_Cloud(df: pd.DataFrame, periodo_tenkan: int = 9, periodo_kijun: int
     
     # Calcular
     High, Low = df["High"], df["Low"]
+    # Mínimos y máximos de las tres ventanas en una sola pasada
+    minimos = Extremos_Moviles(Low, [periodo_tenkan, periodo_kijun, periodo_kijun * 2], tipo="min")
+    maximos = Extremos_Moviles(High, [periodo_tenkan, periodo_kijun, periodo_kijun * 2], tipo="max")
     
     # Tenkan Sen: Línea de Señal a corto plazo
-    rolling_min_tenkan = Low.rolling(window=periodo_tenkan, min_periods=periodo_tenkan).min()
-    rolling_max_tenkan = High.rolling(window=periodo_tenkan, min_periods=periodo_tenkan).max()
+    rolling_min_tenkan = minimos[periodo_tenkan]
+    rolling_max_tenkan = maximos[periodo_tenkan]
     tenkan_sen = (rolling_max_tenkan + rolling_min_tenkan) / 2
     
     # Kijun Sen: Línea de señal a largo plazo
-    rolling_min_kijun = Low.rolling(window=periodo_kijun, min_periods=periodo_kijun).min()
-    rolling_max_kijun = High.rolling(window=periodo_kijun, min_periods=periodo_kijun).max()
+    rolling_min_kijun = minimos[periodo_kijun]
+    rolling_max_kijun = maximos[periodo_kijun]
     kijun_sen = (rolling_max_kijun + rolling_min_kijun) / 2
     
     # Senkou Span A - Nube
     senkou_span_a = ((tenkan_sen + kijun_sen) / 2)
     
     # Senkou Span B - Nube
-    rolling_min_senkou = Low.rolling(window=periodo_kijun * 2, min_periods=periodo_kijun * 2).min()
-    rolling_max_senkou = High.rolling(window=periodo_kijun * 2, min_periods=periodo_kijun * 2).max()
+    rolling_min_senkou = minimos[periodo_kijun * 2]
+    rolling_max_senkou = maximos[periodo_kijun * 2]
     senkou_span_b = ((rolling_min_senkou + rolling_max_senkou) / 2)
     
     # Chikou Span: Línea de confirmación
@@ -6,43 +6,25 @@ import yfinance as yf
 import mplfinance as mpf
 import matplotlib.pyplot as plt
 
-# Indicador: SAR Parabólico
-def Parabolic_SAR(df: pd.DataFrame, incremento: float = 0.02, max_paso: float = 0.20) -> pd.DataFrame:
+# Compilación opcional con numba (pip install numba); sin numba se usan las versiones de Python/NumPy
+try:
+    from numba import njit
+    numba_disponible = True
+except ImportError:
+    numba_disponible = False
+    def njit(*args, **kwargs):
+        return (lambda funcion: funcion) if len(args) == 0 else args[0]
+
+# Kernel: SAR Parabólico de un activo
+@njit(cache=True)
+def Kernel_Parabolic_SAR(High, Low, Close, incremento, max_paso, psar, psar_up, psar_down):
     
     """
-    El indicador Parabolic SAR (Stop and Reverse) se usa para determinar la dirección de la tendencia y posibles
-    reversales en el precio. El SAR Parabólico utiliza un método de stop y reversa para identificar puntos adecuados
-    de entrada y salida.
-    
-    Cómo Operarlo:
-        
-        El PSAR genera señales de compra o venta cuando la posición de los puntos se mueve de un lado del precio del activo
-        al otro. Por ejemplo, una señal de compra ocurre cuando los puntos se mueven de arriba del precio a abajo del precio,
-        mientras que una señal de venta ocurre cuando los puntos se mueven de abajo del precio a arriba del precio.
-        
-        Los puntos del PSAR se utilizan para establecer órdenes de stop loss en tendencia. Si el precio está subiendo y el PSAR
-        también está subiendo, el PSAR puede usarse como una posible salida si estás en una posición larga. Si el precio cae por
-        debajo del PSAR, sal de la operación larga.
-        
-    -----------
-    Parámetros:
-    -----------
-    param : pd.DataFrame : df : Datos del activo.
-    -----------
-    param : float : incremento : Incremento máximo a utilizar en el cálculo del Parabolic SAR (por defecto, se establece en 0.02).
-    -----------
-    param : float : max_paso : Paso máximo a utilizar en el cálculo del Parabolic SAR (por defecto, se establece en 0.20).
-    -----------
-    Salida:
-    -----------
-    return : pd.DataFrame : Cálculo del SAR Parabólico.
+    Recursión del SAR Parabólico sobre un activo (arreglos 1D o listas). Escribe los resultados en 'psar', 'psar_up' y
+    'psar_down' (que deben llegar inicializados: 'psar' con los precios de cierre y los otros dos con NaN) y nunca
+    modifica los precios de entrada.
     """
     
-    # Calcular
-    data = df.copy()
-    High, Low, Close = data["High"].values, data["Low"].values, data["Close"].values
-    psar_up, psar_down = np.repeat(np.nan, Close.shape[0]), np.repeat(np.nan, Close.shape[0])
-    
     # Inicializar variables
     up_trend = True
     up_trend_high = High[0]
@@ -50,7 +32,7 @@ def Parabolic_SAR(df: pd.DataFrame, incremento: float = 0.02, max_paso: float =
     acc_factor = incremento
     
     # Iterar sobre los precios para calcular el PSAR
-    for i in range(2, Close.shape[0]):
+    for i in range(2, len(Close)):
         reversal = False 
         max_high = High[i]
         min_low = Low[i]
@@ -58,58 +40,184 @@ def Parabolic_SAR(df: pd.DataFrame, incremento: float = 0.02, max_paso: float =
         # Tendencia Alcista
         if up_trend:
             # Calcular el PSAR para la tendencia alcista
-            Close[i] = Close[i - 1] + (acc_factor * (up_trend_high - Close[i - 1]))
-            if min_low < Close[i]: # Verificar si hay reversión a tendencia bajista
+            sar = psar[i - 1] + (acc_factor * (up_trend_high - psar[i - 1]))
+            if min_low < sar: # Verificar si hay reversión a tendencia bajista
                 reversal = True
-                Close[i] = up_trend_high 
+                sar = up_trend_high 
                 down_trend_low = min_low
                 acc_factor = incremento 
             else:
                 if max_high > up_trend_high: # Actualizar el máximo en tendencia alcista
                     up_trend_high = max_high
                     acc_factor = min(acc_factor + incremento, max_paso)
-                low1 = Low[i - 1]
-                low2 = Low[i - 2]
-                if low2 < Close[i]: # Asegurarnos que el PSAR no está por encima de los precios más bajos recientes
-                    Close[i] = low2
-                elif low1 < Close[i]:
-                    Close[i] = low1
+                if Low[i - 2] < sar: # Asegurarnos que el PSAR no está por encima de los precios más bajos recientes
+                    sar = Low[i - 2]
+                elif Low[i - 1] < sar:
+                    sar = Low[i - 1]
                     
         # Tendencia Bajista
         else:
             # Calcular el PSAR para la tendencia bajista
-            Close[i] = Close[i - 1] - (acc_factor * (Close[i - 1] - down_trend_low))
-            if max_high > Close[i]: # Verificar si hay reversión a tendencia alcista
+            sar = psar[i - 1] - (acc_factor * (psar[i - 1] - down_trend_low))
+            if max_high > sar: # Verificar si hay reversión a tendencia alcista
                 reversal = True
-                Close[i] = down_trend_low 
+                sar = down_trend_low 
                 up_trend_high = max_high
                 acc_factor = incremento 
             else:
                 if min_low < down_trend_low: # Actualizar el mínimo en tendencia bajista
                     down_trend_low = min_low
                     acc_factor = min(acc_factor + incremento, max_paso)
-                high1 = High[i - 1]
-                high2 = High[i - 2]
-                if high2 > Close[i]: # Asegurarnos que el PSAR no está por debajo de los precios más altos recientes
-                    Close[i] = high2
-                elif high1 > Close[i]:
-                    Close[i] = high1
+                if High[i - 2] > sar: # Asegurarnos que el PSAR no está por debajo de los precios más altos recientes
+                    sar = High[i - 2]
+                elif High[i - 1] > sar:
+                    sar = High[i - 1]
     
         # Determinar la tendencia actual
         up_trend = up_trend != reversal 
         
         # Asignar los valores de PSAR a las respectivas tendencias
+        psar[i] = sar
         if up_trend:
-            psar_up[i] = Close[i]
+            psar_up[i] = sar
         else:
-            psar_down[i] = Close[i]
-            
-    # Crear las columnas en el DataFrame para almacenar los resultados
-    data["PSAR"] = Close
-    data["UpTrend"] = psar_up
-    data["DownTrend"] = psar_down
-    
-    return data[["PSAR", "UpTrend", "DownTrend"]]
+            psar_down[i] = sar
+
+# Kernel: SAR Parabólico de varios activos (columnas) compilado con numba
+@njit(cache=True)
+def Kernel_Parabolic_SAR_2D(High, Low, Close, incremento, max_paso, psar, psar_up, psar_down):
+    for j in range(Close.shape[1]):
+        Kernel_Parabolic_SAR(High[:, j], Low[:, j], Close[:, j], incremento, max_paso, psar[:, j], psar_up[:, j],
+                             psar_down[:, j])
+
+# SAR Parabólico de varios activos (columnas) con NumPy: la recursión avanza vela por vela, pero cada paso se calcula
+# para todos los activos a la vez
+def Parabolic_SAR_Columnas(High: np.ndarray, Low: np.ndarray, incremento: float, max_paso: float, psar: np.ndarray,
+                           psar_up: np.ndarray, psar_down: np.ndarray) -> None:
+    
+    # Inicializar variables (una por activo)
+    up_trend = np.ones(psar.shape[1], dtype=bool)
+    up_trend_high = High[0].copy()
+    down_trend_low = Low[0].copy()
+    acc_factor = np.full(psar.shape[1], incremento)
+    
+    for i in range(2, psar.shape[0]):
+        max_high, min_low = High[i], Low[i]
+        # Tendencia Alcista
+        sar_up = psar[i - 1] + (acc_factor * (up_trend_high - psar[i - 1]))
+        reversal_up = min_low < sar_up
+        sar_up = np.where(Low[i - 2] < sar_up, Low[i - 2], np.where(Low[i - 1] < sar_up, Low[i - 1], sar_up))
+        sar_up = np.where(reversal_up, up_trend_high, sar_up)
+        # Tendencia Bajista
+        sar_down = psar[i - 1] - (acc_factor * (psar[i - 1] - down_trend_low))
+        reversal_down = max_high > sar_down
+        sar_down = np.where(High[i - 2] > sar_down, High[i - 2], np.where(High[i - 1] > sar_down, High[i - 1], sar_down))
+        sar_down = np.where(reversal_down, down_trend_low, sar_down)
+        # Actualizar extremos y factor de aceleración
+        reversal = np.where(up_trend, reversal_up, reversal_down)
+        nuevo_max = up_trend & ~reversal_up & (max_high > up_trend_high)
+        nuevo_min = ~up_trend & ~reversal_down & (min_low < down_trend_low)
+        down_trend_low = np.where(up_trend & reversal_up, min_low, np.where(nuevo_min, min_low, down_trend_low))
+        up_trend_high = np.where(~up_trend & reversal_down, max_high, np.where(nuevo_max, max_high, up_trend_high))
+        acc_factor = np.where(reversal, incremento,
+                              np.where(nuevo_max | nuevo_min, np.minimum(acc_factor + incremento, max_paso), acc_factor))
+        # Determinar la tendencia actual y asignar los valores
+        sar = np.where(up_trend, sar_up, sar_down)
+        up_trend = up_trend != reversal
+        psar[i] = sar
+        psar_up[i] = np.where(up_trend, sar, np.nan)
+        psar_down[i] = np.where(up_trend, np.nan, sar)
+
+# SAR Parabólico sobre arreglos
+def Parabolic_SAR_Arreglos(High: np.ndarray, Low: np.ndarray, Close: np.ndarray, incremento: float = 0.02,
+                           max_paso: float = 0.20) -> tuple:
+    
+    """
+    Calcula el SAR Parabólico sobre arreglos de NumPy sin modificarlos. Acepta arreglos 1D (un activo) o 2D (velas x
+    activos), por lo que se puede calcular todo un universo de activos en una sola llamada. Si numba está instalado, la
+    recursión se compila; si no, se usa un ciclo de Python sobre listas (1D) o un ciclo vectorizado por activos (2D).
+    
+    -----------
+    Parámetros:
+    -----------
+    param : np.ndarray : High : Precios máximos.
+    -----------
+    param : np.ndarray : Low : Precios mínimos.
+    -----------
+    param : np.ndarray : Close : Precios de cierre.
+    -----------
+    param : float : incremento : Incremento del factor de aceleración (por defecto, se establece en 0.02).
+    -----------
+    param : float : max_paso : Factor de aceleración máximo (por defecto, se establece en 0.20).
+    -----------
+    Salida:
+    -----------
+    return : tuple : Arreglos (PSAR, UpTrend, DownTrend) con la misma forma que 'Close'.
+    """
+    
+    High = np.asarray(High, dtype=np.float64)
+    Low = np.asarray(Low, dtype=np.float64)
+    psar = np.array(Close, dtype=np.float64)
+    psar_up, psar_down = np.full(psar.shape, np.nan), np.full(psar.shape, np.nan)
+    if psar.ndim not in [1, 2]:
+        raise ValueError("Los precios deben ser arreglos 1D (un activo) o 2D (velas x activos).")
+    
+    if numba_disponible:
+        kernel = Kernel_Parabolic_SAR if psar.ndim == 1 else Kernel_Parabolic_SAR_2D
+        kernel(High, Low, psar, incremento, max_paso, psar, psar_up, psar_down)
+    elif psar.ndim == 1:
+        valores, up, down = psar.tolist(), psar_up.tolist(), psar_down.tolist()
+        Kernel_Parabolic_SAR(High.tolist(), Low.tolist(), valores, incremento, max_paso, valores, up, down)
+        psar, psar_up, psar_down = np.array(valores), np.array(up), np.array(down)
+    else:
+        Parabolic_SAR_Columnas(High, Low, incremento, max_paso, psar, psar_up, psar_down)
+    
+    return psar, psar_up, psar_down
+
+# Indicador: SAR Parabólico
+def Parabolic_SAR(df: pd.DataFrame, incremento: float = 0.02, max_paso: float = 0.20) -> pd.DataFrame:
+    
+    """
+    El indicador Parabolic SAR (Stop and Reverse) se usa para determinar la dirección de la tendencia y posibles
+    reversales en el precio. El SAR Parabólico utiliza un método de stop y reversa para identificar puntos adecuados
+    de entrada y salida.
+    
+    Cómo Operarlo:
+        
+        El PSAR genera señales de compra o venta cuando la posición de los puntos se mueve de un lado del precio del activo
+        al otro. Por ejemplo, una señal de compra ocurre cuando los puntos se mueven de arriba del precio a abajo del precio,
+        mientras que una señal de venta ocurre cuando los puntos se mueven de abajo del precio a arriba del precio.
+        
+        Los puntos del PSAR se utilizan para establecer órdenes de stop loss en tendencia. Si el precio está subiendo y el PSAR
+        también está subiendo, el PSAR puede usarse como una posible salida si estás en una posición larga. Si el precio cae por
+        debajo del PSAR, sal de la operación larga.
+        
+    -----------
+    Parámetros:
+    -----------
+    param : pd.DataFrame : df : Datos del activo (o de varios activos, con columnas de dos niveles como las de
+                                yf.download).
+    -----------
+    param : float : incremento : Incremento máximo a utilizar en el cálculo del Parabolic SAR (por defecto, se establece en 0.02).
+    -----------
+    param : float : max_paso : Paso máximo a utilizar en el cálculo del Parabolic SAR (por defecto, se establece en 0.20).
+    -----------
+    Salida:
+    -----------
+    return : pd.DataFrame : Cálculo del SAR Parabólico (con columnas (PSAR|UpTrend|DownTrend, activo) si hay varios activos).
+    """
+    
+    # Calcular (sin modificar los datos originales)
+    High, Low, Close = df["High"], df["Low"], df["Close"]
+    psar, psar_up, psar_down = Parabolic_SAR_Arreglos(High.to_numpy(), Low.to_numpy(), Close.to_numpy(), incremento, max_paso)
+    
+    # Varios activos
+    if isinstance(Close, pd.DataFrame):
+        return pd.concat({"PSAR": pd.DataFrame(psar, index=df.index, columns=Close.columns),
+                          "UpTrend": pd.DataFrame(psar_up, index=df.index, columns=Close.columns),
+                          "DownTrend": pd.DataFrame(psar_down, index=df.index, columns=Close.columns)}, axis=1)
+    
+    return pd.DataFrame({"PSAR": psar, "UpTrend": psar_up, "DownTrend": psar_down}, index=df.index)
     
 # Obtener Datos
 df = yf.download("NKLA", start="2023-01-01", end="2024-01-01", interval="1d")
@@ -4,7 +4,6 @@ import pandas as pd
 import yfinance as yf
 import mplfinance as mpf
 import matplotlib.pyplot as plt
-from copy import deepcopy
 
 # Indicador: Bandas de Bollinger
 def Bandas_Bollinger(df: pd.DataFrame, longitud: int = 20, std_dev: float = 2.0, ddof: int = 0, columna: str = "Close") -> pd.DataFrame:
@@ -39,8 +38,8 @@ def Bandas_Bollinger(df: pd.DataFrame, longitud: int = 20, std_dev: float = 2.0,
     return : pd.DataFrame : Cálculo de las Bandas de Bollinger.
     """
     
-    data = deepcopy(df)
-    rolling = data[columna].rolling(window=longitud, min_periods=longitud)
+    data = pd.DataFrame(index=df.index)
+    rolling = df[columna].rolling(window=longitud, min_periods=longitud)
     data["MA"] = rolling.mean()
     calc_intermedio = std_dev * rolling.std(ddof=ddof)
     data["BB_Up"] = data["MA"] + calc_intermedio
@@ -6,6 +6,73 @@ import yfinance as yf
 import mplfinance as mpf
 import matplotlib.pyplot as plt
 
+# Media de Potencias Móvil
+def Media_Potencia_Movil(valores: np.ndarray, longitud: int, potencia: float = 2, reanclaje: int = 64) -> np.ndarray:
+    
+    """
+    Media de potencias móvil: (mean(|x| ** potencia)) ** (1 / potencia) de cada ventana de 'longitud' valores. Con potencia = 2 es la
+    raíz del promedio de los cuadrados (RMS). Las sumas de cada ventana se obtienen como diferencias de sumas acumuladas (O(n) sin
+    importar la longitud), que se reinician cada 'reanclaje' ventanas para que el error de redondeo no crezca en series largas. Todos
+    los tramos se calculan a la vez como filas de un arreglo, y una ventana con algún valor faltante da NaN (igual que rolling(...).apply
+    con min_periods=longitud).
+    
+    -----------
+    Parámetros:
+    -----------
+    param : np.ndarray : valores : Serie (1D) o panel de series (2D, una columna por activo).
+    -----------
+    param : int : longitud : Ventana de la media.
+    -----------
+    param : float : potencia : Potencia de la media (por defecto, se establece en 2).
+    -----------
+    param : int : reanclaje : Número de ventanas entre reinicios de las sumas acumuladas (por defecto, se establece en 64).
+    -----------
+    Salida:
+    -----------
+    return : np.ndarray : Media de potencias de cada ventana (NaN en las primeras longitud - 1 filas), con la forma de 'valores'.
+    """
+    
+    valores = np.asarray(valores, dtype=np.float64)
+    resultado = np.full(valores.shape, np.nan)
+    n_salidas = valores.shape[0] - longitud + 1
+    if n_salidas <= 0:
+        return resultado
+    # Potencias (los valores faltantes se cuentan aparte)
+    faltantes = np.isnan(valores)
+    potencias = np.where(faltantes, 0.0, np.abs(valores) ** potencia)
+    conteo_faltantes = np.concatenate([np.zeros((1,) + valores.shape[1:]), np.cumsum(faltantes, axis=0)])
+    # Tramos de 'reanclaje' ventanas: cada uno incluye las longitud - 1 filas previas para completar su primera ventana
+    n_tramos = -(-n_salidas // reanclaje)
+    relleno = np.concatenate([potencias, np.zeros((n_tramos * reanclaje - n_salidas,) + valores.shape[1:])])
+    tramos = np.lib.stride_tricks.sliding_window_view(relleno, reanclaje + longitud - 1, axis=0)[::reanclaje]
+    S = np.cumsum(tramos, axis=-1)
+    S = np.concatenate([np.zeros(S.shape[:-1] + (1,)), S], axis=-1)
+    sumas = np.moveaxis(S[..., longitud:] - S[..., :-longitud], -1, 1).reshape((-1,) + valores.shape[1:])[:n_salidas]
+    resultado[longitud - 1:] = (np.maximum(sumas, 0.0) / longitud) ** (1 / potencia)
+    resultado[longitud - 1:][conteo_faltantes[longitud:] - conteo_faltantes[:n_salidas] > 0] = np.nan
+    
+    return resultado
+
+# Raíz Cuadrática Media Móvil
+def RMS_Movil(valores: np.ndarray, longitud: int) -> np.ndarray:
+    
+    """
+    Raíz cuadrática media móvil (RMS): sqrt(mean(x ** 2)) de cada ventana (ver Media_Potencia_Movil).
+    
+    -----------
+    Parámetros:
+    -----------
+    param : np.ndarray : valores : Serie (1D) o panel de series (2D, una columna por activo).
+    -----------
+    param : int : longitud : Ventana del RMS.
+    -----------
+    Salida:
+    -----------
+    return : np.ndarray : RMS de cada ventana, con la forma de 'valores'.
+    """
+    
+    return Media_Potencia_Movil(valores, longitud, potencia=2)
+
 # Indicador: Índice de Ulcer
 def Ulcer_Index(df: pd.DataFrame, longitud: int = 14, columna: str = "Close") -> pd.Series:
     
@@ -27,7 +94,7 @@ def Ulcer_Index(df: pd.DataFrame, longitud: int = 14, columna: str = "Close") ->
     -----------
     Parámetros:
     -----------
-    param : pd.DataFrame : df : Datos históricos.
+    param : pd.DataFrame : df : Datos históricos (o de varios activos, con columnas (columna, activo) como las de yf.download).
     -----------
     param : int : longitud : Ventana para el cálculo del UI (por defecto, se establece en 14).
     -----------
@@ -35,16 +102,20 @@ def Ulcer_Index(df: pd.DataFrame, longitud: int = 14, columna: str = "Close") ->
     -----------
     Salida:
     -----------
-    return : pd.Series : Cálculo del Índice de Ulcer.
+    return : pd.Series|pd.DataFrame : Cálculo del Índice de Ulcer (un pd.DataFrame con una columna por activo si los datos tienen
+                                      varios activos).
     """
     
     # Calcular
     precio_col = df[columna]
     rolling_max = precio_col.rolling(window=longitud, min_periods=longitud).max()
     Perc_Drawdown = ((precio_col - rolling_max) / rolling_max) * 100
-    sqrt_func = lambda x: np.sqrt((x ** 2).mean())
-    UI = Perc_Drawdown.rolling(window=longitud, min_periods=longitud).apply(sqrt_func, raw=True)
-    UI.name = "UI"
+    # Raíz cuadrática media de los drawdowns (de todos los activos a la vez)
+    UI = RMS_Movil(Perc_Drawdown.to_numpy(), longitud)
+    if isinstance(Perc_Drawdown, pd.DataFrame):
+        UI = pd.DataFrame(UI, index=Perc_Drawdown.index, columns=Perc_Drawdown.columns)
+    else:
+        UI = pd.Series(UI, index=Perc_Drawdown.index, name="UI")
     
     return UI
 
@@ -77,6 +148,8 @@ plt.show()
 #   - El Índice de Ulcer mide el riesgo a la baja en términos de la profundidad y duración de las caídas en los precios.
 #   - Un valor más alto del UI indica mayor volatilidad a la baja y mayor riesgo de drawdown.
 #   - Un valor más bajo del UI sugiere una menor volatilidad a la baja y menor riesgo.
+#   - RMS_Movil también acepta un panel de drawdowns (una columna por activo), por lo que el UI de todos los activos de un portafolio
+#     se calcula en una sola llamada.
 
     
     
@@ -6,6 +6,129 @@ import yfinance as yf
 import mplfinance as mpf
 import matplotlib.pyplot as plt
 
+# Compilación opcional con numba (pip install numba); sin numba se usan las versiones de Python/NumPy
+try:
+    from numba import njit
+    numba_disponible = True
+except ImportError:
+    numba_disponible = False
+    def njit(*args, **kwargs):
+        return (lambda funcion: funcion) if len(args) == 0 else args[0]
+
+# Kernel: Ajuste de bandas de SuperTendencia de un activo
+@njit(cache=True)
+def Kernel_SuperTendencia(close, FinalUpperB, FinalLowerB, ST):
+    
+    """
+    Recursión de SuperTendencia sobre arreglos 1D (o listas): cambia la tendencia cuando el cierre cruza la banda de la
+    vela anterior, ajusta (trinquete) la banda activa y elimina la banda inactiva. Modifica 'FinalUpperB', 'FinalLowerB'
+    y 'ST' (que deben ser copias propias), nunca los datos originales.
+    """
+    
+    for i in range(1, len(close)):
+        # Calcular SuperTendencia para cada punto
+        if close[i] > FinalUpperB[i - 1]:
+            ST[i] = 1.0
+        elif close[i] < FinalLowerB[i - 1]:
+            ST[i] = 0.0
+        else:
+            ST[i] = ST[i - 1]
+            # Ajustar las bandas finales para reflejar la dirección de la tendencia
+            if ST[i] == 1.0 and FinalLowerB[i] < FinalLowerB[i - 1]:
+                FinalLowerB[i] = FinalLowerB[i - 1]
+            elif ST[i] == 0.0 and FinalUpperB[i] > FinalUpperB[i - 1]:
+                FinalUpperB[i] = FinalUpperB[i - 1]
+                
+        # Eliminar bandas según la dirección de la tendencia
+        if ST[i] == 1.0:
+            FinalUpperB[i] = np.nan
+        else:
+            FinalLowerB[i] = np.nan
+
+# Kernel: Ajuste de bandas de varias columnas (parámetros o activos) compilado con numba
+@njit(cache=True)
+def Kernel_SuperTendencia_2D(close, FinalUpperB, FinalLowerB, ST):
+    for j in range(ST.shape[1]):
+        Kernel_SuperTendencia(close[:, j], FinalUpperB[:, j], FinalLowerB[:, j], ST[:, j])
+
+# Ajuste de bandas de varias columnas con NumPy: la recursión avanza vela por vela, pero cada paso se calcula para todas
+# las columnas a la vez
+def SuperTendencia_Columnas(close: np.ndarray, FinalUpperB: np.ndarray, FinalLowerB: np.ndarray, ST: np.ndarray) -> None:
+    for i in range(1, ST.shape[0]):
+        alcista = close[i] > FinalUpperB[i - 1]
+        bajista = ~alcista & (close[i] < FinalLowerB[i - 1])
+        sin_cambio = ~alcista & ~bajista
+        ST[i] = np.where(alcista, 1.0, np.where(bajista, 0.0, ST[i - 1]))
+        # Ajustar las bandas finales para reflejar la dirección de la tendencia
+        ajuste_inferior = sin_cambio & (ST[i] == 1.0) & (FinalLowerB[i] < FinalLowerB[i - 1])
+        ajuste_superior = sin_cambio & (ST[i] == 0.0) & (FinalUpperB[i] > FinalUpperB[i - 1])
+        FinalLowerB[i] = np.where(ajuste_inferior, FinalLowerB[i - 1], FinalLowerB[i])
+        FinalUpperB[i] = np.where(ajuste_superior, FinalUpperB[i - 1], FinalUpperB[i])
+        # Eliminar bandas según la dirección de la tendencia
+        FinalUpperB[i] = np.where(ST[i] == 1.0, np.nan, FinalUpperB[i])
+        FinalLowerB[i] = np.where(ST[i] == 1.0, FinalLowerB[i], np.nan)
+
+# Ajuste de bandas de SuperTendencia sobre arreglos
+def SuperTendencia_Arreglos(close: np.ndarray, FinalUpperB: np.ndarray, FinalLowerB: np.ndarray) -> tuple:
+    
+    """
+    Aplica la recursión de SuperTendencia sobre arreglos de NumPy sin modificarlos. Las bandas pueden ser 1D (una
+    combinación de parámetros) o 2D (velas x combinaciones/activos); 'close' puede ser 1D aunque las bandas sean 2D. Si
+    numba está instalado la recursión se compila; si no, se usa un ciclo de Python sobre listas (1D) o un ciclo
+    vectorizado por columnas (2D).
+    
+    -----------
+    Parámetros:
+    -----------
+    param : np.ndarray : close : Precios de cierre.
+    -----------
+    param : np.ndarray : FinalUpperB : Banda superior (medio + factor * ATR).
+    -----------
+    param : np.ndarray : FinalLowerB : Banda inferior (medio - factor * ATR).
+    -----------
+    Salida:
+    -----------
+    return : tuple : Arreglos (FinalUpperB, FinalLowerB, ST) con las bandas ajustadas y la tendencia (1 alcista, 0 bajista).
+    """
+    
+    FinalUpperB = np.array(FinalUpperB, dtype=np.float64)
+    FinalLowerB = np.array(FinalLowerB, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    if FinalUpperB.ndim == 2 and close.ndim == 1:
+        close = np.broadcast_to(close[:, None], FinalUpperB.shape)
+    ST = np.zeros(FinalUpperB.shape)
+    
+    if numba_disponible:
+        kernel = Kernel_SuperTendencia if ST.ndim == 1 else Kernel_SuperTendencia_2D
+        kernel(close, FinalUpperB, FinalLowerB, ST)
+    elif ST.ndim == 1:
+        superior, inferior, tendencia = FinalUpperB.tolist(), FinalLowerB.tolist(), ST.tolist()
+        Kernel_SuperTendencia(close.tolist(), superior, inferior, tendencia)
+        FinalUpperB, FinalLowerB, ST = np.array(superior), np.array(inferior), np.array(tendencia)
+    else:
+        SuperTendencia_Columnas(close, FinalUpperB, FinalLowerB, ST)
+    
+    return FinalUpperB, FinalLowerB, ST
+
+# Formatear el resultado de SuperTendencia
+def Formatear_SuperTendencia(FinalUpperB: np.ndarray, FinalLowerB: np.ndarray, ST: np.ndarray, index: pd.Index,
+                             longitud: int) -> pd.DataFrame:
+    
+    # Ajustar el valor inicial para evitar valores no deseados en la primera posición
+    FinalUpperB, FinalLowerB = FinalUpperB.copy(), FinalLowerB.copy()
+    if ST[1] == 0:
+        FinalLowerB[0] = np.nan
+    else:
+        FinalUpperB[0] = np.nan
+        
+    # Eliminar valores no deseados y ajustar los arrays de las bandas
+    FU = FinalUpperB[longitud - 1:]
+    FL = FinalLowerB[longitud - 1:]
+    ST_array = np.nansum([FU, FL], axis=0)
+    ST_array[0] = np.nan
+    
+    return pd.DataFrame({"FinalUpperB": FU, "FinalLowerB": FL, "SuperTendencia": ST_array}, index=index[longitud - 1:])
+
 # Indicador: SuperTendencia
 def SuperTendencia(df: pd.DataFrame, longitud: int = 14, factor: float = 3.0) -> pd.DataFrame:
     
@@ -55,47 +178,58 @@ def SuperTendencia(df: pd.DataFrame, longitud: int = 14, factor: float = 3.0) ->
     FinalUpperB = medio + factor * ATR # Banda Superior para indicar una tendencia alcista
     FinalLowerB = medio - factor * ATR # Banda Inferior para indicar una tendencia bajista
     
-    # Inicializar SuperTendencia
-    ST = np.zeros(ATR.shape[0])
-    close = df["Close"].values
+    # Ajustar las bandas y calcular la tendencia
+    FinalUpperB, FinalLowerB, ST = SuperTendencia_Arreglos(df["Close"].to_numpy(), FinalUpperB.to_numpy(), 
+                                                           FinalLowerB.to_numpy())
     
-    # Iterar
-    for i in range(1, ATR.shape[0]):
-        # Calcular SuperTendencia para cada punto
-        if close[i] > FinalUpperB[i - 1]:
-            ST[i] = True
-        elif close[i] < FinalLowerB[i - 1]:
-            ST[i] = False
-        else:
-            ST[i] = ST[i - 1]
-            # Ajustar las bandas finales para reflejar la dirección de la tendencia
-            if ST[i] == True and FinalLowerB[i] < FinalLowerB[i - 1]:
-                FinalLowerB[i] = FinalLowerB[i - 1]
-            elif ST[i] == False and FinalUpperB[i] > FinalUpperB[i - 1]:
-                FinalUpperB[i] = FinalUpperB[i - 1]
-                
-        # Eliminar bandas según la dirección de la tendencia
-        if ST[i] == True:
-            FinalUpperB[i] = np.nan
-        else:
-            FinalLowerB[i] = np.nan
-            
-    # Ajustar el valor inicial para evitar valores no deseados en la primera posición
-    if ST[1] == 0:
-        FinalLowerB[0] = np.nan
-    else:
-        FinalUpperB[0] = np.nan
-        
-    # Eliminar valores no deseados y ajustar los arrays de las bandas
-    FU = FinalUpperB[longitud -1:]
-    FL = FinalLowerB[longitud - 1:]
-    ST_df = pd.concat([FU, FL], axis=1)
-    ST_array = np.nansum([FU, FL], axis=0)
-    ST_array[0] = np.nan
-    ST_df["SuperTendencia"] = ST_array
-    ST_df.columns = ["FinalUpperB", "FinalLowerB", "SuperTendencia"]
+    return Formatear_SuperTendencia(FinalUpperB, FinalLowerB, ST, df.index, longitud)
+
+# Barrido de parámetros de SuperTendencia
+def SuperTendencia_Barrido(df: pd.DataFrame, longitudes: list, factores: list) -> dict:
+    
+    """
+    Calcula SuperTendencia para todas las combinaciones de longitud y factor en una sola llamada (útil para optimizar
+    parámetros). El Rango Verdadero se calcula una sola vez, el ATR una vez por longitud y la recursión de todas las
+    combinaciones se ejecuta a la vez sobre un arreglo 2D.
+    
+    -----------
+    Parámetros:
+    -----------
+    param : pd.DataFrame : df : Datos del activo.
+    -----------
+    param : list : longitudes : Ventanas a evaluar.
+    -----------
+    param : list : factores : Multiplicadores de ATR a evaluar.
+    -----------
+    Salida:
+    -----------
+    return : dict : Diccionario {(longitud, factor): pd.DataFrame} con el mismo resultado que SuperTendencia.
+    """
+    
+    # Calcular TR una sola vez
+    High, Low = df["High"], df["Low"]
+    H_minus_L = High - Low
+    prev_cl = df["Close"].shift(periods=1)
+    H_minus_PC = abs(High - prev_cl)
+    L_minus_PC = abs(prev_cl - Low)
+    TR = pd.Series(np.max([H_minus_L, H_minus_PC, L_minus_PC], axis=0), index=df.index, name="TR")
+    medio = ((df["High"] + df["Low"]) / 2).to_numpy()
+    
+    # Calcular las bandas de todas las combinaciones
+    combinaciones, superiores, inferiores = [], [], []
+    for longitud in longitudes:
+        ATR = TR.ewm(alpha=1/longitud, min_periods=longitud, adjust=False).mean().to_numpy()
+        for factor in factores:
+            combinaciones.append((longitud, factor))
+            superiores.append(medio + factor * ATR)
+            inferiores.append(medio - factor * ATR)
+    
+    # Ajustar las bandas de todas las combinaciones a la vez
+    FinalUpperB, FinalLowerB, ST = SuperTendencia_Arreglos(df["Close"].to_numpy(), np.column_stack(superiores),
+                                                           np.column_stack(inferiores))
     
-    return ST_df
+    return {(longitud, factor): Formatear_SuperTendencia(FinalUpperB[:, j], FinalLowerB[:, j], ST[:, j], df.index, longitud)
+            for j, (longitud, factor) in enumerate(combinaciones)}
 
 # Obtener Datos
 ticker = "AMZN"
@@ -6,9 +6,56 @@ import yfinance as yf
 import mplfinance as mpf
 import matplotlib.pyplot as plt
 
+# Suavizado con Núcleo Gaussiano Truncado
+def Suavizado_Gaussiano(valores: np.ndarray, ancho_banda: float, truncamiento: float = 7.0, metodo: str = "auto") -> np.ndarray:
+    
+    """
+    Calcula el Estimador de Nadaraya-Watson con núcleo gaussiano, sum(w[i - j] * x[j]) / sum(w[i - j]), sin construir la matriz
+    de pesos de longitud x longitud. Los pesos se truncan a 'truncamiento' anchos de banda a cada lado (más allá de 7 anchos de banda
+    los pesos omitidos suman menos de 1e-11 del total), por lo que el numerador y el denominador son convoluciones de los precios y
+    de un vector de unos con un núcleo de 2k + 1 pesos. Las convoluciones se calculan de forma directa (O(n·k)) o con la FFT cuando
+    el núcleo es largo (O(n log n)); en ambos casos la memoria es O(n).
+    
+    -----------
+    Parámetros:
+    -----------
+    param : np.ndarray : valores : Precios.
+    -----------
+    param : float : ancho_banda : Ancho de banda del núcleo gaussiano.
+    -----------
+    param : float : truncamiento : Número de anchos de banda a cada lado en los que se trunca el núcleo (por defecto, se establece en 7.0).
+    -----------
+    param : str : metodo : 'directo', 'fft' o 'auto' (por defecto, se establece en 'auto': FFT si el núcleo tiene más de 256 pesos).
+    -----------
+    Salida:
+    -----------
+    return : np.ndarray : Estimación en cada posición.
+    """
+    
+    valores = np.asarray(valores, dtype=np.float64)
+    n = valores.shape[0]
+    if n == 0:
+        return valores.copy()
+    # Núcleo truncado
+    k = int(min(np.ceil(truncamiento * ancho_banda), n - 1))
+    nucleo = np.exp(-np.arange(-k, k + 1) ** 2 / ((ancho_banda ** 2) * 2))
+    if metodo == "auto":
+        metodo = "fft" if nucleo.shape[0] > 256 else "directo"
+    # Convoluciones del numerador y del denominador (recortadas a las n posiciones de los precios)
+    if metodo == "fft":
+        tamaño = 1 << int(n + 2 * k - 1).bit_length()
+        fft_nucleo = np.fft.rfft(nucleo, tamaño)
+        suma_x = np.fft.irfft(np.fft.rfft(valores, tamaño) * fft_nucleo, tamaño)[k:k + n]
+        suma_pesos = np.fft.irfft(np.fft.rfft(np.ones(n), tamaño) * fft_nucleo, tamaño)[k:k + n]
+    else:
+        suma_x = np.convolve(valores, nucleo)[k:k + n]
+        suma_pesos = np.convolve(np.ones(n), nucleo)[k:k + n]
+    
+    return suma_x / suma_pesos
+
 # Indicador: Nadaraya Watson Envelope
 def Nadaraya_Watson_Envelope(df: pd.DataFrame, longitud: int = 500, ancho_banda: float = 8.0, factor: float = 3.0,
-                             columna: str = "Close") -> pd.DataFrame:
+                             columna: str = "Close", truncamiento: float = 7.0) -> pd.DataFrame:
     
     """
     El Envolvente Nadaraya-Watson es un indicador técnico que destaca los extremos de los precios dentro de una ventana de tiempo 
@@ -45,6 +92,9 @@ def Nadaraya_Watson_Envelope(df: pd.DataFrame, longitud: int = 500, ancho_banda:
     -----------
     param : str : columna : Columna a utilizar en el cálculo del Envolvente NW (por defecto, se establece en 'Close').
     -----------
+    param : float : truncamiento : Número de anchos de banda a cada lado en los que se trunca el núcleo gaussiano
+                                   (por defecto, se establece en 7.0).
+    -----------
     Salida:
     -----------
     return : pd.DataFrame : Cálculo del Envolvente de Nadaraya Watson.
@@ -53,16 +103,11 @@ def Nadaraya_Watson_Envelope(df: pd.DataFrame, longitud: int = 500, ancho_banda:
     # Calcular Bandas de NW
     assert df.shape[0] >= longitud, "La longitud del DataFrame debe de ser mayor o igual a la longitud especificada"
     
-    # Seleccionar la columna de precios y preparar matrices
+    # Seleccionar la columna de precios
     precios_columna = df[-longitud:][columna]
-    filas = np.arange(0, longitud)
-    
-    # Crear la matriz de pesos utilizando la función de suavizado por núcleo
-    matriz_pesos = np.array(np.exp(-np.power((np.matrix(filas).T - np.matrix(filas)), 2) / ((ancho_banda ** 2) * 2)))
     
-    # Calcular el estimador aplicando los pesos
-    suma_x = (matriz_pesos * np.tile(precios_columna.values, (longitud, 1))).sum(axis=1)
-    estimador_y2 = suma_x / matriz_pesos.sum(axis=1)
+    # Calcular el estimador con el núcleo gaussiano truncado (sin matriz de pesos)
+    estimador_y2 = Suavizado_Gaussiano(precios_columna.to_numpy(), ancho_banda, truncamiento=truncamiento)
     
     # Almacenar los resultados
     envelope_df = pd.DataFrame(data=estimador_y2, index=precios_columna.index, columns=["Estimador"])
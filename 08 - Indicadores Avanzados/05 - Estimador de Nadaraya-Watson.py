@@ -6,9 +6,56 @@ import yfinance as yf
 import mplfinance as mpf
 import matplotlib.pyplot as plt
 
+# Suavizado con Núcleo Gaussiano Truncado
+def Suavizado_Gaussiano(valores: np.ndarray, ancho_banda: float, truncamiento: float = 7.0, metodo: str = "auto") -> np.ndarray:
+    
+    """
+    Calcula el Estimador de Nadaraya-Watson con núcleo gaussiano, sum(w[i - j] * x[j]) / sum(w[i - j]), sin construir la matriz
+    de pesos de longitud x longitud. Los pesos se truncan a 'truncamiento' anchos de banda a cada lado (más allá de 7 anchos de banda
+    los pesos omitidos suman menos de 1e-11 del total), por lo que el numerador y el denominador son convoluciones de los precios y
+    de un vector de unos con un núcleo de 2k + 1 pesos. Las convoluciones se calculan de forma directa (O(n·k)) o con la FFT cuando
+    el núcleo es largo (O(n log n)); en ambos casos la memoria es O(n).
+    
+    -----------
+    Parámetros:
+    -----------
+    param : np.ndarray : valores : Precios.
+    -----------
+    param : float : ancho_banda : Ancho de banda del núcleo gaussiano.
+    -----------
+    param : float : truncamiento : Número de anchos de banda a cada lado en los que se trunca el núcleo (por defecto, se establece en 7.0).
+    -----------
+    param : str : metodo : 'directo', 'fft' o 'auto' (por defecto, se establece en 'auto': FFT si el núcleo tiene más de 256 pesos).
+    -----------
+    Salida:
+    -----------
+    return : np.ndarray : Estimación en cada posición.
+    """
+    
+    valores = np.asarray(valores, dtype=np.float64)
+    n = valores.shape[0]
+    if n == 0:
+        return valores.copy()
+    # Núcleo truncado
+    k = int(min(np.ceil(truncamiento * ancho_banda), n - 1))
+    nucleo = np.exp(-np.arange(-k, k + 1) ** 2 / ((ancho_banda ** 2) * 2))
+    if metodo == "auto":
+        metodo = "fft" if nucleo.shape[0] > 256 else "directo"
+    # Convoluciones del numerador y del denominador (recortadas a las n posiciones de los precios)
+    if metodo == "fft":
+        tamaño = 1 << int(n + 2 * k - 1).bit_length()
+        fft_nucleo = np.fft.rfft(nucleo, tamaño)
+        suma_x = np.fft.irfft(np.fft.rfft(valores, tamaño) * fft_nucleo, tamaño)[k:k + n]
+        suma_pesos = np.fft.irfft(np.fft.rfft(np.ones(n), tamaño) * fft_nucleo, tamaño)[k:k + n]
+    else:
+        suma_x = np.convolve(valores, nucleo)[k:k + n]
+        suma_pesos = np.convolve(np.ones(n), nucleo)[k:k + n]
+    
+    return suma_x / suma_pesos
+
 # Indicador: Estimador Nadaraya-Watson
 def Estimador_Nadaraya_Watson(df: pd.DataFrame, longitud: int = 500, ancho_banda: float = 8.0, factor: float = 3.0,
-                              columna: str = "Close") -> pd.DataFrame:
+                              columna: str = "Close", truncamiento: float = 7.0) -> pd.DataFrame:
     
     """
     El Estimador Nadaraya-Watson es una técnica no paramétrica utilizada en la estimación de regresión, que sirve para suavizar
@@ -39,6 +86,9 @@ def Estimador_Nadaraya_Watson(df: pd.DataFrame, longitud: int = 500, ancho_banda
     -----------
     param : str : columna : Columna del DataFrame que se utilizará para el cálculo del ENW (por defecto, se establece en 'Close').
     -----------
+    param : float : truncamiento : Número de anchos de banda a cada lado en los que se trunca el núcleo gaussiano
+                                   (por defecto, se establece en 7.0).
+    -----------
     Salida:
     -----------
     return : pd.DataFrame : DataFrame con el cálculo del Estimador de Nadaraya Watson.
@@ -47,12 +97,8 @@ def Estimador_Nadaraya_Watson(df: pd.DataFrame, longitud: int = 500, ancho_banda
     # Calcular Indicador
     assert df.shape[0] >= longitud, "La longitud de los datos debe de ser >= longitud"
     precios = df[-longitud:][columna]
-    filas = np.arange(0, longitud)
-    # Calcular la matriz de pesos utilizando el Kernel Gaussiano
-    matriz_pesos = np.array(np.exp(-np.power((np.matrix(filas).T - np.matrix(filas)), 2) / ((ancho_banda ** 2) * 2)))
-    # Calcular el Estimador de NW
-    suma_x = (matriz_pesos * np.tile(precios.values, (longitud, 1))).sum(axis=1)
-    estimacion = suma_x / matriz_pesos.sum(axis=1)
+    # Calcular el Estimador de NW con el Kernel Gaussiano truncado (sin matriz de pesos)
+    estimacion = Suavizado_Gaussiano(precios.to_numpy(), ancho_banda, truncamiento=truncamiento)
     # Almacenar los resultados del estimador
     nwe = pd.DataFrame(data=estimacion, index=precios.index, columns=["Estimador"])
     
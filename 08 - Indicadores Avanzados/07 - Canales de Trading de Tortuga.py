@@ -6,6 +6,78 @@ import yfinance as yf
 import mplfinance as mpf
 import matplotlib.pyplot as plt
 
+# Barras desde el último evento
+def Barras_Desde(condicion: np.ndarray) -> np.ndarray:
+    
+    """
+    Cuenta las barras transcurridas desde la última vez que se cumplió una condición (0 en las barras donde se cumple), sin ciclos
+    de Python: la posición del último evento se propaga con un máximo acumulado. Antes del primer evento se cuentan las barras desde
+    el inicio de la serie más uno, igual que un contador que empieza en 0 y aumenta en cada barra sin evento.
+    
+    -----------
+    Parámetros:
+    -----------
+    param : np.ndarray : condicion : Condición de cada barra (1D, o 2D con una columna por serie).
+    -----------
+    Salida:
+    -----------
+    return : np.ndarray : Número de barras desde el último evento, con la forma de 'condicion'.
+    """
+    
+    condicion = np.asarray(condicion, dtype=bool)
+    posiciones = np.arange(condicion.shape[0]).reshape((-1,) + (1,) * (condicion.ndim - 1))
+    ultimo_evento = np.maximum.accumulate(np.where(condicion, posiciones, -1), axis=0)
+    
+    return posiciones - ultimo_evento
+
+# Máximos y mínimos móviles de varias ventanas
+def Extremos_Moviles(serie: pd.Series, longitudes: list, tipo: str = "max") -> dict:
+    
+    """
+    Calcula los máximos (o mínimos) móviles de una serie para varias ventanas en una sola pasada. Primero se construye una tabla con
+    los extremos de las ventanas de 1, 2, 4, 8, ... barras (cada nivel combina dos ventanas del nivel anterior), y el extremo de una
+    ventana de cualquier longitud se obtiene combinando las dos ventanas de la tabla que la cubren. Todas las ventanas comparten la
+    tabla y todo se calcula con operaciones de NumPy (también funciona con un pd.DataFrame de varias series).
+    
+    -----------
+    Parámetros:
+    -----------
+    param : pd.Series : serie : Serie de precios (o pd.DataFrame con una columna por activo).
+    -----------
+    param : list : longitudes : Longitudes de las ventanas.
+    -----------
+    param : str : tipo : 'max' para máximos o 'min' para mínimos (por defecto, se establece en 'max').
+    -----------
+    Salida:
+    -----------
+    return : dict : Diccionario {longitud: pd.Series} con el mismo resultado que rolling(window=longitud, min_periods=longitud).
+    """
+    
+    funcion = np.maximum if tipo == "max" else np.minimum
+    arreglo = serie.to_numpy(dtype=np.float64)
+    n = arreglo.shape[0]
+    # Construir los niveles necesarios de la tabla (extremos de las ventanas de 2^k barras)
+    niveles = {int(longitud).bit_length() - 1 for longitud in longitudes if 0 < longitud <= n}
+    tabla, tablas = arreglo, {}
+    for k in range(max(niveles, default=-1) + 1):
+        if k > 0:
+            tabla = funcion(tabla[:-(1 << (k - 1))], tabla[1 << (k - 1):])
+        if k in niveles:
+            tablas[k] = tabla
+    # Combinar las dos ventanas de 2^k barras que cubren cada ventana
+    extremos = {}
+    for longitud in longitudes:
+        resultado = np.full(arreglo.shape, np.nan)
+        if 0 < longitud <= n:
+            k = int(longitud).bit_length() - 1
+            resultado[longitud - 1:] = funcion(tablas[k][:n - longitud + 1], tablas[k][longitud - (1 << k):n - (1 << k) + 1])
+        if isinstance(serie, pd.DataFrame):
+            extremos[longitud] = pd.DataFrame(resultado, index=serie.index, columns=serie.columns)
+        else:
+            extremos[longitud] = pd.Series(resultado, index=serie.index, name=serie.name)
+    
+    return extremos
+
 # Indicador: Canales de Trading de Tortuga
 def Canales_Trading_Tortuga(df: pd.DataFrame, longitud_entrada: int = 20, longitud_salida: int = 10) -> pd.DataFrame:
     
@@ -40,36 +112,23 @@ def Canales_Trading_Tortuga(df: pd.DataFrame, longitud_entrada: int = 20, longit
     
     # Calcular los niveles más altos y bajos durante las ventanas definidas
     High, Low = df["High"], df["Low"]
-    entrada_low = Low.rolling(window=longitud_entrada, min_periods=longitud_entrada).min() # Mínimo para entrada
-    entrada_high = High.rolling(window=longitud_entrada, min_periods=longitud_entrada).max() # Máximo para entrada
-    salida_low = Low.rolling(window=longitud_salida, min_periods=longitud_salida).min() # Mínimo para salida
-    salida_high = High.rolling(window=longitud_salida, min_periods=longitud_salida).max() # Máximo para salida
+    minimos = Extremos_Moviles(Low, [longitud_entrada, longitud_salida], tipo="min")
+    maximos = Extremos_Moviles(High, [longitud_entrada, longitud_salida], tipo="max")
+    entrada_low = minimos[longitud_entrada] # Mínimo para entrada
+    entrada_high = maximos[longitud_entrada] # Máximo para entrada
+    salida_low = minimos[longitud_salida] # Mínimo para salida
+    salida_high = maximos[longitud_salida] # Máximo para salida
     
     # Contar condiciones de ruptura
     condicion_High = High >= entrada_high.shift(periods=1)
     condicion_Low = Low <= entrada_low.shift(periods=1)
-    contador_high, contador_low = 0, 0
-    lista_contador_high, lista_contador_low = [], []
     
-    # Iterar sobre las condiciones para contar las barras desde la última señal
-    for i in range(0, condicion_High.shape[0]):
-        # Si se genera una ruptura superior, reiniciar el contador
-        if condicion_High.iat[i]:
-            contador_high = 0
-            lista_contador_high.append(0)
-        else:
-            contador_high += 1
-            lista_contador_high.append(contador_high)
-        # Si se genera una ruptura inferior, reiniciar el contador
-        if condicion_Low.iat[i]:
-            contador_low = 0
-            lista_contador_low.append(0)
-        else:
-            contador_low += 1
-            lista_contador_low.append(contador_low)
+    # Contar las barras desde la última ruptura superior e inferior
+    contador_high = Barras_Desde(condicion_High)
+    contador_low = Barras_Desde(condicion_Low)
             
     # Determinar cuál condición es válida para establecer las líneas de tendencia y salida
-    condicion = np.array(lista_contador_high) <= np.array(lista_contador_low)
+    condicion = contador_high <= contador_low
     K1 = np.where(condicion, entrada_low, entrada_high) # Línea de tedencia según la condición válida
     K2 = np.where(condicion, salida_low, salida_high) # Línea de salida según la condición válida
     
@@ -83,88 +142,12 @@ def Canales_Trading_Tortuga(df: pd.DataFrame, longitud_entrada: int = 20, longit
     salida_venta = (High == salida_high.shift(periods=1)) | \
         (np.where((High > salida_high.shift(periods=1)) & (High.shift(periods=1) < salida_high.shift(periods=2)), True, False))
         
-    # Desplazar señales y salidas para el análisis
-    señal_compra_desplazada = señal_compra.shift(periods=1)
-    señal_venta_desplazada = señal_venta.shift(periods=1)
-    salida_compra_desplazada = salida_compra.shift(periods=1)
-    salida_venta_desplazada = salida_venta.shift(periods=1)
-    
-    # Inicializar contadores para las barras desde la última señal
-    contador_O1, contador_O2, contador_O3, contador_O4 = 0, 0, 0, 0
-    contador_E1, contador_E2, contador_E3, contador_E4 = 0, 0, 0, 0
-    O1, O2, O3, O4 = [], [], [], []
-    E1, E2, E3, E4 = [], [], [], []
-    
     # Contar las barras desde la última señal de compra o venta
-    for i in range(0, señal_compra.shape[0]):
-        # Señal de Compra
-        if señal_compra.iat[i]:
-            contador_O1 = 0
-            O1.append(0)
-        else:
-            contador_O1 += 1
-            O1.append(contador_O1)
-        # Señal de Venta
-        if señal_venta.iat[i]:
-            contador_O2 = 0
-            O2.append(0)
-        else:
-            contador_O2 += 1
-            O2.append(contador_O2)
-        # Salida de Compra
-        if salida_compra.iat[i]:
-            contador_O3 = 0
-            O3.append(0)
-        else:
-            contador_O3 += 1
-            O3.append(contador_O3)
-        # Salida de Venta
-        if salida_venta.iat[i]:
-            contador_O4 = 0
-            O4.append(0)
-        else:
-            contador_O4 += 1
-            O4.append(contador_O4)
-            
-        # Señal de Compra Desplazada
-        if señal_compra_desplazada.iat[i]:
-            contador_E1 = 0
-            E1.append(0)
-        else:
-            contador_E1 += 1
-            E1.append(contador_E1)
-        # Señal de Venta Desplazada
-        if señal_venta_desplazada.iat[i]:
-            contador_E2 = 0
-            E2.append(0)
-        else:
-            contador_E2 += 1
-            E2.append(contador_E2)
-        # Salida de Compra Desplazada
-        if salida_compra_desplazada.iat[i]:
-            contador_E3 = 0
-            E3.append(0)
-        else:
-            contador_E3 += 1
-            E3.append(contador_E3)
-        # Salida de Venta Desplazada
-        if salida_venta_desplazada.iat[i]:
-            contador_E4 = 0
-            E4.append(0)
-        else:
-            contador_E4 += 1
-            E4.append(contador_E4)
-            
-    # Crear un DataFrame para almacenar las señales
     señales_df = pd.DataFrame(index=df.index)
-    señales_df["O1"] = O1
-    señales_df["O2"] = O2
-    señales_df["O3"] = O3
-    señales_df["O4"] = O4
-    señales_df["E1"] = E1
-    señales_df["E2"] = E2
-    señales_df["E3"] = E3
-    señales_df["E4"] = E4
+    señales_df["O1"] = Barras_Desde(señal_compra)  # Señal de Compra
+    señales_df["O2"] = Barras_Desde(señal_venta)   # Señal de Venta
+    señales_df["O3"] = Barras_Desde(salida_compra) # Salida de Compra
+    señales_df["O4"] = Barras_Desde(salida_venta)  # Salida de Venta
        
     # Craer un DataFrame para los Canales de Trading de Tortuga
     TDC = pd.DataFrame(index=df.index)
@@ -260,3 +243,5 @@ plt.show()
 #     la identificación de puntos de entrada y salida efectivos en el mercado.
 #   - Los canales superior e inferior actúan como niveles de soporte y resistencia dinámicos. Los traders pueden utilizar estos niveles
 #     para establecer órdenes de stop-loss o para planificar salidas, mejorando la gestión de riesgo y la efectividad en sus decisiones.
+#   - Barras_Desde cuenta las barras desde la última vez que se cumplió una condición (por ejemplo, desde la última ruptura o desde
+#     la entrada a una posición) y acepta arreglos 2D, por lo que sirve para muchas series a la vez.
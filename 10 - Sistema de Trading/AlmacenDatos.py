@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+# Importar librerías
+import os
+import pandas as pd
+# Librerías Propias
+from config import config
+from ProveedoresDatos import ProveedorDatos, Crear_Proveedor, Periodo_a_Desplazamiento
+from Reloj import RelojReal
+
+# Duración de cada intervalo (una vela almacenada se considera vigente durante este tiempo)
+duracion_intervalos = {
+
+    "1m": pd.Timedelta(minutes=1),
+    "5m": pd.Timedelta(minutes=5),
+    "15m": pd.Timedelta(minutes=15),
+    "1d": pd.Timedelta(days=1),
+    "1wk": pd.Timedelta(weeks=1),
+    "1mo": pd.Timedelta(days=31)
+
+    }
+
+# Antigüedad máxima de la última vela para poder pedir solo las velas nuevas (límites de Yahoo Finance)
+limite_incremental = {
+
+    "1m": pd.Timedelta(days=7),
+    "5m": pd.Timedelta(days=60),
+    "15m": pd.Timedelta(days=60)
+
+    }
+
+# Definir clase
+class AlmacenDatos:
+
+    """
+    Almacén local de datos históricos (OHLCV) en formato columnar (Parquet), particionado por intervalo y por activo:
+
+        {ruta}/{intervalo}/{activo}.parquet
+
+    El Sistema de Trading consulta primero este almacén y solo descarga (a través del proveedor de datos) los activos cuyos
+    datos ya no están vigentes. Los últimos datos de cada activo se conservan también en memoria (para no leerlos de disco en
+    cada ciclo) y se recortan al periodo configurado (para que no crezcan indefinidamente).
+    """
+
+    # __init__
+    def __init__(self, ruta: str = config.almacen["ruta"], incremental: bool = config.almacen["incremental"],
+                 proveedor: ProveedorDatos = None, reloj: RelojReal = None) -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        ruta : str, opcional
+            Directorio donde se guardarán los archivos Parquet (por defecto, se usa el definido en config.almacen).
+
+        incremental : bool, opcional
+            Si es True, solo se descargan las velas posteriores a la última vela almacenada (por defecto, se usa el
+            definido en config.almacen).
+
+        proveedor : ProveedorDatos, opcional
+            Proveedor de datos usado para descargar (por defecto, se crea el definido en config.proveedor_datos).
+
+        reloj : RelojReal, opcional
+            Reloj usado para revisar la vigencia de los datos (por defecto, el reloj del sistema).
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.ruta = ruta
+        self.incremental = incremental
+        self.proveedor = proveedor if proveedor is not None else Crear_Proveedor(config.proveedor_datos)
+        self.reloj = reloj if reloj is not None else RelojReal()
+        # Atributos Privados
+        self.__memoria = {}
+        self.__versiones = {}
+
+
+    # __repr__
+    def __repr__(self):
+        return self.__class__.__name__ + ".class"
+
+    # Ruta del archivo de un activo
+    def ruta_archivo(self, activo: str, intervalo: str) -> str:
+
+        """
+        Construye la ruta del archivo Parquet de un activo en un intervalo.
+
+        Parámetros:
+        -----------
+        activo : str
+            Símbolo del activo (por ejemplo, 'AAPL' o 'EURUSD=X').
+
+        intervalo : str
+            Intervalo de las velas (por ejemplo, '1m' o '1d').
+
+        Salida:
+        -------
+        return : str : Ruta del archivo.
+        """
+
+        return os.path.join(self.ruta, intervalo, f"{activo}.parquet")
+
+    # Leer datos almacenados
+    def leer(self, activo: str, intervalo: str) -> pd.DataFrame:
+
+        """
+        Lee los datos almacenados de un activo.
+
+        Parámetros:
+        -----------
+        activo : str
+            Símbolo del activo.
+
+        intervalo : str
+            Intervalo de las velas.
+
+        Salida:
+        -------
+        return : pd.DataFrame|None : Datos almacenados o None si el activo no está en el almacén.
+        """
+
+        archivo = self.ruta_archivo(activo, intervalo)
+        if not os.path.isfile(archivo):
+            return None
+
+        return pd.read_parquet(archivo) # pip install pyarrow
+
+    # Escribir datos
+    def escribir(self, activo: str, intervalo: str, df: pd.DataFrame) -> None:
+
+        """
+        Guarda (sobrescribe) los datos de un activo en el almacén.
+
+        Parámetros:
+        -----------
+        activo : str
+            Símbolo del activo.
+
+        intervalo : str
+            Intervalo de las velas.
+
+        df : pd.DataFrame
+            Datos OHLCV del activo.
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        archivo = self.ruta_archivo(activo, intervalo)
+        os.makedirs(os.path.dirname(archivo), exist_ok=True)
+        # Escribir en un archivo temporal y reemplazar, para no dejar archivos corruptos si se interrumpe
+        archivo_temporal = archivo + ".tmp"
+        df.to_parquet(archivo_temporal)
+        os.replace(archivo_temporal, archivo)
+
+    # Revisar vigencia
+    def esta_vigente(self, df: pd.DataFrame, intervalo: str) -> bool:
+
+        """
+        Revisa si los datos almacenados siguen vigentes, es decir, si todavía no ha cerrado la vela siguiente a la última
+        vela almacenada.
+
+        Parámetros:
+        -----------
+        df : pd.DataFrame
+            Datos almacenados del activo.
+
+        intervalo : str
+            Intervalo de las velas.
+
+        Salida:
+        -------
+        return : bool : True si los datos están vigentes.
+        """
+
+        if df is None or df.empty:
+            return False
+        ultima_vela = df.index[-1]
+        ahora = self.reloj.ahora(tz=ultima_vela.tz)
+
+        return (ahora - ultima_vela) < duracion_intervalos[intervalo]
+
+    # Descargar datos
+    def descargar(self, activos: list, intervalo: str, periodo: str = None, inicio: pd.Timestamp = None) -> dict:
+
+        """
+        Descarga los datos de varios activos en una sola petición al proveedor de datos.
+
+        Parámetros:
+        -----------
+        activos : list
+            Símbolos de los activos a descargar.
+
+        intervalo : str
+            Intervalo de las velas.
+
+        periodo : str, opcional
+            Periodo a descargar (por ejemplo, '5d' o 'max').
+
+        inicio : pd.Timestamp, opcional
+            Si se especifica, solo se descargan las velas a partir de esta fecha (se ignora el periodo).
+
+        Salida:
+        -------
+        return : dict : Diccionario {activo: pd.DataFrame}.
+        """
+
+        return self.proveedor.descargar(activos, intervalo, inicio=inicio, periodo=periodo)
+
+    # Combinar datos
+    def combinar(self, existente: pd.DataFrame, nuevo: pd.DataFrame) -> pd.DataFrame:
+
+        """
+        Agrega las velas nuevas a los datos existentes. La última vela almacenada suele descargarse de nuevo (estaba
+        incompleta cuando se guardó), por lo que las velas repetidas se reemplazan por su versión más reciente.
+
+        Parámetros:
+        -----------
+        existente : pd.DataFrame
+            Datos almacenados del activo.
+
+        nuevo : pd.DataFrame
+            Velas descargadas a partir de la última vela almacenada.
+
+        Salida:
+        -------
+        return : pd.DataFrame : Datos combinados y ordenados (el mismo pd.DataFrame existente si no hay cambios).
+        """
+
+        if existente is None or existente.empty:
+            return nuevo
+        nuevo = nuevo[nuevo.index >= existente.index[-1]]
+        # Sin velas nuevas (o solo la última vela almacenada, sin cambios)
+        if nuevo.empty or (len(nuevo) == 1 and nuevo.index[0] == existente.index[-1] and
+                           nuevo.iloc[-1].equals(existente.iloc[-1])):
+            return existente
+        df = pd.concat([existente, nuevo])
+        df = df[~df.index.duplicated(keep="last")]
+
+        return df.sort_index()
+
+    # Versión de los datos
+    def version(self, activo: str, intervalo: str) -> int:
+
+        """
+        Regresa la versión de los datos de un activo, que aumenta cada vez que el almacén los lee de disco o combina
+        velas nuevas. Permite a las etapas siguientes (ver LimpiezaDatos) saber si los datos cambiaron sin compararlos.
+
+        Parámetros:
+        -----------
+        activo : str
+            Símbolo del activo.
+
+        intervalo : str
+            Intervalo de las velas.
+
+        Salida:
+        -------
+        return : int|None : Versión de los datos o None si el activo no está en memoria.
+        """
+
+        return self.__versiones.get((activo, intervalo), None)
+
+    # Recortar datos al periodo
+    def recortar(self, df: pd.DataFrame, periodo: str) -> pd.DataFrame:
+
+        """
+        Conserva solo las velas dentro del periodo, contado hacia atrás desde la última vela.
+
+        Parámetros:
+        -----------
+        df : pd.DataFrame
+            Datos del activo.
+
+        periodo : str
+            Periodo a conservar (por ejemplo, '5d' o 'max').
+
+        Salida:
+        -------
+        return : pd.DataFrame : Datos recortados (el mismo pd.DataFrame si no hay velas fuera del periodo).
+        """
+
+        desplazamiento = Periodo_a_Desplazamiento(periodo)
+        if df is None or df.empty or desplazamiento is None:
+            return df
+        inicio = df.index[-1] - desplazamiento
+        if df.index[0] >= inicio:
+            return df
+
+        return df[df.index >= inicio]
+
+    # Obtener datos (almacén primero)
+    def obtener(self, activos: list, intervalo: str, periodo: str, por_activo: bool = False) -> pd.DataFrame:
+
+        """
+        Obtiene los datos de varios activos. Los activos con datos vigentes en el almacén se toman de memoria (o de disco la
+        primera vez); para el resto se descargan solo las velas posteriores a la última vela almacenada (o el periodo
+        completo si el activo no está en el almacén o la actualización incremental está desactivada), se combinan con lo
+        almacenado, se recortan al periodo y se guardan (solo si hubo velas nuevas).
+
+        Parámetros:
+        -----------
+        activos : list
+            Símbolos de los activos.
+
+        intervalo : str
+            Intervalo de las velas.
+
+        periodo : str
+            Periodo a descargar cuando no hay datos almacenados (y periodo que se conserva en el almacén).
+
+        por_activo : bool, opcional
+            Si es True, regresa un diccionario {activo: pd.DataFrame} en lugar de combinar los activos en un solo
+            pd.DataFrame (False por defecto).
+
+        Salida:
+        -------
+        return : pd.DataFrame|dict : Datos con columnas de dos niveles (activo, columna) o diccionario por activo.
+        """
+
+        datos = {}
+        for activo in activos:
+            df = self.__memoria.get((activo, intervalo))
+            if df is None:
+                df = self.recortar(self.leer(activo, intervalo), periodo)
+                if df is not None:
+                    self.__memoria[(activo, intervalo)] = df
+                    self.__versiones[(activo, intervalo)] = self.__versiones.get((activo, intervalo), 0) + 1
+            datos[activo] = df
+        no_vigentes = [activo for activo, df in datos.items() if not self.esta_vigente(df, intervalo)]
+        # Separar los activos que se pueden actualizar solo con las velas nuevas
+        incrementales = []
+        completos = []
+        for activo in no_vigentes:
+            df = datos[activo]
+            if self.incremental and df is not None and not df.empty and \
+                (self.reloj.ahora(tz=df.index[-1].tz) - df.index[-1]) < limite_incremental.get(intervalo, pd.Timedelta.max):
+                incrementales.append(activo)
+            else:
+                completos.append(activo)
+        # Descargar
+        descargados = {}
+        if len(completos) > 0:
+            descargados.update(self.descargar(completos, intervalo, periodo=periodo))
+        if len(incrementales) > 0:
+            inicio = min(datos[activo].index[-1] for activo in incrementales)
+            descargados.update(self.descargar(incrementales, intervalo, inicio=inicio))
+        # Combinar y guardar
+        for activo, df in descargados.items():
+            df = self.combinar(datos[activo], df)
+            if df is datos[activo]:
+                continue
+            df = self.recortar(df, periodo)
+            self.escribir(activo, intervalo, df)
+            self.__memoria[(activo, intervalo)] = df
+            self.__versiones[(activo, intervalo)] = self.__versiones.get((activo, intervalo), 0) + 1
+            datos[activo] = df
+        datos = {activo: df for activo, df in datos.items() if df is not None}
+        if por_activo:
+            return datos
+        if len(datos) == 0:
+            return pd.DataFrame()
+
+        return pd.concat(datos, axis=1)
+
+# Recordatorio:
+if __name__ == "__main__":
+    # Crear almacén y obtener datos (la segunda llamada se lee desde disco)
+    almacen = AlmacenDatos()
+    df = almacen.obtener(["AAPL", "MSFT"], intervalo="1d", periodo="1y")
+    print(df)
+    df = almacen.obtener(["AAPL", "MSFT"], intervalo="1d", periodo="1y")
+    print(df)
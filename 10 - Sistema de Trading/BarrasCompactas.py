@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+# Importar librerías
+import numpy as np
+import pandas as pd
+
+# Definir clase
+class BarrasCompactas:
+
+    """
+    Velas (OHLCV) en un formato compacto de arreglos contiguos de NumPy:
+
+        tiempo  -> int64 (nanosegundos desde epoch en UTC)
+        Open, High, Low, Close -> float32 (por defecto)
+        Volume  -> int64
+
+    La columna 'Adj Close' no se conserva (en datos intradía, divisas y criptomonedas es igual a 'Close'). Con precios en
+    float32 las velas ocupan la mitad de memoria que en un pd.DataFrame de float64, lo que permite mantener en memoria
+    universos de activos más grandes y recorrer los arreglos más rápido en los cálculos de ventanas móviles.
+
+    Igual que BarrasMemoria, el objeto se comporta como un DataFrame de solo lectura en lo necesario para los indicadores
+    y las estrategias: 'barras["Close"]' regresa una pd.Series construida sobre el arreglo, sin copiarlo.
+    """
+
+    columnas_precio = ["Open", "High", "Low", "Close"]
+
+    # __init__
+    def __init__(self, tiempo: np.ndarray, precios: dict, volumen: np.ndarray = None, zona_horaria: str = None,
+                 precision: str = "float32") -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        tiempo : np.ndarray
+            Marcas de tiempo en nanosegundos desde epoch en UTC.
+
+        precios : dict
+            Arreglos de precios por columna ({'Open': ..., 'High': ..., 'Low': ..., 'Close': ...}).
+
+        volumen : np.ndarray, opcional
+            Volumen de cada vela.
+
+        zona_horaria : str, opcional
+            Zona horaria del índice de fechas (por defecto, sin zona horaria).
+
+        precision : str, opcional
+            Tipo de dato de los precios (por defecto, 'float32').
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.tiempo = np.ascontiguousarray(tiempo, dtype=np.int64)
+        self.precios = {columna: np.ascontiguousarray(precios[columna], dtype=precision)
+                        for columna in self.columnas_precio if columna in precios}
+        self.volumen = np.ascontiguousarray(volumen, dtype=np.int64) if volumen is not None else None
+        self.zona_horaria = zona_horaria
+        self.columns = pd.Index(list(self.precios) + (["Volume"] if self.volumen is not None else []))
+        # Revisar dimensiones
+        for columna in self.columns:
+            if self.arreglo(columna).shape != self.tiempo.shape:
+                raise ValueError(f"La columna '{columna}' no tiene el mismo número de velas que las marcas de tiempo.")
+        # Atributos Privados
+        self.__indice = None
+
+
+    # __repr__
+    def __repr__(self):
+        return self.__class__.__name__ + ".class"
+
+    # __len__
+    def __len__(self) -> int:
+        return self.tiempo.shape[0]
+
+    # Dimensiones
+    @property
+    def shape(self) -> tuple:
+        return (len(self), len(self.columns))
+
+    # Memoria utilizada
+    @property
+    def nbytes(self) -> int:
+        return self.tiempo.nbytes + sum(self.arreglo(columna).nbytes for columna in self.columns)
+
+    # Índice de fechas
+    @property
+    def index(self) -> pd.DatetimeIndex:
+
+        """
+        Índice de fechas (se construye solo la primera vez que se solicita).
+        """
+
+        if self.__indice is None:
+            indice = pd.DatetimeIndex(self.tiempo.view("M8[ns]"))
+            self.__indice = indice.tz_localize("UTC").tz_convert(self.zona_horaria) if self.zona_horaria else indice
+
+        return self.__indice
+
+    # Acceso por columna
+    def __getitem__(self, columna: str) -> pd.Series:
+
+        """
+        Regresa una columna como pd.Series sin copiar los datos.
+
+        Parámetros:
+        -----------
+        columna : str
+            Nombre de la columna (por ejemplo, 'Close').
+
+        Salida:
+        -------
+        return : pd.Series : Serie construida sobre el arreglo.
+        """
+
+        return pd.Series(self.arreglo(columna), index=self.index, name=columna, copy=False)
+
+    # Arreglo de una columna
+    def arreglo(self, columna: str) -> np.ndarray:
+
+        """
+        Regresa el arreglo de una columna (sin copia).
+
+        Parámetros:
+        -----------
+        columna : str
+            Nombre de la columna (por ejemplo, 'Close' o 'Volume').
+
+        Salida:
+        -------
+        return : np.ndarray : Arreglo de la columna.
+        """
+
+        if columna == "Volume" and self.volumen is not None:
+            return self.volumen
+        if columna not in self.precios:
+            raise KeyError(columna)
+
+        return self.precios[columna]
+
+    # Convertir a DataFrame
+    def a_dataframe(self, dtype: str = None) -> pd.DataFrame:
+
+        """
+        Copia las velas a un pd.DataFrame.
+
+        Parámetros:
+        -----------
+        dtype : str, opcional
+            Tipo de dato de las columnas de precios del resultado (por defecto, el de las velas).
+
+        Salida:
+        -------
+        return : pd.DataFrame : Velas.
+        """
+
+        columnas = {columna: self.precios[columna].astype(dtype if dtype is not None else self.precios[columna].dtype)
+                    for columna in self.precios}
+        if self.volumen is not None:
+            columnas["Volume"] = self.volumen.copy()
+
+        return pd.DataFrame(columnas, index=self.index)
+
+    # Crear a partir de un DataFrame
+    @classmethod
+    def desde_dataframe(cls, df: pd.DataFrame, precision: str = "float32") -> "BarrasCompactas":
+
+        """
+        Convierte un DataFrame de velas al formato compacto.
+
+        Parámetros:
+        -----------
+        df : pd.DataFrame
+            Velas con índice de fechas y columnas OHLCV ('Adj Close' se descarta).
+
+        precision : str, opcional
+            Tipo de dato de los precios (por defecto, 'float32').
+
+        Salida:
+        -------
+        return : BarrasCompactas : Velas en formato compacto.
+        """
+
+        indice = pd.DatetimeIndex(df.index)
+        zona_horaria = str(indice.tz) if indice.tz is not None else None
+        if zona_horaria:
+            indice = indice.tz_convert("UTC").tz_localize(None)
+        precios = {columna: df[columna].to_numpy() for columna in cls.columnas_precio if columna in df.columns}
+        volumen = None
+        if "Volume" in df.columns:
+            volumen = np.rint(df["Volume"].fillna(0).to_numpy(dtype=np.float64))
+
+        return cls(indice.as_unit("ns").asi8, precios, volumen=volumen, zona_horaria=zona_horaria, precision=precision)
+
+# Aplicar la política de precisión a unas velas
+def Aplicar_Precision(datos, precision: str = None) -> pd.DataFrame:
+
+    """
+    Convierte unas velas (pd.DataFrame, BarrasCompactas o BarrasMemoria) al pd.DataFrame con el que se calculan los
+    indicadores y las estrategias, con la precisión indicada (ver config.precision).
+
+    Parámetros:
+    -----------
+    datos : pd.DataFrame|BarrasCompactas|BarrasMemoria
+        Velas del activo.
+
+    precision : str, opcional
+        Tipo de dato de los precios para los cálculos (por ejemplo, 'float64'). Si es None, se conserva el de los datos.
+
+    Salida:
+    -------
+    return : pd.DataFrame : Velas con la precisión indicada (las columnas que ya la tienen no se copian).
+    """
+
+    # Velas por columnas (BarrasCompactas o BarrasMemoria): usar los mismos arreglos y solo convertir los que cambian de tipo
+    if not isinstance(datos, pd.DataFrame) and hasattr(datos, "arreglo"):
+        columnas = {}
+        for columna in datos.columns:
+            arreglo = datos.arreglo(columna)
+            if precision is not None and columna != "Volume" and arreglo.dtype.kind == "f" and \
+                arreglo.dtype != np.dtype(precision):
+                arreglo = arreglo.astype(precision)
+            columnas[columna] = pd.Series(arreglo, index=datos.index, name=columna, copy=False)
+        return pd.DataFrame(columnas, copy=False)
+    if precision is None or not isinstance(datos, pd.DataFrame):
+        return datos
+    columnas = [columna for columna in datos.columns if columna != "Volume" and datos[columna].dtype.kind == "f"
+                and datos[columna].dtype != np.dtype(precision)]
+    if len(columnas) == 0:
+        return datos
+
+    return datos.astype({columna: precision for columna in columnas})
+
+# Recordatorio:
+if __name__ == "__main__":
+    # Importar librerías adicionales
+    from config import config
+    from ProveedoresDatos import Crear_Proveedor
+    # Comparar la memoria de las velas en pd.DataFrame y en formato compacto
+    proveedor = Crear_Proveedor(config.proveedor_datos)
+    df = proveedor.descargar(["BTC-USD"], intervalo="1m", periodo="5d")["BTC-USD"]
+    barras = BarrasCompactas.desde_dataframe(df)
+    print(f"pd.DataFrame: {df.memory_usage(index=True).sum() / 1e6:.2f} MB - BarrasCompactas: {barras.nbytes / 1e6:.2f} MB")
+    print(barras["Close"].tail())
@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+# Importar librerías
+import os
+import json
+import copy
+import numpy as np
+import pandas as pd
+
+# Definir clase
+class BarrasMemoria:
+
+    """
+    Velas (OHLCV) almacenadas como arreglos contiguos de NumPy y abiertas con mapeo en memoria (np.memmap). Cada columna
+    se guarda en su propio archivo '.npy' dentro de un directorio:
+
+        {ruta}/tiempo.npy   -> Marcas de tiempo (int64, nanosegundos desde epoch en UTC)
+        {ruta}/Open.npy     -> Columnas de precios y volumen
+        ...
+        {ruta}/meta.json    -> Columnas disponibles y zona horaria
+
+    Abrir las velas es prácticamente instantáneo (no se lee nada del disco) y solo se cargan en memoria las ventanas que
+    realmente se usan. El objeto se comporta como un DataFrame de solo lectura en lo necesario para los indicadores y
+    las estrategias: 'barras["Close"]' regresa una pd.Series construida sobre el arreglo mapeado, sin copiarlo.
+    """
+
+    # __init__
+    def __init__(self, ruta: str, inicio: int = 0, fin: int = None) -> None:
+
+        """
+        Constructor (abre las velas guardadas en 'ruta').
+
+        Parámetros:
+        -----------
+        ruta : str
+            Directorio donde se guardaron las velas con el método 'guardar'.
+
+        inicio : int, opcional
+            Posición de la primera vela de la ventana (por defecto, 0).
+
+        fin : int, opcional
+            Posición (exclusiva) de la última vela de la ventana (por defecto, todas las velas).
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.ruta = ruta
+        with open(os.path.join(ruta, "meta.json"), "r") as archivo:
+            meta = json.load(archivo)
+        self.columns = pd.Index(meta["columnas"])
+        self.zona_horaria = meta["zona_horaria"]
+        # Atributos Privados
+        self.__tiempo = np.load(os.path.join(ruta, "tiempo.npy"), mmap_mode="r")
+        self.__arreglos = {columna: np.load(os.path.join(ruta, f"{columna}.npy"), mmap_mode="r") for columna in self.columns}
+        self.__inicio = inicio
+        self.__fin = self.__tiempo.shape[0] if fin is None else fin
+        self.__indice = None
+
+
+    # __repr__
+    def __repr__(self):
+        return self.__class__.__name__ + ".class"
+
+    # __len__
+    def __len__(self) -> int:
+        return self.__fin - self.__inicio
+
+    # Dimensiones
+    @property
+    def shape(self) -> tuple:
+        return (len(self), len(self.columns))
+
+    # Índice de la ventana
+    @property
+    def index(self) -> pd.DatetimeIndex:
+
+        """
+        Índice de fechas de la ventana (se construye solo la primera vez que se solicita).
+        """
+
+        if self.__indice is None:
+            tiempo = self.__tiempo[self.__inicio:self.__fin].view("M8[ns]")
+            indice = pd.DatetimeIndex(tiempo)
+            self.__indice = indice.tz_localize("UTC").tz_convert(self.zona_horaria) if self.zona_horaria else indice
+
+        return self.__indice
+
+    # Acceso por columna
+    def __getitem__(self, columna: str) -> pd.Series:
+
+        """
+        Regresa una columna de la ventana como pd.Series sin copiar los datos.
+
+        Parámetros:
+        -----------
+        columna : str
+            Nombre de la columna (por ejemplo, 'Close').
+
+        Salida:
+        -------
+        return : pd.Series : Serie construida sobre el arreglo mapeado en memoria.
+        """
+
+        return pd.Series(self.arreglo(columna), index=self.index, name=columna, copy=False)
+
+    # Arreglo de una columna
+    def arreglo(self, columna: str) -> np.ndarray:
+
+        """
+        Regresa una columna de la ventana como arreglo de NumPy (vista del arreglo mapeado en memoria, sin copia).
+
+        Parámetros:
+        -----------
+        columna : str
+            Nombre de la columna (por ejemplo, 'Close').
+
+        Salida:
+        -------
+        return : np.ndarray : Vista de solo lectura de la columna.
+        """
+
+        return self.__arreglos[columna][self.__inicio:self.__fin]
+
+    # Ventana por fechas
+    def ventana(self, inicio: str = None, fin: str = None) -> "BarrasMemoria":
+
+        """
+        Regresa una ventana de las velas entre dos fechas (ambas incluidas). La búsqueda es binaria, por lo que solo se
+        leen unas pocas páginas del archivo de marcas de tiempo.
+
+        Parámetros:
+        -----------
+        inicio : str, opcional
+            Fecha inicial (por defecto, la primera vela).
+
+        fin : str, opcional
+            Fecha final (por defecto, la última vela).
+
+        Salida:
+        -------
+        return : BarrasMemoria : Ventana de las velas (comparte los arreglos mapeados en memoria).
+        """
+
+        tiempo = self.__tiempo[self.__inicio:self.__fin]
+        posicion_inicio = 0 if inicio is None else np.searchsorted(tiempo, self.__a_nanosegundos(inicio), side="left")
+        posicion_fin = tiempo.shape[0] if fin is None else np.searchsorted(tiempo, self.__a_nanosegundos(fin), side="right")
+
+        return self.__vista(self.__inicio + int(posicion_inicio), self.__inicio + int(posicion_fin))
+
+    # Últimas velas
+    def ultimas(self, n: int) -> "BarrasMemoria":
+
+        """
+        Regresa una ventana con las últimas 'n' velas.
+
+        Parámetros:
+        -----------
+        n : int
+            Número de velas.
+
+        Salida:
+        -------
+        return : BarrasMemoria : Ventana de las velas (comparte los arreglos mapeados en memoria).
+        """
+
+        return self.__vista(max(self.__fin - n, self.__inicio), self.__fin)
+
+    # Convertir a DataFrame
+    def a_dataframe(self) -> pd.DataFrame:
+
+        """
+        Copia la ventana a un pd.DataFrame (útil para graficar o para funciones que modifican los datos).
+
+        Salida:
+        -------
+        return : pd.DataFrame : Velas de la ventana.
+        """
+
+        return pd.DataFrame({columna: np.array(self.arreglo(columna)) for columna in self.columns}, index=self.index)
+
+    # Crear una vista que comparte los arreglos mapeados en memoria
+    def __vista(self, inicio: int, fin: int) -> "BarrasMemoria":
+        vista = copy.copy(self)
+        vista.__inicio = inicio
+        vista.__fin = fin
+        vista.__indice = None
+        return vista
+
+    # Convertir fechas a nanosegundos
+    def __a_nanosegundos(self, fecha: str) -> int:
+        fecha = pd.Timestamp(fecha)
+        if fecha.tz is None and self.zona_horaria:
+            fecha = fecha.tz_localize(self.zona_horaria)
+        if fecha.tz is not None:
+            fecha = fecha.tz_convert("UTC").tz_localize(None)
+        return fecha.value
+
+    # Guardar velas
+    @staticmethod
+    def guardar(df: pd.DataFrame, ruta: str) -> "BarrasMemoria":
+
+        """
+        Guarda un DataFrame de velas en el formato de arreglos contiguos y lo abre con mapeo en memoria.
+
+        Parámetros:
+        -----------
+        df : pd.DataFrame
+            Velas con índice de fechas.
+
+        ruta : str
+            Directorio donde se guardarán los arreglos.
+
+        Salida:
+        -------
+        return : BarrasMemoria : Velas guardadas, abiertas con mapeo en memoria.
+        """
+
+        os.makedirs(ruta, exist_ok=True)
+        indice = pd.DatetimeIndex(df.index)
+        zona_horaria = str(indice.tz) if indice.tz is not None else None
+        if zona_horaria:
+            indice = indice.tz_convert("UTC").tz_localize(None)
+        np.save(os.path.join(ruta, "tiempo.npy"), indice.as_unit("ns").asi8)
+        for columna in df.columns:
+            np.save(os.path.join(ruta, f"{columna}.npy"), np.ascontiguousarray(df[columna].to_numpy()))
+        with open(os.path.join(ruta, "meta.json"), "w") as archivo:
+            json.dump({"columnas": [str(columna) for columna in df.columns], "zona_horaria": zona_horaria}, archivo)
+
+        return BarrasMemoria(ruta)
+
+# Recordatorio:
+if __name__ == "__main__":
+    # Importar librerías adicionales
+    from config import config
+    from ProveedoresDatos import Crear_Proveedor
+    from estrategias.Estrategia3 import Estrategia3
+    # Guardar velas de 1 minuto y abrirlas con mapeo en memoria
+    proveedor = Crear_Proveedor(config.proveedor_datos)
+    df = proveedor.descargar(["BTC-USD"], intervalo="1m", periodo="5d")["BTC-USD"]
+    barras = BarrasMemoria.guardar(df, "almacen/memoria/1m/BTC-USD")
+    print(barras.shape, barras.index[0], barras.index[-1])
+    # Usar una ventana directamente en una estrategia
+    est3 = Estrategia3(barras.ultimas(1_000), RSI={}, BB={}, MACD={})
+    print(est3.calcular())
+    # Comprobar que la ventana llega a las estrategias sin copiarse (las columnas comparten memoria con el archivo)
+    from Estrategias import EstrategiasTrading
+    ventana = barras.ultimas(1_000)
+    Estrategias = EstrategiasTrading({nombre: {"df": ventana} for nombre in ["Estrategia1", "Estrategia2", "Estrategia3"]},
+                                     precision=config.precision["resultados"])
+    for nombre, estrategia in Estrategias.estrategias.items():
+        sin_copia = all(np.shares_memory(estrategia.df[columna].to_numpy(), ventana.arreglo(columna))
+                        for columna in ventana.columns)
+        assert sin_copia, f"{nombre} recibió una copia de las velas."
+        print(nombre, "sin copia:", sin_copia)
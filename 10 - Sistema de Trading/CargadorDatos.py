@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# Importar librerías
+import os
+import importlib.util
+import numpy as np
+import pandas as pd
+
+# Esquemas de los archivos de la carpeta 'datos'
+esquemas = {
+
+    # Velas (datos_historicos.csv): índice de fechas y columnas OHLCV
+    "ohlcv": {
+
+        "fechas": True,
+        "columnas": {"Open": "float64", "High": "float64", "Low": "float64", "Close": "float64", "Adj Close": "float64",
+                     "Volume": "int64"},
+        "obligatorias": ["Open", "High", "Low", "Close"]
+
+        },
+
+    # Sectores (sectores.csv): un activo por fila
+    "sectores": {
+
+        "fechas": False,
+        "columnas": {"country": "category", "name": "string", "full_name": "string", "isin": "string",
+                     "currency": "category", "symbol": "string", "Sector": "category"},
+        "obligatorias": ["symbol", "Sector"]
+
+        }
+
+    }
+
+# Motor de lectura (pyarrow si está instalado)
+pyarrow_disponible = importlib.util.find_spec("pyarrow") is not None # pip install pyarrow
+
+# Validar esquema
+def Validar_Esquema(df: pd.DataFrame, esquema: str) -> pd.DataFrame:
+
+    """
+    Revisa que un DataFrame cumpla con un esquema y fija los tipos de dato de sus columnas.
+
+    Parámetros:
+    -----------
+    df : pd.DataFrame
+        Datos leídos (el índice debe ser la primera columna del archivo).
+
+    esquema : str
+        Nombre del esquema ('ohlcv' o 'sectores').
+
+    Salida:
+    -------
+    return : pd.DataFrame : Datos con los tipos de dato del esquema.
+    """
+
+    if esquema not in esquemas:
+        raise ValueError(f"Esquema '{esquema}' no reconocido (opciones: {list(esquemas)}).")
+    definicion = esquemas[esquema]
+    # Columnas obligatorias
+    faltantes = [columna for columna in definicion["obligatorias"] if columna not in df.columns]
+    if len(faltantes) > 0:
+        raise ValueError(f"Los datos no cumplen con el esquema '{esquema}': faltan las columnas {faltantes}.")
+    # Índice de fechas
+    if definicion["fechas"]:
+        if not isinstance(df.index, pd.DatetimeIndex):
+            try:
+                df.index = pd.to_datetime(df.index, format="ISO8601")
+            except (ValueError, TypeError) as error:
+                raise ValueError(f"Los datos no cumplen con el esquema '{esquema}': fechas inválidas ({error}).")
+        if df.index.has_duplicates:
+            raise ValueError(f"Los datos no cumplen con el esquema '{esquema}': hay fechas duplicadas.")
+        df.index = df.index.as_unit("ns")
+    # Tipos de dato
+    tipos = {}
+    for columna, tipo in definicion["columnas"].items():
+        if columna not in df.columns or df[columna].dtype == tipo:
+            continue
+        if tipo == "int64":
+            valores = df[columna].to_numpy(dtype=np.float64)
+            if np.isnan(valores).any() or (valores != np.round(valores)).any():
+                raise ValueError(f"Los datos no cumplen con el esquema '{esquema}': la columna '{columna}' debe ser entera.")
+        tipos[columna] = tipo
+    try:
+        df = df.astype(tipos)
+    except (ValueError, TypeError) as error:
+        raise ValueError(f"Los datos no cumplen con el esquema '{esquema}': {error}")
+
+    return df
+
+# Cargar archivo de datos
+def Cargar_Datos(ruta: str, esquema: str = "ohlcv", sidecar: bool = True) -> pd.DataFrame:
+
+    """
+    Carga un archivo CSV de la carpeta 'datos' con los tipos de dato fijos del esquema (sin inferirlos), usando el motor
+    de pyarrow si está instalado.
+
+    La primera vez que se lee un CSV se guarda una copia binaria (Parquet) junto a él ('{ruta}.parquet'); las siguientes
+    lecturas usan esa copia mientras el CSV no se modifique (se compara la fecha de modificación de ambos archivos).
+
+    Parámetros:
+    -----------
+    ruta : str
+        Ruta del archivo CSV.
+
+    esquema : str, opcional
+        Esquema del archivo ('ohlcv' para velas o 'sectores'; por defecto, 'ohlcv').
+
+    sidecar : bool, opcional
+        Si es True, se lee y guarda la copia binaria del archivo (True por defecto).
+
+    Salida:
+    -------
+    return : pd.DataFrame : Datos validados.
+    """
+
+    if esquema not in esquemas:
+        raise ValueError(f"Esquema '{esquema}' no reconocido (opciones: {list(esquemas)}).")
+    ruta_sidecar = ruta + ".parquet"
+    sidecar = sidecar and pyarrow_disponible
+    # Leer la copia binaria si está actualizada
+    if sidecar and os.path.isfile(ruta_sidecar) and os.path.getmtime(ruta_sidecar) >= os.path.getmtime(ruta):
+        return Validar_Esquema(pd.read_parquet(ruta_sidecar), esquema)
+    # Leer el CSV con tipos fijos (las columnas enteras se leen como flotantes y se validan al convertirlas)
+    columnas = pd.read_csv(ruta, nrows=0).columns
+    tipos = {columna: ("float64" if tipo == "int64" else tipo) for columna, tipo in esquemas[esquema]["columnas"].items()
+             if columna in columnas}
+    df = pd.read_csv(ruta, dtype=tipos, engine="pyarrow" if pyarrow_disponible else "c")
+    df = df.set_index(df.columns[0])
+    if df.index.name is not None and (df.index.name == "" or df.index.name.startswith("Unnamed")):
+        df.index.name = None
+    df = Validar_Esquema(df, esquema)
+    # Guardar la copia binaria
+    if sidecar:
+        try:
+            df.to_parquet(ruta_sidecar)
+        except OSError:
+            pass
+
+    return df
+
+# Recordatorio:
+if __name__ == "__main__":
+    # Cargar los archivos de la carpeta 'datos' (la segunda lectura usa la copia binaria)
+    df = Cargar_Datos("../datos/datos_historicos.csv", esquema="ohlcv")
+    print(df.dtypes)
+    sectores = Cargar_Datos("../datos/sectores.csv", esquema="sectores")
+    print(sectores.dtypes)
+    print(sectores["Sector"].value_counts())
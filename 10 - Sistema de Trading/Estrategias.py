@@ -2,6 +2,8 @@
 # Importar librerías
 ...
 # Librerías Propias
+from BarrasCompactas import Aplicar_Precision
+from indicadores.GrafoIndicadores import GrafoIndicadores
 from estrategias.Estrategia1 import Estrategia1
 from estrategias.Estrategia2 import Estrategia2
 from estrategias.Estrategia3 import Estrategia3
@@ -14,7 +16,7 @@ class EstrategiasTrading:
     """
     
     # __init__
-    def __init__(self, parametros_estrategias: dict) -> None:
+    def __init__(self, parametros_estrategias: dict, precision: str = "float64", incrementales: list = None) -> None:
         
         """
         Constructor.
@@ -22,14 +24,31 @@ class EstrategiasTrading:
         Parámetros:
         -----------
         parametros_estrategias : dict
-            Diccionario con los parámetros específicos para cada estrategia
+            Diccionario con los parámetros específicos para cada estrategia. Los datos ('df') pueden ser un pd.DataFrame,
+            BarrasCompactas o BarrasMemoria. Las estrategias que reciben los mismos datos comparten un GrafoIndicadores,
+            por lo que sus cálculos intermedios comunes (TR, medias exponenciales, medias móviles, ...) se calculan una
+            sola vez.
+            
+        precision : str, opcional
+            Tipo de dato de los precios con el que se calculan las estrategias (por defecto, 'float64'). Si es None, se
+            conserva el de los datos.
+            
+        incrementales : list, opcional
+            Nombres de las estrategias que se calculan en modo incremental (solo la última vela, con el método
+            .calcular_incremental() de la estrategia). Para aprovecharlo, la instancia se debe conservar entre ciclos y
+            actualizar con .actualizar() (por defecto, ninguna).
             
         Salida:
         -------
         return : NoneType : None
         """
         
-        # Definir atributos e Inicializar Estrategias
+        # Definir atributos
+        self.precision = precision
+        self.incrementales = list(incrementales) if incrementales is not None else []
+        
+        # Preparar los datos e Inicializar Estrategias
+        parametros_estrategias = self.__preparar_datos(parametros_estrategias)
         self.estrategias = {
             
             "Estrategia1": Estrategia1(**parametros_estrategias.get("Estrategia1", {})),
@@ -43,6 +62,48 @@ class EstrategiasTrading:
     def __repr__(self):
         return self.__class__.__name__ + ".class"
     
+    # Preparar datos
+    def __preparar_datos(self, parametros_estrategias: dict) -> dict:
+        
+        """
+        Convierte los datos de cada estrategia a la precisión de cálculo (una sola vez por conjunto de datos) y les asigna
+        el grafo de cálculos intermedios de esos datos.
+        """
+        
+        parametros_estrategias = {nombre: dict(parametros) for nombre, parametros in parametros_estrategias.items()}
+        datos = {}
+        for parametros in parametros_estrategias.values():
+            if "df" in parametros:
+                if id(parametros["df"]) not in datos:
+                    df = Aplicar_Precision(parametros["df"], self.precision)
+                    datos[id(parametros["df"])] = (df, GrafoIndicadores(df))
+                parametros["df"], parametros["grafo"] = datos[id(parametros["df"])]
+        
+        return parametros_estrategias
+    
+    # Actualizar datos
+    def actualizar(self, parametros_estrategias: dict) -> None:
+        
+        """
+        Cambia los datos de las estrategias existentes (por ejemplo, las velas del siguiente ciclo) sin crearlas de nuevo,
+        para que las estrategias incrementales conserven su estado.
+        
+        Parámetros:
+        -----------
+        parametros_estrategias : dict
+            Diccionario con los parámetros de cada estrategia (solo se usan los datos, 'df').
+            
+        Salida:
+        -------
+        return : NoneType : None
+        """
+        
+        parametros_estrategias = self.__preparar_datos(parametros_estrategias)
+        for nombre, estrategia in self.estrategias.items():
+            parametros = parametros_estrategias.get(nombre, {})
+            if "df" in parametros:
+                estrategia.df, estrategia.grafo = parametros["df"], parametros["grafo"]
+    
     # Ejecutar/Correr/Calcular Estrategia
     def calcular_estrategia(self, nombre_estrategia: str) -> dict:
         
@@ -63,6 +124,8 @@ class EstrategiasTrading:
             estrategia = self.estrategias.get(nombre_estrategia, None)
             if estrategia is None:
                 raise ValueError(f"Estrategia '{nombre_estrategia}' no ha sido encontrada.")
+            if nombre_estrategia in self.incrementales and hasattr(estrategia, "calcular_incremental"):
+                return estrategia.calcular_incremental()
             return estrategia.calcular()
         except Exception as error:
             print(f"Error ejecutando {nombre_estrategia}: {error}")
@@ -96,11 +159,14 @@ class EstrategiasTrading:
 # Recordatorio:
 if __name__ == "__main__":
     # Importar librerías adicionales
-    import yfinance as yf
+    from config import config
+    from ProveedoresDatos import Crear_Proveedor
     # Obtener Datos
-    df_est1 = yf.download("AMZN", start="2023-06-01", end="2024-01-01")
-    df_est2 = yf.download("TSLA", start="2023-06-01", end="2024-01-01")
-    df_est3 = yf.download("AAPL", start="2023-06-01", end="2024-01-01")
+    proveedor = Crear_Proveedor(config.proveedor_datos)
+    datos = proveedor.descargar(["AMZN", "TSLA", "AAPL"], intervalo="1d", inicio="2023-06-01", fin="2024-01-01")
+    df_est1 = datos["AMZN"]
+    df_est2 = datos["TSLA"]
+    df_est3 = datos["AAPL"]
     # Definir parámetros
     estrategia1_params = {"df": df_est1, "longitud": 30, "longitud_ema": 34, "columna": "Close", "valores_indicador": [0, 4]}
     estrategia2_params = {"df": df_est2, "DMI": {}, "SM": {}}
@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 # Importar librerías
-import yfinance as yf
+import pandas as pd
 import json
 # Librerías Propias
-from config.config import activos
+from config.config import activos, proveedor_datos
+from ProveedoresDatos import Crear_Proveedor
+
+# Proveedor de datos
+proveedor = Crear_Proveedor(proveedor_datos)
 
 # Umbral de correlación (correlaciones menores a este valaor serán consideradas bajas)
 umbral = 0.5
@@ -16,7 +20,8 @@ for tipo, lista_activos in activos.items():
     print(f"Analizando: {tipo}")
     
     # Descargar los datos históricos
-    datos = yf.download(lista_activos, period="1y")["Close"]
+    datos = proveedor.descargar(lista_activos, intervalo="1d", periodo="1y")
+    datos = pd.DataFrame({activo: df["Close"] for activo, df in datos.items()})
     
     # Calcular la matriz de correlación
     correlacion = datos.corr()
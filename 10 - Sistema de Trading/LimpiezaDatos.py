@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+# Importar librerías
+import numpy as np
+import pandas as pd
+# Librerías Propias
+from BarrasCompactas import BarrasCompactas
+
+# Políticas de limpieza disponibles
+politicas_limpieza = ["eliminar", "rellenar", "ninguna"]
+
+# Limpiar velas
+def Limpiar_Velas(df: pd.DataFrame, politica: str = "eliminar") -> pd.DataFrame:
+
+    """
+    Limpia las velas de un activo según la política indicada.
+
+    Parámetros:
+    -----------
+    df : pd.DataFrame
+        Velas del activo (columnas OHLCV).
+
+    politica : str, opcional
+        Qué hacer con las velas incompletas:
+
+            - 'eliminar': elimina las velas con algún valor faltante (por defecto).
+            - 'rellenar': rellena los precios faltantes (incluidas las velas vacías) con el último cierre conocido y el
+                          volumen faltante con 0.
+            - 'ninguna': solo elimina las velas sin ningún valor.
+
+    Salida:
+    -------
+    return : pd.DataFrame : Velas limpias.
+    """
+
+    if politica not in politicas_limpieza:
+        raise ValueError(f"Política de limpieza '{politica}' no reconocida (opciones: {politicas_limpieza}).")
+    if politica == "eliminar":
+        return df.dropna()
+    if politica == "ninguna":
+        return df.dropna(how="all")
+    if not df.isna().values.any():
+        return df
+    # Rellenar precios con el último cierre y volumen con 0
+    df = df.copy()
+    cierre = df["Close"].ffill()
+    for columna in df.columns:
+        if columna == "Volume":
+            df[columna] = df[columna].fillna(0)
+        elif columna in ["Close", "Adj Close"]:
+            df[columna] = df[columna].ffill()
+        else:
+            df[columna] = df[columna].fillna(cierre)
+
+    return df.dropna()
+
+# Definir clase
+class LimpiezaDatos:
+
+    """
+    Etapa de limpieza del Sistema de Trading: separa los datos de un lote en un pd.DataFrame por activo, los limpia una
+    sola vez y los guarda en caché. Todas las estrategias de un activo reciben el mismo pd.DataFrame, por lo que se debe
+    tratar como de solo lectura (las estrategias crean sus propios DataFrames para los cálculos).
+
+    Si en el siguiente ciclo las velas de un activo no cambiaron (mismo número de velas, mismas fechas inicial y final y
+    misma versión en el almacén, ver AlmacenDatos.version), se reutiliza el resultado en caché. La versión cambia con
+    cada combinación en el almacén, por lo que también detecta las velas intermedias corregidas por el proveedor; si no
+    se indica, se compara la última vela.
+    """
+
+    # __init__
+    def __init__(self, politica: str = "eliminar", precision: str = None) -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        politica : str, opcional
+            Política de limpieza ('eliminar', 'rellenar' o 'ninguna'; ver Limpiar_Velas).
+
+        precision : str, opcional
+            Si se indica (por ejemplo, 'float32'), las velas limpias se guardan como BarrasCompactas con esa precisión
+            (ver config.precision["barras"]).
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        if politica not in politicas_limpieza:
+            raise ValueError(f"Política de limpieza '{politica}' no reconocida (opciones: {politicas_limpieza}).")
+        # Definir atributos
+        self.politica = politica
+        self.precision = precision
+        # Atributos Privados
+        self.__cache = {}
+
+
+    # __repr__
+    def __repr__(self):
+        return self.__class__.__name__ + ".class"
+
+    # Limpiar un activo
+    def limpiar(self, activo: str, intervalo: str, df: pd.DataFrame, version: int = None) -> pd.DataFrame:
+
+        """
+        Limpia las velas de un activo (o las toma de la caché si no cambiaron).
+
+        Parámetros:
+        -----------
+        activo : str
+            Símbolo del activo.
+
+        intervalo : str
+            Intervalo de las velas.
+
+        df : pd.DataFrame
+            Velas del activo.
+
+        version : int, opcional
+            Versión de los datos del activo en el almacén (ver AlmacenDatos.version). Si no se indica, se compara la
+            última vela.
+
+        Salida:
+        -------
+        return : pd.DataFrame|BarrasCompactas : Velas limpias (compartidas, de solo lectura).
+        """
+
+        if df.empty:
+            firma = (df.shape, None, None, version)
+        else:
+            firma = (df.shape, df.index[0], df.index[-1],
+                     version if version is not None else df.iloc[-1].to_numpy(dtype=np.float64).tobytes())
+        guardado = self.__cache.get((activo, intervalo), None)
+        if guardado is not None and guardado[0] == firma:
+            return guardado[1]
+        limpio = Limpiar_Velas(df, self.politica)
+        if self.precision is not None:
+            limpio = BarrasCompactas.desde_dataframe(limpio, precision=self.precision)
+        self.__cache[(activo, intervalo)] = (firma, limpio)
+
+        return limpio
+
+    # Separar y limpiar un lote
+    def separar(self, datos, intervalo: str, versiones: dict = None) -> dict:
+
+        """
+        Separa los datos de un lote en un pd.DataFrame limpio por activo.
+
+        Parámetros:
+        -----------
+        datos : dict|pd.DataFrame
+            Datos del lote ({activo: pd.DataFrame} o pd.DataFrame con columnas (activo, columna)).
+
+        intervalo : str
+            Intervalo de las velas.
+
+        versiones : dict, opcional
+            Versión de los datos de cada activo en el almacén ({activo: int}, ver limpiar).
+
+        Salida:
+        -------
+        return : dict : Velas limpias de cada activo ({activo: pd.DataFrame}).
+        """
+
+        if isinstance(datos, pd.DataFrame):
+            datos = {activo: datos[activo] for activo in datos.columns.get_level_values(0).unique()} if not datos.empty else {}
+
+        versiones = versiones if versiones is not None else {}
+
+        return {activo: self.limpiar(activo, intervalo, df, versiones.get(activo)) for activo, df in datos.items()}
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+# Importar librerías
+import os
+import re
+import threading
+import pandas as pd
+# Librerías Propias
+from CargadorDatos import Cargar_Datos
+
+# Convertir un periodo ('5d', '1mo', '1y', 'max', ...) a un desplazamiento de fechas
+def Periodo_a_Desplazamiento(periodo: str) -> pd.DateOffset:
+
+    """
+    Convierte un periodo con el formato de Yahoo Finance a un desplazamiento de fechas.
+
+    Parámetros:
+    -----------
+    periodo : str
+        Periodo (por ejemplo, '5d', '1wk', '1mo', '1y' o 'max').
+
+    Salida:
+    -------
+    return : pd.DateOffset|None : Desplazamiento equivalente, o None si el periodo es 'max'.
+    """
+
+    if periodo is None or periodo == "max":
+        return None
+    coincidencia = re.fullmatch(r"(\d+)(d|wk|mo|y)", periodo)
+    if coincidencia is None:
+        raise ValueError(f"Periodo '{periodo}' no reconocido.")
+    cantidad, unidad = int(coincidencia.group(1)), coincidencia.group(2)
+    unidades = {"d": "days", "wk": "weeks", "mo": "months", "y": "years"}
+
+    return pd.DateOffset(**{unidades[unidad]: cantidad})
+
+# Definir clase base
+class ProveedorDatos:
+
+    """
+    Interfaz de los proveedores de datos históricos (OHLCV). Todas las partes del Sistema de Trading obtienen sus datos a
+    través de un proveedor, por lo que se puede cambiar la fuente de datos sin modificar el resto del código.
+    
+    El atributo 'max_concurrencia' define cuántas descargas simultáneas admite el proveedor (el Sistema de Trading no
+    lanza más peticiones en paralelo que este límite).
+    """
+    
+    max_concurrencia = 1
+
+    # __repr__
+    def __repr__(self):
+        return self.__class__.__name__ + ".class"
+
+    # Descargar datos
+    def descargar(self, activos: list, intervalo: str, inicio: pd.Timestamp = None, fin: pd.Timestamp = None,
+                  periodo: str = None) -> dict:
+
+        """
+        Obtiene los datos de varios activos.
+
+        Parámetros:
+        -----------
+        activos : list
+            Símbolos de los activos.
+
+        intervalo : str
+            Intervalo de las velas (por ejemplo, '1m' o '1d').
+
+        inicio : pd.Timestamp, opcional
+            Fecha de la primera vela a obtener.
+
+        fin : pd.Timestamp, opcional
+            Fecha límite (exclusiva) de las velas a obtener.
+
+        periodo : str, opcional
+            Periodo a obtener cuando no se especifica 'inicio' (por ejemplo, '5d' o 'max').
+
+        Salida:
+        -------
+        return : dict : Diccionario {activo: pd.DataFrame} (los activos sin datos no se incluyen).
+        """
+
+        raise NotImplementedError(f"{self.__class__.__name__} debe implementar el método 'descargar'.")
+
+# Proveedor: Yahoo Finance
+class ProveedorYahoo(ProveedorDatos):
+
+    """
+    Proveedor de datos de Yahoo Finance (yfinance).
+    
+    yf.download guarda sus resultados en un diccionario global por activo, por lo que dos descargas simultáneas de los 
+    mismos activos (en distintos intervalos) pueden mezclar sus datos. Por ello las llamadas se serializan con un candado;
+    cada llamada ya descarga sus activos en paralelo y, mientras tanto, el sistema puede evaluar las estrategias de los
+    lotes que ya llegaron.
+    """
+    
+    max_concurrencia = 1
+    # Atributos Privados
+    __candado = threading.Lock()
+
+    # Descargar datos
+    def descargar(self, activos: list, intervalo: str, inicio: pd.Timestamp = None, fin: pd.Timestamp = None,
+                  periodo: str = None) -> dict:
+
+        import yfinance as yf # pip install yfinance
+        # Descargar
+        with self.__candado:
+            if inicio is not None:
+                df = yf.download(activos, interval=intervalo, start=inicio, end=fin, group_by="ticker", progress=False)
+            else:
+                df = yf.download(activos, interval=intervalo, period=periodo, end=fin, group_by="ticker", progress=False)
+        if not isinstance(df.columns, pd.MultiIndex):
+            df.columns = pd.MultiIndex.from_product([activos, df.columns])
+
+        return {activo: df[activo].dropna(how="all") for activo in activos if activo in df.columns.get_level_values(0)}
+
+# Proveedor: Archivos locales (CSV/Parquet)
+class ProveedorLocal(ProveedorDatos):
+
+    """
+    Proveedor de datos que reproduce archivos locales (CSV o Parquet), sin necesidad de conexión a internet. Los archivos
+    se buscan, en este orden, en:
+
+        1. El diccionario 'archivos' ({activo: ruta} o {intervalo: {activo: ruta}}).
+        2. {directorio}/{intervalo}/{activo}.parquet o {directorio}/{intervalo}/{activo}.csv
+
+    Cada archivo se lee una sola vez y se mantiene en memoria, por lo que las pruebas de carga son deterministas. Los
+    archivos CSV se leen con el esquema de velas de CargadorDatos (tipos fijos, validación y copia binaria).
+    """
+    
+    max_concurrencia = 8
+
+    # __init__
+    def __init__(self, archivos: dict = None, directorio: str = None) -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        archivos : dict, opcional
+            Rutas de los archivos por activo ({activo: ruta}) o por intervalo y activo ({intervalo: {activo: ruta}}).
+
+        directorio : str, opcional
+            Directorio con los archivos organizados como {intervalo}/{activo}.parquet o {intervalo}/{activo}.csv.
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.archivos = archivos if archivos is not None else {}
+        self.directorio = directorio
+        # Atributos Privados
+        self.__cache = {}
+        self.__candado = threading.Lock()
+
+
+    # Buscar archivo
+    def ruta_archivo(self, activo: str, intervalo: str) -> str:
+
+        """
+        Busca el archivo de un activo en un intervalo.
+
+        Parámetros:
+        -----------
+        activo : str
+            Símbolo del activo.
+
+        intervalo : str
+            Intervalo de las velas.
+
+        Salida:
+        -------
+        return : str|None : Ruta del archivo o None si no existe.
+        """
+
+        por_intervalo = self.archivos.get(intervalo, None)
+        if isinstance(por_intervalo, dict) and activo in por_intervalo:
+            return por_intervalo[activo]
+        if isinstance(self.archivos.get(activo, None), str):
+            return self.archivos[activo]
+        if self.directorio is not None:
+            for extension in ["parquet", "csv"]:
+                ruta = os.path.join(self.directorio, intervalo, f"{activo}.{extension}")
+                if os.path.isfile(ruta):
+                    return ruta
+
+        return None
+
+    # Leer archivo
+    def leer(self, ruta: str) -> pd.DataFrame:
+
+        """
+        Lee (una sola vez) un archivo de velas.
+
+        Parámetros:
+        -----------
+        ruta : str
+            Ruta del archivo CSV o Parquet.
+
+        Salida:
+        -------
+        return : pd.DataFrame : Velas ordenadas por fecha.
+        """
+
+        with self.__candado:
+            if ruta not in self.__cache:
+                if ruta.endswith(".parquet"):
+                    df = pd.read_parquet(ruta)
+                else:
+                    df = Cargar_Datos(ruta, esquema="ohlcv")
+                self.__cache[ruta] = df.sort_index()
+
+        return self.__cache[ruta]
+
+    # Descargar datos
+    def descargar(self, activos: list, intervalo: str, inicio: pd.Timestamp = None, fin: pd.Timestamp = None,
+                  periodo: str = None) -> dict:
+
+        datos = {}
+        for activo in activos:
+            ruta = self.ruta_archivo(activo, intervalo)
+            if ruta is None:
+                continue
+            df = self.leer(ruta)
+            tz = df.index.tz
+            # Filtrar por fecha final
+            if fin is not None:
+                df = df[df.index < self.__ajustar_zona(fin, tz)]
+            # Filtrar por fecha inicial o por periodo
+            if inicio is not None:
+                df = df[df.index >= self.__ajustar_zona(inicio, tz)]
+            elif Periodo_a_Desplazamiento(periodo) is not None and not df.empty:
+                df = df[df.index > df.index[-1] - Periodo_a_Desplazamiento(periodo)]
+            if not df.empty:
+                datos[activo] = df
+
+        return datos
+
+    # Ajustar la zona horaria de una fecha a la del índice
+    @staticmethod
+    def __ajustar_zona(fecha: pd.Timestamp, tz) -> pd.Timestamp:
+        fecha = pd.Timestamp(fecha)
+        if tz is None:
+            return fecha.tz_convert(None) if fecha.tz is not None else fecha
+        return fecha.tz_localize(tz) if fecha.tz is None else fecha.tz_convert(tz)
+
+# Crear proveedor a partir de la configuración
+def Crear_Proveedor(configuracion: dict) -> ProveedorDatos:
+
+    """
+    Crea el proveedor de datos definido en la configuración.
+
+    Parámetros:
+    -----------
+    configuracion : dict
+        Configuración del proveedor (ver config.proveedor_datos). La clave 'nombre' define el proveedor ('yahoo' o
+        'local'), la clave opcional 'max_concurrencia' define el límite de descargas simultáneas y el resto de claves se
+        pasan a su constructor.
+
+    Salida:
+    -------
+    return : ProveedorDatos : Proveedor de datos.
+    """
+
+    proveedores = {"yahoo": ProveedorYahoo, "local": ProveedorLocal}
+    parametros = dict(configuracion)
+    nombre = parametros.pop("nombre", "yahoo")
+    max_concurrencia = parametros.pop("max_concurrencia", None)
+    if nombre not in proveedores:
+        raise ValueError(f"Proveedor de datos '{nombre}' no ha sido encontrado.")
+    proveedor = proveedores[nombre](**parametros)
+    if max_concurrencia is not None:
+        proveedor.max_concurrencia = max_concurrencia
+
+    return proveedor
+
+# Recordatorio:
+if __name__ == "__main__":
+    # Reproducir los datos históricos guardados en la carpeta 'datos'
+    proveedor = ProveedorLocal(archivos={"AAPL": "../datos/datos_historicos.csv"})
+    datos = proveedor.descargar(["AAPL"], intervalo="1d", inicio="2023-06-01", fin="2023-07-01")
+    print(datos["AAPL"])
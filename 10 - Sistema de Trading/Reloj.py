@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# Importar librerías
+import time
+import pandas as pd
+
+# Reloj real
+class RelojReal:
+
+    """
+    Reloj del sistema: la hora actual es la del equipo y esperar detiene la ejecución.
+    """
+
+    # __repr__
+    def __repr__(self):
+        return self.__class__.__name__ + ".class"
+
+    # Hora actual
+    def ahora(self, tz=None) -> pd.Timestamp:
+
+        """
+        Regresa la hora actual.
+
+        Parámetros:
+        -----------
+        tz : str|tzinfo, opcional
+            Zona horaria (por defecto, la hora local sin zona horaria).
+
+        Salida:
+        -------
+        return : pd.Timestamp : Hora actual.
+        """
+
+        return pd.Timestamp.now(tz=tz)
+
+    # Esperar
+    def dormir(self, segundos: float) -> None:
+
+        """
+        Detiene la ejecución durante el número de segundos indicado.
+
+        Parámetros:
+        -----------
+        segundos : float
+            Segundos a esperar.
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        time.sleep(segundos)
+
+# Reloj simulado
+class RelojSimulado(RelojReal):
+
+    """
+    Reloj simulado para reproducir datos históricos: la hora actual es una hora simulada y esperar solo adelanta esa hora,
+    sin detener la ejecución.
+    """
+
+    # __init__
+    def __init__(self, inicio: pd.Timestamp) -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        inicio : pd.Timestamp
+            Hora inicial de la simulación (si no tiene zona horaria, se asume UTC).
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        inicio = pd.Timestamp(inicio)
+        self.actual = inicio.tz_localize("UTC") if inicio.tz is None else inicio
+
+
+    # Hora actual
+    def ahora(self, tz=None) -> pd.Timestamp:
+        return self.actual.tz_convert(tz) if tz is not None else self.actual.tz_convert(None)
+
+    # Esperar
+    def dormir(self, segundos: float) -> None:
+        self.actual = self.actual + pd.Timedelta(seconds=segundos)
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+# Importar librerías
+import pandas as pd
+# Librerías Propias
+from ProveedoresDatos import Periodo_a_Desplazamiento
+
+# Reglas de remuestreo de pandas para cada intervalo intradía
+reglas_remuestreo = {
+
+    "1m": "1min",
+    "2m": "2min",
+    "5m": "5min",
+    "15m": "15min",
+    "30m": "30min",
+    "60m": "60min",
+    "1h": "60min"
+
+    }
+
+# Agregación de cada columna OHLCV
+agregaciones_ohlcv = {
+
+    "Open": "first",
+    "High": "max",
+    "Low": "min",
+    "Close": "last",
+    "Adj Close": "last",
+    "Volume": "sum"
+
+    }
+
+# Velas cerradas
+def Velas_Cerradas(df: pd.DataFrame, intervalo: str, ahora: pd.Timestamp) -> pd.DataFrame:
+
+    """
+    Descarta las últimas velas que todavía no han cerrado (una descarga en vivo incluye la vela que se está formando).
+
+    Parámetros:
+    -----------
+    df : pd.DataFrame
+        Velas ordenadas por fecha (el índice es la hora de apertura de cada vela).
+
+    intervalo : str
+        Intervalo de las velas (por ejemplo, '1m').
+
+    ahora : pd.Timestamp
+        Hora actual.
+
+    Salida:
+    -------
+    return : pd.DataFrame : Velas cuya apertura más la duración del intervalo no supera la hora actual.
+    """
+
+    if df.empty:
+        return df
+    fin = df.index.searchsorted(ahora - pd.Timedelta(reglas_remuestreo[intervalo]), side="right")
+
+    return df if fin == len(df) else df.iloc[:fin]
+
+# Remuestrear velas
+def Remuestrear_Velas(df: pd.DataFrame, intervalo: str, intervalo_base: str = "1m", ahora: pd.Timestamp = None,
+                      incluir_parciales: bool = False) -> pd.DataFrame:
+
+    """
+    Construye velas de un intervalo mayor (por ejemplo, 5m o 15m) a partir de velas de un intervalo menor (por ejemplo,
+    1m).
+
+    Las velas se alinean con el inicio del día en la zona horaria de los datos (las velas de 5m de una acción de Nueva
+    York empiezan a las 9:30, 9:35, ...) y solo se generan velas para los periodos con datos, por lo que los cierres de
+    mercado (noches, fines de semana, festivos) no producen velas vacías.
+
+    Parámetros:
+    -----------
+    df : pd.DataFrame
+        Velas del intervalo base (columnas OHLCV).
+
+    intervalo : str
+        Intervalo de las velas a construir (por ejemplo, '5m').
+
+    intervalo_base : str, opcional
+        Intervalo de las velas de 'df' (por defecto, '1m').
+
+    ahora : pd.Timestamp, opcional
+        Hora actual. Si se especifica, se ignoran las velas base que todavía no cierran y la última vela se entrega solo
+        cuando ya pasó su final (aunque le falten velas base, por ejemplo, si el mercado cerró antes). Si no se
+        especifica, la última vela se considera completa cuando las velas base llegan a su final.
+
+    incluir_parciales : bool, opcional
+        Si es True, se incluye la última vela aunque todavía no haya cerrado (False por defecto).
+
+    Salida:
+    -------
+    return : pd.DataFrame : Velas remuestreadas.
+    """
+
+    regla = reglas_remuestreo[intervalo]
+    if not incluir_parciales and ahora is not None:
+        df = Velas_Cerradas(df, intervalo_base, ahora)
+    agregaciones = {columna: funcion for columna, funcion in agregaciones_ohlcv.items() if columna in df.columns}
+    velas = df.resample(regla, label="left", closed="left", origin="start_day").agg(agregaciones)
+    # Eliminar los periodos sin datos (fuera de la sesión)
+    velas = velas.dropna(subset=["Open"])
+    # Eliminar la última vela si todavía no ha cerrado
+    if not incluir_parciales and not velas.empty:
+        fin_vela = velas.index[-1] + pd.Timedelta(regla)
+        fin_datos = df.index[-1] + pd.Timedelta(reglas_remuestreo[intervalo_base])
+        if (ahora < fin_vela) if ahora is not None else (fin_datos < fin_vela):
+            velas = velas.iloc[:-1]
+
+    return velas
+
+# Definir clase
+class RemuestreoIncremental:
+
+    """
+    Mantiene las velas remuestreadas de un activo y, a medida que llegan velas base nuevas, solo recalcula las velas a
+    partir de la última vela que ya se tenía (que pudo haber estado incompleta). Las velas pueden sembrarse con un
+    histórico descargado directamente en el intervalo (más largo que el de las velas base) y se recortan al periodo.
+    """
+
+    # __init__
+    def __init__(self, intervalo: str, intervalo_base: str = "1m", incluir_parciales: bool = False,
+                 periodo: str = None) -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        intervalo : str
+            Intervalo de las velas a construir (por ejemplo, '5m').
+
+        intervalo_base : str, opcional
+            Intervalo de las velas base (por defecto, '1m').
+
+        incluir_parciales : bool, opcional
+            Si es True, se incluye la última vela aunque todavía no haya cerrado (False por defecto).
+
+        periodo : str, opcional
+            Periodo de velas remuestreadas que se conserva (por ejemplo, '1mo'; por defecto, no se recortan).
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.intervalo = intervalo
+        self.intervalo_base = intervalo_base
+        self.incluir_parciales = incluir_parciales
+        self.periodo = periodo
+        # Atributos Privados
+        self.__velas = None
+        self.__desplazamiento = Periodo_a_Desplazamiento(periodo)
+
+
+    # __repr__
+    def __repr__(self):
+        return self.__class__.__name__ + ".class"
+
+    # Sembrar
+    def sembrar(self, velas: pd.DataFrame) -> None:
+
+        """
+        Inicia las velas remuestreadas con un histórico del intervalo (por ejemplo, descargado directamente), de modo
+        que el calentamiento de los indicadores no quede limitado al periodo de las velas base.
+
+        Parámetros:
+        -----------
+        velas : pd.DataFrame
+            Velas históricas del intervalo (la última puede estar incompleta; se recalcula con las velas base).
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        if velas is not None and not velas.empty:
+            self.__velas = velas[[columna for columna in agregaciones_ohlcv if columna in velas.columns]]
+
+    # Actualizar
+    def actualizar(self, df: pd.DataFrame, ahora: pd.Timestamp = None) -> pd.DataFrame:
+
+        """
+        Actualiza las velas remuestreadas con las velas base.
+
+        Parámetros:
+        -----------
+        df : pd.DataFrame
+            Velas del intervalo base (pueden ser todas las velas; solo se procesan las posteriores al inicio de la última
+            vela remuestreada).
+
+        ahora : pd.Timestamp, opcional
+            Hora actual (ver Remuestrear_Velas).
+
+        Salida:
+        -------
+        return : pd.DataFrame : Velas remuestreadas actualizadas.
+        """
+
+        # Ignorar las velas base que todavía no cierran
+        if not self.incluir_parciales and ahora is not None:
+            df = Velas_Cerradas(df, self.intervalo_base, ahora)
+        if df.empty and self.__velas is None:
+            return df
+        # Recalcular todo si no hay velas previas o si las velas base empiezan después de ellas
+        if not df.empty and (self.__velas is None or self.__velas.empty or df.index[0] > self.__velas.index[-1]):
+            self.__velas = Remuestrear_Velas(df, self.intervalo, self.intervalo_base, incluir_parciales=True)
+        # Recalcular solo desde la última vela (posiblemente incompleta), si hay velas base desde su inicio
+        elif not df.empty and df.index[-1] >= self.__velas.index[-1]:
+            desde = self.__velas.index[-1]
+            nuevas = Remuestrear_Velas(df.iloc[df.index.searchsorted(desde):], self.intervalo, self.intervalo_base,
+                                       incluir_parciales=True)
+            self.__velas = pd.concat([self.__velas.iloc[:-1], nuevas])
+        # Recortar al periodo
+        if self.__desplazamiento is not None and not self.__velas.empty:
+            inicio = self.__velas.index[-1] - self.__desplazamiento
+            if self.__velas.index[0] < inicio:
+                self.__velas = self.__velas[self.__velas.index >= inicio]
+        # Revisar si la última vela está completa (con reloj, solo cuando ya pasó su final)
+        velas = self.__velas
+        if not self.incluir_parciales and not velas.empty:
+            fin_vela = velas.index[-1] + pd.Timedelta(reglas_remuestreo[self.intervalo])
+            if ahora is not None:
+                parcial = ahora < fin_vela
+            else:
+                parcial = df.empty or df.index[-1] + pd.Timedelta(reglas_remuestreo[self.intervalo_base]) < fin_vela
+            if parcial:
+                velas = velas.iloc[:-1]
+
+        return velas
+
+# Remuestrear un lote de activos
+def Remuestrear_Lote(datos: dict, intervalo: str, remuestreos: dict, intervalo_base: str = "1m", reloj=None,
+                     incluir_parciales: bool = False, periodo: str = None, semillas: dict = None) -> dict:
+
+    """
+    Remuestrea las velas de varios activos manteniendo un RemuestreoIncremental por activo e intervalo.
+
+    Parámetros:
+    -----------
+    datos : dict
+        Velas base de cada activo ({activo: pd.DataFrame}).
+
+    intervalo : str
+        Intervalo de las velas a construir.
+
+    remuestreos : dict
+        Diccionario {(activo, intervalo): RemuestreoIncremental} que se conserva entre llamadas.
+
+    intervalo_base : str, opcional
+        Intervalo de las velas base (por defecto, '1m').
+
+    reloj : RelojReal, opcional
+        Reloj con el que se decide si la última vela ya cerró (ver Remuestrear_Velas).
+
+    incluir_parciales : bool, opcional
+        Si es True, se incluye la última vela aunque todavía no haya cerrado (False por defecto).
+
+    periodo : str, opcional
+        Periodo de velas remuestreadas que se conserva por activo (por defecto, no se recortan).
+
+    semillas : dict, opcional
+        Histórico del intervalo con el que se siembran los remuestreos nuevos ({activo: pd.DataFrame}).
+
+    Salida:
+    -------
+    return : dict : Velas remuestreadas de cada activo ({activo: pd.DataFrame}).
+    """
+
+    velas = {}
+    for activo, df in datos.items():
+        clave = (activo, intervalo)
+        if clave not in remuestreos:
+            remuestreos[clave] = RemuestreoIncremental(intervalo, intervalo_base, incluir_parciales, periodo)
+            if semillas is not None:
+                remuestreos[clave].sembrar(semillas.get(activo))
+        ahora = reloj.ahora(tz=df.index.tz) if reloj is not None and not df.empty else None
+        velas[activo] = remuestreos[clave].actualizar(df, ahora=ahora)
+
+    return velas
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# Importar librerías
+import time
+import tempfile
+import numpy as np
+import pandas as pd
+# Librerías Propias
+import SistemaTrading
+from AlmacenDatos import AlmacenDatos, duracion_intervalos
+from ProveedoresDatos import ProveedorDatos
+from Reloj import RelojSimulado
+
+# Proveedor de reproducción
+class ProveedorReproduccion(ProveedorDatos):
+
+    """
+    Envuelve a otro proveedor para que solo entregue las velas que ya habían cerrado a la hora del reloj simulado (es
+    decir, aquellas cuya apertura más la duración del intervalo no supera la hora simulada).
+    """
+
+    # __init__
+    def __init__(self, proveedor: ProveedorDatos, reloj: RelojSimulado) -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        proveedor : ProveedorDatos
+            Proveedor con los datos históricos (normalmente un ProveedorLocal).
+
+        reloj : RelojSimulado
+            Reloj de la simulación.
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.proveedor = proveedor
+        self.reloj = reloj
+        self.max_concurrencia = proveedor.max_concurrencia
+
+
+    # Descargar datos
+    def descargar(self, activos: list, intervalo: str, inicio: pd.Timestamp = None, fin: pd.Timestamp = None,
+                  periodo: str = None) -> dict:
+
+        ahora = self.reloj.ahora(tz="UTC")
+        fin = ahora if fin is None else min(pd.Timestamp(fin), ahora)
+        datos = self.proveedor.descargar(activos, intervalo, inicio=inicio, fin=fin, periodo=periodo)
+        # Descartar las velas que todavía no cerraban (el índice de cada vela es su hora de apertura)
+        limite = ahora - duracion_intervalos[intervalo]
+        cerradas = {}
+        for activo, df in datos.items():
+            df = df[df.index <= (limite if df.index.tz is not None else limite.tz_convert(None))]
+            if not df.empty:
+                cerradas[activo] = df
+
+        return cerradas
+
+# Reproducir el Sistema de Trading
+def Reproducir_Sistema(proveedor: ProveedorDatos, inicio: str, fin: str, verbose: bool = False) -> dict:
+
+    """
+    Ejecuta el mismo ciclo del Sistema de Trading (SistemaTrading.EjecutarSistema) sobre datos históricos, con un reloj
+    simulado que avanza un minuto por ciclo sin esperar. Sirve para medir el rendimiento del sistema (ciclos por segundo
+    y latencia de cada etapa) antes de ponerlo en producción.
+
+    Parámetros:
+    -----------
+    proveedor : ProveedorDatos
+        Proveedor con los datos históricos a reproducir (normalmente un ProveedorLocal).
+
+    inicio : str
+        Hora simulada del primer ciclo.
+
+    fin : str
+        Hora simulada en la que termina la reproducción.
+
+    verbose : bool, opcional
+        Si es True, imprime las posiciones detectadas en cada ciclo (False por defecto).
+
+    Salida:
+    -------
+    return : dict : Reporte con el número de ciclos, la duración real, los ciclos por segundo y un pd.DataFrame con
+                    las latencias de cada etapa (en milisegundos).
+    """
+
+    # Preparar la simulación (el almacén se crea en un directorio temporal)
+    reloj = RelojSimulado(inicio)
+    max_ciclos = int((pd.Timestamp(fin) - pd.Timestamp(inicio)) / pd.Timedelta(seconds=60))
+    with tempfile.TemporaryDirectory() as ruta:
+        almacen = AlmacenDatos(ruta=ruta, proveedor=ProveedorReproduccion(proveedor, reloj), reloj=reloj)
+        inicio_reproduccion = time.perf_counter()
+        metricas = SistemaTrading.EjecutarSistema(reloj=reloj, almacen=almacen, max_ciclos=max_ciclos, verbose=verbose)
+        duracion = time.perf_counter() - inicio_reproduccion
+
+    # Resumir latencias por etapa
+    latencias = {}
+    for etapa, valores in metricas["latencias"].items():
+        valores = np.array(valores) * 1_000
+        if valores.shape[0] == 0:
+            continue
+        latencias[etapa] = {"llamadas": valores.shape[0], "media": valores.mean(), "p50": np.percentile(valores, 50),
+                            "p95": np.percentile(valores, 95), "max": valores.max()}
+
+    return {"ciclos": metricas["ciclos"], "segundos": duracion,
+            "ciclos_por_segundo": metricas["ciclos"] / duracion if duracion > 0 else np.nan,
+            "latencias": pd.DataFrame(latencias).T}
+
+# Recordatorio:
+if __name__ == "__main__":
+    # Importar librerías adicionales
+    from ProveedoresDatos import ProveedorLocal
+    # Reproducir un día de trading con archivos locales ({directorio}/{intervalo}/{activo}.csv|parquet)
+    proveedor = ProveedorLocal(directorio="datos_locales")
+    reporte = Reproducir_Sistema(proveedor, inicio="2024-01-02 14:30", fin="2024-01-02 21:00")
+    print(f"Ciclos: {reporte['ciclos']} - Duración: {reporte['segundos']:.2f} s - Ciclos por segundo: {reporte['ciclos_por_segundo']:.2f}")
+    print("Latencias por etapa (ms):\n\n", reporte["latencias"])
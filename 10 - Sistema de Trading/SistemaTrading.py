@@ -1,73 +1,195 @@
 # -*- coding: utf-8 -*-
 # Importar librerías
-import yfinance as yf
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 # Librerías Propias
 from config import config
+from AlmacenDatos import AlmacenDatos
 from Estrategias import EstrategiasTrading
+from LimpiezaDatos import LimpiezaDatos
+from Reloj import RelojReal
+from Remuestreo import Remuestrear_Lote
+
+# Obtener datos de un lote de activos
+def Obtener_Datos(almacen: AlmacenDatos, limpieza: LimpiezaDatos, instrumentos: list, intervalo: str, periodo: str,
+                  derivados: list = None, remuestreos: dict = None, periodos: dict = None) -> tuple:
+    
+    """
+    Obtiene los datos de un lote de activos en un intervalo (y, opcionalmente, los remuestrea a intervalos mayores), los
+    separa y limpia por activo y mide el tiempo que tomó.
+    
+    Parámetros:
+    -----------
+    almacen : AlmacenDatos
+        Almacén del que se obtienen las velas.
+        
+    limpieza : LimpiezaDatos
+        Etapa de limpieza con la que se preparan las velas de cada activo.
+        
+    instrumentos : list
+        Símbolos de los activos.
+        
+    intervalo : str
+        Intervalo de las velas.
+        
+    periodo : str
+        Periodo a descargar si no hay datos almacenados.
+        
+    derivados : list, opcional
+        Intervalos que se construyen remuestreando las velas obtenidas (ver config.remuestreo).
+        
+    remuestreos : dict, opcional
+        Remuestreos incrementales de cada activo e intervalo, que se conservan entre ciclos.
+        
+    periodos : dict, opcional
+        Periodo de cada intervalo derivado ({intervalo: periodo}). La primera vez que se remuestrea un activo, su histórico
+        se siembra descargando este periodo directamente en el intervalo derivado (el periodo de las velas base suele ser
+        más corto) y las velas remuestreadas se recortan a él.
+        
+    Salida:
+    -------
+    return : tuple : Datos del lote ({intervalo: {activo: velas limpias}}) y latencia en segundos.
+    """
+    
+    inicio = time.perf_counter()
+    velas = almacen.obtener(instrumentos, intervalo=intervalo, periodo=periodo, por_activo=True)
+    # La versión del almacén indica a la limpieza si las velas cambiaron (también para los intervalos derivados)
+    versiones = {activo: almacen.version(activo, intervalo) for activo in velas}
+    datos = {intervalo: limpieza.separar(velas, intervalo, versiones)}
+    # Construir los intervalos mayores a partir de las velas obtenidas
+    for intervalo_derivado in (derivados if derivados else []):
+        periodo_derivado = periodos.get(intervalo_derivado, periodo) if periodos else periodo
+        # Sembrar una sola vez el histórico de los activos que todavía no se remuestrean
+        semillas = None
+        faltantes = [activo for activo in velas if (activo, intervalo_derivado) not in remuestreos]
+        if periodos and len(faltantes) > 0:
+            semillas = almacen.obtener(faltantes, intervalo=intervalo_derivado, periodo=periodo_derivado, por_activo=True)
+        remuestreadas = Remuestrear_Lote(velas, intervalo_derivado, remuestreos, intervalo_base=intervalo,
+                                         reloj=almacen.reloj, incluir_parciales=config.remuestreo["incluir_parciales"],
+                                         periodo=periodo_derivado, semillas=semillas)
+        datos[intervalo_derivado] = limpieza.separar(remuestreadas, intervalo_derivado, versiones)
+    
+    return datos, time.perf_counter() - inicio
 
 # Ejecutar Sistema
-def EjecutarSistema():
+def EjecutarSistema(reloj: RelojReal = None, almacen: AlmacenDatos = None, max_ciclos: int = None,
+                    verbose: bool = True) -> dict:
     
     """
     Esta función tiene la responsabilidad de implementar diversas estrategias de trading para múltiples activos en una
     variedad de marcos de tiempo.
+    
+    Parámetros:
+    -----------
+    reloj : RelojReal, opcional
+        Reloj usado para esperar entre ciclos (por defecto, el reloj del sistema). Con un RelojSimulado los ciclos se
+        ejecutan sin esperas.
+        
+    almacen : AlmacenDatos, opcional
+        Almacén del que se obtienen las velas (por defecto, se crea uno con la configuración y el reloj).
+        
+    max_ciclos : int, opcional
+        Número máximo de ciclos a ejecutar (por defecto, se ejecuta indefinidamente).
+        
+    verbose : bool, opcional
+        Si es True, imprime las posiciones detectadas en cada ciclo (True por defecto).
+        
+    Salida:
+    -------
+    return : dict : Métricas de la ejecución: número de ciclos y latencias (en segundos) de cada etapa ('datos',
+                    'estrategias' y 'ciclo').
     """
     
+    reloj = reloj if reloj is not None else RelojReal()
+    almacen = almacen if almacen is not None else AlmacenDatos(reloj=reloj)
+    metricas = {"ciclos": 0, "latencias": {"datos": [], "estrategias": [], "ciclo": []}}
+    
     marcos_tiempo = config.marcos_tiempo
+    horizontes = {intervalo: horizonte for horizonte, ventanas_tiempo in marcos_tiempo.items() for intervalo in ventanas_tiempo}
+    intervalos_remuestreo = config.remuestreo["intervalos"] if config.remuestreo["activo"] else []
+    remuestreos = {}
+    estrategias_activos = {}
+    incrementales = config.incremental["estrategias"] if config.incremental["activo"] else []
+    limpieza = LimpiezaDatos(politica=config.limpieza["politica"], precision=config.precision["barras"])
     tiempos_espera = {"1m": 60, "5m": 300, "15m": 900}
     tiempo_restante_ejecucion = {"1m": 60, "5m": 300, "15m": 900}
     periodo_descarga = {"1m": "5d", "5m": "1mo", "15m": "1mo", "1d": "1y", "1wk": "5y", "1mo": "max"}
     posiciones_intradia = []
     posiciones_no_intradia = []
     marcos_ejecutar = ["1m", "5m", "15m", "1d", "1wk", "1mo"]
-    while True:
+    ejecutor = ThreadPoolExecutor(max_workers=almacen.proveedor.max_concurrencia)
+    while max_ciclos is None or metricas["ciclos"] < max_ciclos:
+        inicio_ciclo = time.perf_counter()
+        # Lanzar todas las descargas del ciclo en paralelo
+        tareas = {}
         for tipo_activo, instrumentos in config.activos.items():
             for horizonte, ventanas_tiempo in marcos_tiempo.items():
                 for intervalo in ventanas_tiempo:
-                    # Revisar si se debe de ejecutar
-                    if intervalo not in marcos_ejecutar:
+                    # Revisar si se debe de ejecutar (los intervalos remuestreados se construyen con el intervalo base)
+                    if intervalo not in marcos_ejecutar or intervalo in intervalos_remuestreo:
+                        continue
+                    derivados = []
+                    if intervalo == config.remuestreo["base"]:
+                        derivados = [derivado for derivado in intervalos_remuestreo if derivado in marcos_ejecutar]
+                    # Obtener datos (primero del almacén local y, si no están vigentes, descargarlos)
+                    tarea = ejecutor.submit(Obtener_Datos, almacen, limpieza, instrumentos, intervalo,
+                                            periodo_descarga[intervalo], derivados, remuestreos, periodo_descarga)
+                    tareas[tarea] = instrumentos
+        # Ejecutar las estrategias de cada lote en cuanto termina su descarga
+        for tarea in as_completed(tareas):
+            instrumentos = tareas[tarea]
+            datos, latencia = tarea.result()
+            metricas["latencias"]["datos"].append(latencia)
+            for intervalo, velas in datos.items():
+                horizonte = horizontes[intervalo]
+                # Ejecutar Estrategias
+                for activo in instrumentos:
+                    if activo not in velas:
                         continue
-                    # Descargar datos
-                    df = yf.download(instrumentos, interval=intervalo, period=periodo_descarga[intervalo])
-                    # Cambiar Nivel de Columnas
-                    df.columns = df.columns.swaplevel(0, 1)
-                    # Ejecutar Estrategias
-                    for activo in instrumentos:
-                        parametros_estrategias = config.parametros_estrategias
-                        # Agregar datos a parámetros
-                        parametros_estrategias["Estrategia1"]["df"] = df[activo].dropna()
-                        parametros_estrategias["Estrategia2"]["df"] = df[activo].dropna()
-                        parametros_estrategias["Estrategia3"]["df"] = df[activo].dropna()
-                        # Crear Instancia
-                        Estrategias = EstrategiasTrading(parametros_estrategias)
-                        # Calcular Estrategias
-                        calculo_estrategias = Estrategias.calcular_todas(verbose=False)
-                        # Revisar si hay señales y almacenar información
-                        if horizonte == "intradia":
-                            if isinstance(calculo_estrategias["Estrategia1"], dict):
-                                posiciones_intradia.append({activo: calculo_estrategias["Estrategia1"], "intervalo": intervalo,
-                                                            "Estrategia": "Estrategia1"})
-                            if isinstance(calculo_estrategias["Estrategia2"], dict):
-                                posiciones_intradia.append({activo: calculo_estrategias["Estrategia2"], "intervalo": intervalo,
-                                                            "Estrategia": "Estrategia2"})
-                            if isinstance(calculo_estrategias["Estrategia3"], dict):
-                                posiciones_intradia.append({activo: calculo_estrategias["Estrategia3"], "intervalo": intervalo,
-                                                            "Estrategia": "Estrategia3"})
-                        else:
-                            if isinstance(calculo_estrategias["Estrategia1"], dict):
-                                posiciones_no_intradia.append({activo: calculo_estrategias["Estrategia1"], "intervalo": intervalo,
-                                                            "Estrategia": "Estrategia1"})
-                            if isinstance(calculo_estrategias["Estrategia2"], dict):
-                                posiciones_no_intradia.append({activo: calculo_estrategias["Estrategia2"], "intervalo": intervalo,
-                                                            "Estrategia": "Estrategia2"})
-                            if isinstance(calculo_estrategias["Estrategia3"], dict):
-                                posiciones_no_intradia.append({activo: calculo_estrategias["Estrategia3"], "intervalo": intervalo,
-                                                            "Estrategia": "Estrategia3"})
+                    parametros_estrategias = config.parametros_estrategias
+                    # Agregar datos a parámetros (las tres estrategias comparten las mismas velas limpias)
+                    parametros_estrategias["Estrategia1"]["df"] = velas[activo]
+                    parametros_estrategias["Estrategia2"]["df"] = velas[activo]
+                    parametros_estrategias["Estrategia3"]["df"] = velas[activo]
+                    # Crear Instancia (o actualizar la del ciclo anterior para conservar el estado incremental)
+                    Estrategias = estrategias_activos.get((activo, intervalo), None)
+                    if Estrategias is None:
+                        Estrategias = EstrategiasTrading(parametros_estrategias, precision=config.precision["resultados"],
+                                                         incrementales=incrementales)
+                        if len(incrementales) > 0:
+                            estrategias_activos[(activo, intervalo)] = Estrategias
+                    else:
+                        Estrategias.actualizar(parametros_estrategias)
+                    # Calcular Estrategias
+                    inicio_etapa = time.perf_counter()
+                    calculo_estrategias = Estrategias.calcular_todas(verbose=False)
+                    metricas["latencias"]["estrategias"].append(time.perf_counter() - inicio_etapa)
+                    # Revisar si hay señales y almacenar información
+                    if horizonte == "intradia":
+                        if isinstance(calculo_estrategias["Estrategia1"], dict):
+                            posiciones_intradia.append({activo: calculo_estrategias["Estrategia1"], "intervalo": intervalo,
+                                                        "Estrategia": "Estrategia1"})
+                        if isinstance(calculo_estrategias["Estrategia2"], dict):
+                            posiciones_intradia.append({activo: calculo_estrategias["Estrategia2"], "intervalo": intervalo,
+                                                        "Estrategia": "Estrategia2"})
+                        if isinstance(calculo_estrategias["Estrategia3"], dict):
+                            posiciones_intradia.append({activo: calculo_estrategias["Estrategia3"], "intervalo": intervalo,
+                                                        "Estrategia": "Estrategia3"})
+                    else:
+                        if isinstance(calculo_estrategias["Estrategia1"], dict):
+                            posiciones_no_intradia.append({activo: calculo_estrategias["Estrategia1"], "intervalo": intervalo,
+                                                        "Estrategia": "Estrategia1"})
+                        if isinstance(calculo_estrategias["Estrategia2"], dict):
+                            posiciones_no_intradia.append({activo: calculo_estrategias["Estrategia2"], "intervalo": intervalo,
+                                                        "Estrategia": "Estrategia2"})
+                        if isinstance(calculo_estrategias["Estrategia3"], dict):
+                            posiciones_no_intradia.append({activo: calculo_estrategias["Estrategia3"], "intervalo": intervalo,
+                                                        "Estrategia": "Estrategia3"})
         
         # Imprimir Información
-        print("\n\nSistema Intradía:\n\n", posiciones_intradia)
-        print("\n\nSistema No-Intradía:\n\n", posiciones_no_intradia)
+        if verbose:
+            print("\n\nSistema Intradía:\n\n", posiciones_intradia)
+            print("\n\nSistema No-Intradía:\n\n", posiciones_no_intradia)
         
         # Reiniciar listas
         posiciones_intradia.clear()
@@ -83,8 +205,16 @@ def EjecutarSistema():
                 # Substraer diferencia en el tiempo de espera
                 tiempo_restante_ejecucion[clave] = tiempo_restante_ejecucion[clave] - 60
                 
+        # Registrar métricas del ciclo
+        metricas["latencias"]["ciclo"].append(time.perf_counter() - inicio_ciclo)
+        metricas["ciclos"] += 1
+                
         # Dormir entre cada iteración
-        time.sleep(60)
+        reloj.dormir(60)
+    
+    ejecutor.shutdown()
+    
+    return metricas
                         
 # Recordatorio:
 if __name__ == "__main__":
@@ -45,6 +45,73 @@ marcos_tiempo = {
 
     }
 
+# Proveedor de datos ("yahoo" para Yahoo Finance o "local" para reproducir archivos CSV/Parquet sin conexión) y número
+# máximo de descargas simultáneas
+proveedor_datos = {
+    
+    "nombre": "yahoo",
+    "max_concurrencia": 1
+    
+    }
+
+# Ejemplo de proveedor local:
+# proveedor_datos = {
+#     
+#     "nombre": "local",
+#     "max_concurrencia": 8,
+#     "archivos": {"AAPL": "../datos/datos_historicos.csv"},
+#     "directorio": "datos_locales"
+#     
+#     }
+
+# Almacén local de datos (Parquet)
+almacen = {
+    
+    "ruta": "almacen",
+    "incremental": True
+    
+    }
+
+# Remuestreo local: las velas de los intervalos en 'intervalos' se construyen a partir de las velas del intervalo 'base'
+# (una sola descarga sirve a todos los marcos intradía). Como el periodo de las velas base es más corto (5 días para
+# '1m'), el histórico de cada intervalo derivado se siembra una sola vez con su propio periodo de descarga (1 mes) y
+# después solo se actualiza con las velas base. Si 'incluir_parciales' es False, cada vela se entrega solo cuando ha
+# cerrado.
+remuestreo = {
+    
+    "activo": True,
+    "base": "1m",
+    "intervalos": ["5m", "15m"],
+    "incluir_parciales": False
+    
+    }
+
+# Política de precisión: 'barras' define el tipo de dato con el que se mantienen los precios de las velas (None para
+# conservar los pd.DataFrame originales o "float32" para usar BarrasCompactas, con la mitad de memoria) y 'resultados'
+# el tipo de dato con el que se calculan los indicadores y las estrategias
+precision = {
+    
+    "barras": None,
+    "resultados": "float64"
+    
+    }
+
+# Limpieza de datos: política para las velas incompletas ("eliminar", "rellenar" o "ninguna")
+limpieza = {
+    
+    "politica": "eliminar"
+    
+    }
+
+# Modo incremental: las estrategias indicadas conservan el estado de sus indicadores entre ciclos (por activo e intervalo)
+# y solo procesan las velas nuevas; si el historial se revisa, se recalculan completas
+incremental = {
+    
+    "activo": True,
+    "estrategias": ["Estrategia1", "Estrategia2", "Estrategia3"]
+    
+    }
+
 # Parámetros de estrategias
 parametros_estrategias = {
     
@@ -7,7 +7,9 @@ import matplotlib.pyplot as plt
 from warnings import filterwarnings
 filterwarnings("ignore")
 # Librerías Propias
-...
+from indicadores.GrafoIndicadores import GrafoIndicadores
+from indicadores.Primitivas import Niveles_Chop_Zone
+from indicadores import Streaming
 
 # Clase Estrategia
 class Estrategia1:
@@ -106,7 +108,7 @@ class Estrategia1:
     
     # __init__
     def __init__(self, df: pd.DataFrame, longitud: int = 30, longitud_ema: int = 34, columna: str = "Close",
-                 valores_indicador: list = [0, 4]) -> None:
+                 valores_indicador: list = [0, 4], grafo: GrafoIndicadores = None) -> None:
         
         """
         Inicialización de la Clase
@@ -122,6 +124,9 @@ class Estrategia1:
         param : str : columna : Columna a ser usada en el cálculo del CZ (por defecto, se establece en 'Close').
         ----------
         param : list : valores_indicador : Valores que definen las fases del indicador CZ (por defecto, se establece en [0, 4]).
+        ----------
+        param : GrafoIndicadores : grafo : Grafo de cálculos intermedios compartido con otras estrategias del mismo activo
+                                           (por defecto, se crea uno propio).
         
         Salida
         -------
@@ -134,6 +139,7 @@ class Estrategia1:
         self.longitud_ema = longitud_ema
         self.columna = columna
         self.valores_indicador = valores_indicador
+        self.grafo = grafo
         self.estrategia_calculo = None
         self.rendimiento_final_estrategia = 0.0
          
@@ -151,6 +157,7 @@ class Estrategia1:
             8: "neutral"
             
             }
+        self.__estado = Streaming.EstadoIncremental()
     
     # __repr__
     def __repr__(self) -> str:
@@ -201,33 +208,30 @@ class Estrategia1:
         return: dict|bool : Un diccionario si se ha generado una señal en la última vela o False si no se ha producido nada.
         """
         
+        # Grafo de cálculos intermedios (compartido si los datos son los mismos)
+        grafo = self.grafo if self.grafo is not None and self.grafo.df is self.df else GrafoIndicadores(self.df)
+        
         # Calcular precios típicos y rangos
-        columna_precio = self.df[self.columna]
-        TP = (self.df["High"] + self.df["Low"] + self.df["Close"]) / 3
-        precio_suavizado = columna_precio.rolling(window = self.longitud, min_periods=self.longitud)
-        max_suavizado = precio_suavizado.max()
-        min_suavizado = precio_suavizado.min()
+        TP = grafo.tp()
+        max_suavizado = grafo.maximo(self.columna, self.longitud)
+        min_suavizado = grafo.minimo(self.columna, self.longitud)
         rango_HL = 25 / (max_suavizado - min_suavizado) * min_suavizado
         
         # Calcular la EMA y el ángulo de la EMA
-        ema = self.df[self.columna].ewm(span=self.longitud_ema, min_periods=self.longitud_ema, adjust=False).mean()
+        ema = grafo.ema(self.columna, self.longitud_ema)
         x1_ema = 0
         x2_ema = 1
         y1_ema = 0
         y2_ema = (ema.shift(periods=1) - ema) / TP * rango_HL
         c_ema = np.sqrt((x2_ema - x1_ema) ** 2 + (y2_ema - y1_ema) ** 2)
         angulo_ema0 = round(np.rad2deg(np.arccos((x2_ema - x1_ema) / c_ema)))
-        angulo_ema1 = np.where(y2_ema > 0, - angulo_ema0, angulo_ema0)[max(self.longitud, self.longitud_ema):]
-        CZ = np.where(angulo_ema1 >= 5, 0,
-             np.where((angulo_ema1 >= 3.57) & (angulo_ema1 < 5), 1,
-             np.where((angulo_ema1 >= 2.14) & (angulo_ema1 < 3.57), 2,
-             np.where((angulo_ema1 >= 0.71) & (angulo_ema1 < 2.14), 3,
-             np.where(angulo_ema1 <= -5, 4,
-             np.where((angulo_ema1 <= -3.57) & (angulo_ema1 > -5), 5,
-             np.where((angulo_ema1 <= -2.14) & (angulo_ema1 > -3.57), 6,
-             np.where((angulo_ema1 <= -0.71) & (angulo_ema1 > -2.14), 7, 8))))))))
-        
-        CZ = pd.Series([np.nan] * max(self.longitud, self.longitud_ema) + CZ.tolist(), index=self.df.index, name="CZ")
+        angulo_ema1 = np.where(y2_ema > 0, - angulo_ema0, angulo_ema0)
+        
+        # Niveles del Chop Zone (las primeras velas quedan vacías)
+        inicio = max(self.longitud, self.longitud_ema)
+        CZ = np.full(self.df.shape[0], np.nan)
+        CZ[inicio:] = Niveles_Chop_Zone(angulo_ema1[inicio:])
+        CZ = pd.Series(CZ, index=self.df.index, name="CZ")
         
         # Guardar cálculo del indicador como atributo
         self.estrategia_calculo = CZ
@@ -244,6 +248,46 @@ class Estrategia1:
         return valor
     
     
+    # Calcular (Modo Incremental)
+    def calcular_incremental(self) -> dict:
+        
+        """
+        Este método calcula el Indicador de Chop Zone solo en la última vela, sin recalcular todo el historial. El estado
+        del indicador (EMA y deques monótonos del máximo y el mínimo móviles) se guarda entre llamadas y solo se procesan
+        las velas agregadas desde la llamada anterior; si cambian los parámetros o se revisa el historial, el estado se
+        reconstruye (ver Streaming.EstadoIncremental).
+        
+        A diferencia de 'calcular', no se guarda la serie completa del indicador ('estrategia_calculo' queda en None
+        hasta que se ejecute 'calcular').
+        
+        Salida
+        -------
+        return: dict|bool : Un diccionario si se ha generado una señal en la última vela o False si no se ha producido nada.
+        """
+        
+        # La serie completa ya no corresponde a los datos actuales
+        self.estrategia_calculo = None
+        if self.df.shape[0] == 0:
+            return False
+        columnas = list(dict.fromkeys(["High", "Low", "Close", self.columna]))
+        parametros = (self.longitud, self.longitud_ema, self.columna)
+        crear = lambda: {"CZ": Streaming.ChopZone(self.longitud, self.longitud_ema, self.columna)}
+        
+        # Actualizar el estado con las velas nuevas y evaluar la última vela
+        valores, _ = self.__estado.evaluar(self.df, columnas, parametros, crear)
+        
+        # Revisar si se generó una señal (alcista fuerte o bajista fuerte)
+        ultimo_valor = valores["CZ"]
+        if ultimo_valor == 0:
+            valor = {"tendencia_actual": self.__valores_tendencia[0]}
+        elif ultimo_valor == 4:
+            valor = {"tendencia_actual": self.__valores_tendencia[4]}
+        else:
+            valor = False
+        
+        return valor
+    
+    
     # Optimizar
     def optimizar(self, rango_longitud: list, rango_longitud_ema: list) -> pd.DataFrame:
         
@@ -1,14 +1,15 @@
 # Librerías Estándar
 import pandas as pd
 import numpy as np
-from copy import deepcopy
 from itertools import product
 import mplfinance as mpf
 import matplotlib.pyplot as plt
 from warnings import filterwarnings
 filterwarnings("ignore")
 # Librerías Propias
-...
+from indicadores.GrafoIndicadores import GrafoIndicadores
+from indicadores.Primitivas import Suavizado_Wilder
+from indicadores import Streaming
 
 # Clase Estrategia
 class Estrategia2:
@@ -145,7 +146,10 @@ class Estrategia2:
                     "desviacion_std_bb": 2.0,
                     ... -> Todos los argumentos disponibles para este Indicador
                     
-                    }
+                    },
+                
+                grafo = GrafoIndicadores -> Grafo de cálculos intermedios compartido con otras estrategias del mismo
+                                            activo (por defecto, se crea uno propio).
                 
         Salida
         -------
@@ -157,11 +161,12 @@ class Estrategia2:
         self.usar_dmi = usar_dmi
         self.DMI = kwargs.get("DMI", {})
         self.SM = kwargs.get("SM", {})
+        self.grafo = kwargs.get("grafo", None)
         self.estrategia_calculo = None
         self.direccion_mercado = None
         self.rendimiento_final_estrategia = 0.0
         # Atributos Privados
-        ...
+        self.__estado = Streaming.EstadoIncremental()
         
     
     # __repr__
@@ -169,6 +174,25 @@ class Estrategia2:
         return self.__class__.__name__ + ".class"
     
     
+    # Cálculos de la estrategia
+    @property
+    def estrategia_calculo(self) -> dict:
+        
+        """
+        Series de los indicadores ({'DMI': ..., 'SM': ...}). Si la última ejecución fue incremental, se calculan con
+        .calcular() solo cuando se piden (por ejemplo, desde el backtest o el gráfico).
+        """
+        
+        if self.__calculo_pendiente:
+            self.calcular()
+        return self.__estrategia_calculo
+    
+    @estrategia_calculo.setter
+    def estrategia_calculo(self, valor: dict) -> None:
+        self.__estrategia_calculo = valor
+        self.__calculo_pendiente = False
+    
+    
     # Backtest
     def backtest(self) -> pd.Series:
         
@@ -222,17 +246,15 @@ class Estrategia2:
                             y Squeeze Momentum si se genera una señal, o False si no se detecta ninguna señal.
         """
         
+        # Grafo de cálculos intermedios (compartido si los datos son los mismos)
+        grafo = self.grafo if self.grafo is not None and self.grafo.df is self.df else GrafoIndicadores(self.df)
+        
         #################### Calcular Índice de Movimiento Direccional ####################
         
         # Revisar si debe usar DMI
         if self.usar_dmi:
             # Calcular el Rango Verdadero
-            High, Low = self.df["High"], self.df["Low"]
-            H_minus_L = High - Low
-            prev_clo = self.df["Close"].shift(periods=1)
-            H_minus_PC = abs(High - prev_clo)
-            L_minus_PC = abs(prev_clo - Low)
-            TR = pd.Series(np.max([H_minus_L, H_minus_PC, L_minus_PC], axis=0), index=self.df.index, name="TR")
+            TR = grafo.tr()
             
             # Calcular los Movimientos Direccionales (+DM y -DM)
             pre_PDM = self.df["High"].diff().dropna()
@@ -240,28 +262,21 @@ class Estrategia2:
             plus_DM = pre_PDM.where((pre_PDM > pre_MDM.values) & (pre_PDM > 0), 0)
             minus_DM = pre_MDM.where((pre_MDM > pre_PDM.values) & (pre_MDM > 0), 0)
             
-            # Calcular los valores iniciales para las sumas suavizadas de TR, +DM, -DM
-            TRL = [np.nansum(TR[:self.DMI.get("suavizado_ADX", 14) + 1])]
-            PDML = [plus_DM[:self.DMI.get("suavizado_ADX", 14)].sum()]
-            MDML = [minus_DM[:self.DMI.get("suavizado_ADX", 14)].sum()]
-            factor = 1 - 1 / self.DMI.get("suavizado_ADX", 14)
-    
-            # Calcular las sumas suavizadas de TR, +DM y -DM utilizando el método Wilder
-            for i in range(0, int(self.df.shape[0] - self.DMI.get("suavizado_ADX", 14) - 1)):
-                TRL.append(TRL[i] * factor + TR[self.DMI.get("suavizado_ADX", 14) + i + 1])
-                PDML.append(PDML[i] * factor + plus_DM[self.DMI.get("suavizado_ADX", 14) + i])
-                MDML.append(MDML[i] * factor + minus_DM[self.DMI.get("suavizado_ADX", 14) + i])
+            # Calcular las sumas suavizadas de TR, +DM y -DM utilizando el método Wilder (a partir de sus valores iniciales)
+            suavizado = self.DMI.get("suavizado_ADX", 14)
+            TRL = Suavizado_Wilder(TR.to_numpy()[suavizado + 1:], suavizado, semilla=np.nansum(TR[:suavizado + 1]), suma=True)
+            PDML = Suavizado_Wilder(plus_DM.to_numpy()[suavizado:], suavizado, semilla=plus_DM[:suavizado].sum(), suma=True)
+            MDML = Suavizado_Wilder(minus_DM.to_numpy()[suavizado:], suavizado, semilla=minus_DM[:suavizado].sum(), suma=True)
                 
             # Calcular los Indicadores Direccionales (+DI y -DI)
-            PDI = np.array(PDML) / np.array(TRL) * 100
-            MDI = np.array(MDML) / np.array(TRL) * 100
+            PDI = PDML / TRL * 100
+            MDI = MDML / TRL * 100
             # Calcular el Indice Direccional (DX)
             DX = np.abs(PDI - MDI) / (PDI + MDI) * 100
-            ADX = [DX[:self.DMI.get("suavizado_ADX", 14)].mean()]
             
             # Calcular el Índice Direccional Promedio (ADX) utilizando la longitud_DI
-            _ = [ADX.append((ADX[i] * (self.DMI.get("longitud_DI", 14) - 1) + \
-                             DX[self.DMI.get("longitud_DI", 14) + i])/self.DMI.get("longitud_DI", 14)) for i in range(int(len(DX) - self.DMI.get("longitud_DI", 14)))]
+            ADX = Suavizado_Wilder(DX[self.DMI.get("longitud_DI", 14):], self.DMI.get("longitud_DI", 14),
+                                   semilla=DX[:suavizado].mean())
             ADXI = pd.DataFrame(PDI, columns=["+DI"], index=self.df.index[-len(PDI):])
             ADXI["-DI"] = MDI
             ADX = pd.DataFrame(ADX, columns=["ADX"], index=self.df.index[-len(ADX):])
@@ -274,27 +289,19 @@ class Estrategia2:
         
         ######################### Calcular Squeeze Momentum (SM) #########################
         
-        df = deepcopy(self.df)
+        df = pd.DataFrame(index=self.df.index)
         
         # Calcular Bandas de Bollinger
-        rolling = df[self.SM.get("columna", "Close")].rolling(window=self.SM.get("longitud_bb", 20), min_periods=self.SM.get("longitud_bb", 20))
-        df["MA"] = rolling.mean()
-        calc_intermedio = self.SM.get("desviacion_std_bb", 2.0) * rolling.std()
+        df["MA"] = grafo.media(self.SM.get("columna", "Close"), self.SM.get("longitud_bb", 20))
+        calc_intermedio = self.SM.get("desviacion_std_bb", 2.0) * grafo.std(self.SM.get("columna", "Close"), self.SM.get("longitud_bb", 20))
         df["BB_Up"] = df["MA"] + calc_intermedio
         df["BB_Lw"] = df["MA"] - calc_intermedio
         
         # Calcular Canales de Keltner
-        EMA = df[self.SM.get("columna", "Close")].ewm(span=self.SM.get("longitud_kc", 20), 
-                                                      min_periods=self.SM.get("longitud_kc", 20), adjust=False).mean()
-        
-        # Subpaso: Calcular Indicador TR
-        High, Low = df["High"], df["Low"]
-        H_minus_L = High - Low
-        prev_cl = df["Close"].shift(periods=1)
-        H_minus_PC = abs(High - prev_cl)
-        L_minus_PC = abs(prev_cl - Low)
-        TR = pd.Series(np.max([H_minus_L, H_minus_PC, L_minus_PC], axis=0), index=df.index, name="TR")
-        TR_EMA = TR.ewm(span=self.SM.get("longitud_kc", 20), min_periods=self.SM.get("longitud_kc", 20), adjust=True).mean()
+        EMA = grafo.ema(self.SM.get("columna", "Close"), self.SM.get("longitud_kc", 20))
+        
+        # Subpaso: Calcular Indicador TR (se calcula una sola vez en el grafo)
+        TR_EMA = grafo.ema("TR", self.SM.get("longitud_kc", 20), adjust=True)
         
         # Cálculo de las Bandas de Keltner
         Banda_KC_Media_Alta = EMA + self.SM.get("multiplicador_kc", 1.5) * TR_EMA
@@ -303,7 +310,7 @@ class Estrategia2:
         KC.columns = ["Banda_KC_Media_Alta", "EMA", "Banda_KC_Media_Baja"]
         
         # Calcular el Indicador de Squeeze Momentum
-        squeeze = df["Close"].diff(periods=self.SM.get("periodos_momentum", 12)).rolling(window=self.SM.get("longitud_momentum", 6),
+        squeeze = self.df["Close"].diff(periods=self.SM.get("periodos_momentum", 12)).rolling(window=self.SM.get("longitud_momentum", 6),
                                                                                          min_periods=self.SM.get("longitud_momentum", 6)).mean()
         
         # Verificar las bandas para obtener distintas condiciones de Squeeze
@@ -334,6 +341,63 @@ class Estrategia2:
         return valor
     
     
+    # Calcular (Modo Incremental)
+    def calcular_incremental(self) -> dict:
+        
+        """
+        Identifica la tendencia actual en la última vela sin recalcular todo el historial. El estado de los indicadores
+        (ventana de las Bandas de Bollinger, EMAs de los Canales de Keltner, buffer del momentum y sumas de Wilder de TR,
+        +DM y -DM) se guarda entre llamadas y solo se procesan las velas agregadas desde la llamada anterior, por lo que
+        cada vela nueva cuesta O(1); si cambian los parámetros o se revisa el historial, el estado se reconstruye (ver
+        Streaming.EstadoIncremental).
+        
+        Las series completas de los indicadores (estrategia_calculo) no se calculan aquí, sino hasta que se piden.
+        
+        Salida
+        -------
+        return: dict|bool : Un diccionario con la tendencia actual ('alcista' o 'bajista') basado en los cálculos de DMI
+                            y Squeeze Momentum si se genera una señal, o False si no se detecta ninguna señal.
+        """
+        
+        # Con menos velas que la semilla del DMI, la versión por lotes usa semillas parciales
+        if self.df.shape[0] == 0 or (self.usar_dmi and self.df.shape[0] <= self.DMI.get("suavizado_ADX", 14)):
+            return self.calcular()
+        columnas = list(dict.fromkeys(["High", "Low", "Close", self.SM.get("columna", "Close")]))
+        parametros = (self.usar_dmi, tuple(self.DMI.items()), tuple(self.SM.items()))
+        crear = lambda: {
+            
+            "SM": Streaming.SqueezeMomentum(self.SM.get("longitud_bb", 20), self.SM.get("desviacion_std_bb", 2.0),
+                                            self.SM.get("longitud_kc", 20), self.SM.get("multiplicador_kc", 1.5),
+                                            self.SM.get("periodos_momentum", 12), self.SM.get("longitud_momentum", 6),
+                                            self.SM.get("columna", "Close")),
+            **({"DMI": Streaming.MovimientoDireccional(self.DMI.get("suavizado_ADX", 14), self.DMI.get("longitud_DI", 14))}
+               if self.usar_dmi else {})
+            
+            }
+        
+        # Actualizar el estado con las velas nuevas y evaluar la última vela
+        valores, _ = self.__estado.evaluar(self.df, columnas, parametros, crear)
+        SQM, ADX = valores["SM"], valores.get("DMI", None)
+        
+        # Las series completas se calculan solo si se piden
+        self.estrategia_calculo = None
+        self.direccion_mercado = None
+        self.__calculo_pendiente = True
+        
+        # Revisar si se generó una señal
+        if self.usar_dmi:
+            if ADX["+DI"] > ADX["-DI"] and SQM["SQZ"] > 0:
+                valor = {"tendencia_actual": "alcista"}
+            elif ADX["+DI"] < ADX["-DI"] and SQM["SQZ"] < 0:
+                valor = {"tendencia_actual": "bajista"}
+            else:
+                valor = False
+        else:
+            valor = {"tendencia_actual": "alcista"} if SQM["SQZ"] >= 0 else {"tendencia_actual": "bajista"}
+        
+        return valor
+    
+    
     # Optimizar
     def optimizar(self, rangos_SM: list, rangos_DMI: list = []) -> pd.DataFrame:
         
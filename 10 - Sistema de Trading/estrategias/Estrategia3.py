@@ -2,13 +2,13 @@
 import pandas as pd
 import numpy as np
 from itertools import product
-from copy import deepcopy
 import mplfinance as mpf
 import matplotlib.pyplot as plt
 from warnings import filterwarnings
 filterwarnings("ignore")
 # Librerías Propias
-...
+from indicadores.GrafoIndicadores import GrafoIndicadores
+from indicadores import Streaming
 
 # Clase Estrategia
 class Estrategia3:
@@ -151,7 +151,10 @@ class Estrategia3:
                     "longitud_lenta": 26,
                     ... -> Todos los argumentos disponibles para este Indicador
                     
-                    }
+                    },
+                
+                grafo = GrafoIndicadores -> Grafo de cálculos intermedios compartido con otras estrategias del mismo
+                                            activo (por defecto, se crea uno propio).
             
         Salida
         -------
@@ -163,11 +166,12 @@ class Estrategia3:
         self.RSI = kwargs.get("RSI", {})
         self.BB = kwargs.get("BB", {})
         self.MACD = kwargs.get("MACD", {})
+        self.grafo = kwargs.get("grafo", None)
         self.estrategia_calculo = None
         self.direccion_mercado = None
         self.rendimiento_final_estrategia = 0.0
         # Atributos Privados
-        ...
+        self.__estado = Streaming.EstadoIncremental()
     
     # __repr__
     def __repr__(self) -> str:
@@ -210,6 +214,9 @@ class Estrategia3:
         return: dict|bool : Regresa un diccionario con la tendencia actual del mercado, o False si no se detectó nada.
         """
         
+        # Grafo de cálculos intermedios (compartido si los datos son los mismos)
+        grafo = self.grafo if self.grafo is not None and self.grafo.df is self.df else GrafoIndicadores(self.df)
+        
         ######################### Calcular Índice de Fuerza Relativa (RSI) #########################
         
         Delta = self.df[self.RSI.get("columna", "Close")].diff(periods=1)
@@ -225,10 +232,10 @@ class Estrategia3:
         
         ######################### Calcular Bandas de Bollinger #################################
         
-        data = deepcopy(self.df)
-        rolling = data[self.BB.get("columna", "Close")].rolling(window=self.BB.get("longitud", 20), min_periods=self.BB.get("longitud", 20))
-        data["MA"] = rolling.mean()
-        calc_intermedio = self.BB.get("std_dev", 2.0) * rolling.std(ddof=self.BB.get("ddof", 0))
+        data = pd.DataFrame(index=self.df.index)
+        data["MA"] = grafo.media(self.BB.get("columna", "Close"), self.BB.get("longitud", 20))
+        calc_intermedio = self.BB.get("std_dev", 2.0) * grafo.std(self.BB.get("columna", "Close"), self.BB.get("longitud", 20),
+                                                                   ddof=self.BB.get("ddof", 0))
         data["BB_Up"] = data["MA"] + calc_intermedio
         data["BB_Down"] = data["MA"] - calc_intermedio
         
@@ -238,10 +245,8 @@ class Estrategia3:
         
         ################################# Calcular MACD #################################
         
-        MA_Rapida = self.df[self.MACD.get("columna", "Close")].ewm(span=self.MACD.get("longitud_rapida", 12), 
-                                                              min_periods=self.MACD.get("longitud_rapida", 12), adjust=False).mean()
-        MA_Lenta = self.df[self.MACD.get("columna", "Close")].ewm(span=self.MACD.get("longitud_lenta", 26), 
-                                                                  min_periods=self.MACD.get("longitud_lenta", 26), adjust=False).mean()
+        MA_Rapida = grafo.ema(self.MACD.get("columna", "Close"), self.MACD.get("longitud_rapida", 12))
+        MA_Lenta = grafo.ema(self.MACD.get("columna", "Close"), self.MACD.get("longitud_lenta", 26))
         # Determinar la línea MACD como la diferencia entre el EMA corto y el EMA largo
         MACD_d = MA_Rapida - MA_Lenta
         # Calcular la línea de señal como el EMA de la línea MACD
@@ -274,6 +279,60 @@ class Estrategia3:
         return tendencia_actual
     
     
+    # Calcular (Modo Incremental)
+    def calcular_incremental(self) -> dict:
+        
+        """
+        Identifica la tendencia actual del mercado en la última vela sin recalcular todo el historial. El estado de los
+        indicadores (medias exponenciales del RSI y del MACD, ventana de las Bandas de Bollinger) se guarda entre llamadas
+        y solo se procesan las velas agregadas desde la llamada anterior; la última vela se evalúa sobre una copia del
+        estado porque puede seguir cambiando (vela en formación).
+        
+        El estado se reconstruye con todo el historial si cambian los parámetros o si se revisa el historial (la última
+        vela confirmada ya no está o cambió). Si solo se descartan las velas más antiguas (ventana de descarga móvil), el
+        estado se conserva: su efecto en las medias exponenciales decae como (1 - alpha)^n.
+        
+        A diferencia de .calcular(), no se guardan las series completas de los indicadores (estrategia_calculo y
+        direccion_mercado quedan en None hasta que se ejecute .calcular()).
+        
+        Salida
+        -------
+        return: dict|bool : Regresa un diccionario con la tendencia actual del mercado, o False si no se detectó nada.
+        """
+        
+        # Las series completas ya no corresponden a los datos actuales
+        self.estrategia_calculo = None
+        self.direccion_mercado = None
+        if self.df.shape[0] == 0:
+            return False
+        columnas = list(dict.fromkeys([self.RSI.get("columna", "Close"), self.BB.get("columna", "Close"),
+                                       self.MACD.get("columna", "Close"), "Close"]))
+        parametros = (tuple(self.RSI.items()), tuple(self.BB.items()), tuple(self.MACD.items()))
+        crear = lambda: {
+            
+            "RSI": Streaming.IndiceFuerzaRelativa(self.RSI.get("longitud", 14), self.RSI.get("columna", "Close")),
+            "BB": Streaming.BandasBollinger(self.BB.get("longitud", 20), self.BB.get("std_dev", 2.0), self.BB.get("ddof", 0),
+                                            self.BB.get("columna", "Close")),
+            "MACD": Streaming.MACD(self.MACD.get("longitud_rapida", 12), self.MACD.get("longitud_lenta", 26),
+                                   self.MACD.get("longitud_señal", 9), self.MACD.get("columna", "Close"))
+            
+            }
+        
+        # Actualizar el estado con las velas nuevas y evaluar la última vela
+        valores, barra = self.__estado.evaluar(self.df, columnas, parametros, crear)
+        RSI, BB, MACD = valores["RSI"], valores["BB"], valores["MACD"]
+        
+        # Generar señal
+        if MACD["MACD"] > MACD["Señal"] and RSI < 50 and barra["Close"] < BB["MA"]:
+            tendencia_actual = {"tendencia_actual": "alcista"}
+        elif MACD["MACD"] < MACD["Señal"] and RSI > 50 and barra["Close"] > BB["MA"]:
+            tendencia_actual = {"tendencia_actual": "bajista"}
+        else:
+            tendencia_actual = False
+        
+        return tendencia_actual
+    
+    
     # Optimizar
     def optimizar(self, rsi_rangos: list, bb_rangos: list, macd_rangos: list, max_iteraciones: int = 10_000) -> pd.DataFrame:
         
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+# Importar librerías
+import numpy as np
+import pandas as pd
+# Librerías Propias
+from indicadores.Primitivas import Extremos_Moviles
+
+# Definir clase
+class GrafoIndicadores:
+
+    """
+    Grafo de cálculos intermedios de los indicadores (Rango Verdadero, ATR, medias exponenciales, medias y desviaciones
+    estándar móviles, ...). Cada nodo se identifica por su nombre, su fuente y sus parámetros, y se calcula una sola vez
+    por versión de los datos: si varias estrategias (o varios indicadores de una misma estrategia) necesitan, por ejemplo,
+    el Rango Verdadero o la media móvil de 20 periodos del cierre, lo reutilizan en lugar de volver a calcularlo.
+
+    Las fuentes de los nodos pueden ser columnas de los datos ('Close', 'High', ...) o nodos sin parámetros ('TR' o 'TP').
+    """
+
+    # __init__
+    def __init__(self, df: pd.DataFrame) -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        df : pd.DataFrame
+            Datos del activo (columnas OHLCV).
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.df = df
+        self.version = 0
+        self.calculos = 0
+        self.reutilizaciones = 0
+        # Atributos Privados
+        self.__nodos = {}
+
+
+    # __repr__
+    def __repr__(self):
+        return self.__class__.__name__ + ".class"
+
+    # Actualizar datos
+    def actualizar(self, df: pd.DataFrame) -> None:
+
+        """
+        Cambia los datos del grafo. Si son otros datos, se descartan todos los nodos calculados (nueva versión).
+
+        Parámetros:
+        -----------
+        df : pd.DataFrame
+            Datos del activo.
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        if df is not self.df:
+            self.df = df
+            self.version += 1
+            self.__nodos.clear()
+
+    # Obtener (o calcular) un nodo
+    def nodo(self, clave: tuple, funcion) -> pd.Series:
+
+        """
+        Regresa el valor de un nodo, calculándolo solo si no se ha calculado para la versión actual de los datos.
+
+        Parámetros:
+        -----------
+        clave : tuple
+            Identificador del nodo (nombre, fuente y parámetros).
+
+        funcion : callable
+            Función sin argumentos que calcula el nodo.
+
+        Salida:
+        -------
+        return : pd.Series : Valor del nodo.
+        """
+
+        if clave in self.__nodos:
+            self.reutilizaciones += 1
+            return self.__nodos[clave]
+        self.calculos += 1
+        valor = funcion()
+        self.__nodos[clave] = valor
+
+        return valor
+
+    # Nodo calculado
+    def calculado(self, clave: tuple) -> bool:
+
+        """
+        Indica si un nodo ya se calculó para la versión actual de los datos.
+        """
+
+        return clave in self.__nodos
+
+    # Fuente de un nodo
+    def serie(self, fuente: str) -> pd.Series:
+
+        """
+        Regresa una columna de los datos o un nodo sin parámetros ('TR' para el Rango Verdadero o 'TP' para el precio
+        típico).
+
+        Parámetros:
+        -----------
+        fuente : str
+            Nombre de la columna o del nodo.
+
+        Salida:
+        -------
+        return : pd.Series : Serie de la fuente.
+        """
+
+        if fuente == "TR":
+            return self.tr()
+        if fuente == "TP":
+            return self.tp()
+
+        return self.nodo(("columna", fuente), lambda: self.df[fuente])
+
+    # Rango Verdadero
+    def tr(self) -> pd.Series:
+
+        """
+        Rango Verdadero: max(High - Low, |High - Close anterior|, |Close anterior - Low|).
+        """
+
+        def calcular():
+            High, Low = self.serie("High"), self.serie("Low")
+            prev_cl = self.serie("Close").shift(periods=1)
+            H_minus_L = High - Low
+            H_minus_PC = abs(High - prev_cl)
+            L_minus_PC = abs(prev_cl - Low)
+            return pd.Series(np.max([H_minus_L, H_minus_PC, L_minus_PC], axis=0), index=self.df.index, name="TR")
+
+        return self.nodo(("TR",), calcular)
+
+    # Precio Típico
+    def tp(self) -> pd.Series:
+
+        """
+        Precio Típico: (High + Low + Close) / 3.
+        """
+
+        return self.nodo(("TP",), lambda: (self.serie("High") + self.serie("Low") + self.serie("Close")) / 3)
+
+    # Rango Verdadero Promedio
+    def atr(self, longitud: int = 14, adjust: bool = True) -> pd.Series:
+
+        """
+        Rango Verdadero Promedio (ATR): media exponencial del Rango Verdadero con alpha = 1 / longitud.
+
+        Parámetros:
+        -----------
+        longitud : int, opcional
+            Ventana del ATR (por defecto, 14).
+
+        adjust : bool, opcional
+            Parámetro 'adjust' de pd.Series.ewm (True por defecto).
+
+        Salida:
+        -------
+        return : pd.Series : ATR.
+        """
+
+        return self.nodo(("ATR", longitud, adjust),
+                         lambda: self.tr().ewm(alpha=1 / longitud, min_periods=longitud, adjust=adjust).mean())
+
+    # Media Móvil Exponencial
+    def ema(self, fuente: str, span: int, min_periods: int = None, adjust: bool = False) -> pd.Series:
+
+        """
+        Media Móvil Exponencial de una fuente.
+
+        Parámetros:
+        -----------
+        fuente : str
+            Columna o nodo sobre el que se calcula (por ejemplo, 'Close' o 'TR').
+
+        span : int
+            Ventana de la media exponencial.
+
+        min_periods : int, opcional
+            Mínimo de observaciones (por defecto, igual a 'span').
+
+        adjust : bool, opcional
+            Parámetro 'adjust' de pd.Series.ewm (False por defecto).
+
+        Salida:
+        -------
+        return : pd.Series : Media exponencial.
+        """
+
+        min_periods = span if min_periods is None else min_periods
+
+        return self.nodo(("EMA", fuente, span, min_periods, adjust),
+                         lambda: self.serie(fuente).ewm(span=span, min_periods=min_periods, adjust=adjust).mean())
+
+    # Media Móvil Simple
+    def media(self, fuente: str, longitud: int) -> pd.Series:
+
+        """
+        Media móvil simple de una fuente (min_periods igual a la longitud).
+
+        Parámetros:
+        -----------
+        fuente : str
+            Columna o nodo sobre el que se calcula.
+
+        longitud : int
+            Ventana de la media.
+
+        Salida:
+        -------
+        return : pd.Series : Media móvil.
+        """
+
+        return self.nodo(("MEDIA", fuente, longitud),
+                         lambda: self.serie(fuente).rolling(window=longitud, min_periods=longitud).mean())
+
+    # Desviación Estándar Móvil
+    def std(self, fuente: str, longitud: int, ddof: int = 1) -> pd.Series:
+
+        """
+        Desviación estándar móvil de una fuente (min_periods igual a la longitud).
+
+        Parámetros:
+        -----------
+        fuente : str
+            Columna o nodo sobre el que se calcula.
+
+        longitud : int
+            Ventana de la desviación estándar.
+
+        ddof : int, opcional
+            Grados de libertad (por defecto, 1).
+
+        Salida:
+        -------
+        return : pd.Series : Desviación estándar móvil.
+        """
+
+        return self.nodo(("STD", fuente, longitud, ddof),
+                         lambda: self.serie(fuente).rolling(window=longitud, min_periods=longitud).std(ddof=ddof))
+
+    # Extremos Móviles
+    def extremos(self, fuente: str, longitudes: list, tipo: str = "max") -> dict:
+
+        """
+        Máximos o mínimos móviles de una fuente para varias ventanas, calculados en una sola pasada (ver
+        Extremos_Moviles). Cada ventana queda guardada como su propio nodo, por lo que las llamadas posteriores a maximo o
+        minimo con esas longitudes lo reutilizan.
+
+        Parámetros:
+        -----------
+        fuente : str
+            Columna o nodo sobre el que se calcula.
+
+        longitudes : list
+            Longitudes de las ventanas.
+
+        tipo : str, opcional
+            'max' para máximos o 'min' para mínimos (por defecto, 'max').
+
+        Salida:
+        -------
+        return : dict : Extremos móviles de cada ventana ({longitud: pd.Series}).
+        """
+
+        nombre = "MAX" if tipo == "max" else "MIN"
+        faltantes = [longitud for longitud in longitudes if not self.calculado((nombre, fuente, longitud))]
+        calculados = Extremos_Moviles(self.serie(fuente), faltantes, tipo=tipo) if len(faltantes) > 0 else {}
+
+        return {longitud: self.nodo((nombre, fuente, longitud), lambda longitud=longitud: calculados[longitud])
+                for longitud in longitudes}
+
+    # Máximo Móvil
+    def maximo(self, fuente: str, longitud: int) -> pd.Series:
+
+        """
+        Máximo móvil de una fuente (min_periods igual a la longitud).
+        """
+
+        return self.extremos(fuente, [longitud], tipo="max")[longitud]
+
+    # Mínimo Móvil
+    def minimo(self, fuente: str, longitud: int) -> pd.Series:
+
+        """
+        Mínimo móvil de una fuente (min_periods igual a la longitud).
+        """
+
+        return self.extremos(fuente, [longitud], tipo="min")[longitud]
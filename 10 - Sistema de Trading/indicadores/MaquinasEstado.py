@@ -0,0 +1,422 @@
+# -*- coding: utf-8 -*-
+# Importar librerías
+import json
+from collections import deque
+import numpy as np
+# Librerías Propias
+from indicadores.Streaming import IndicadorStreaming
+
+# Paso de una media exponencial
+def Paso_Media_Exponencial(media: float, valor: float, alpha: float) -> float:
+
+    """
+    Un paso de la media exponencial de pd.Series.ewm(alpha=alpha, adjust=False) con la misma aritmética de pandas (incluido
+    el alpha reconstruido a partir del centro de masa), para que los valores coincidan exactamente con la versión por lotes.
+
+    Parámetros:
+    -----------
+    media : float
+        Media anterior (NaN si todavía no hay observaciones).
+
+    valor : float
+        Valor nuevo.
+
+    alpha : float
+        Factor de suavizado (por ejemplo, 1 / longitud para el ATR de Wilder).
+
+    Salida:
+    -------
+    return : float : Media después del valor.
+    """
+
+    if np.isnan(media):
+        return valor
+    alpha = 1 / (1 + (1 - alpha) / alpha)
+    if media != valor:
+        media = ((1 - alpha) * media + alpha * valor) / ((1 - alpha) + alpha)
+
+    return media
+
+# Agregar un valor a los candidatos de un extremo móvil
+def Agregar_Extremo(candidatos: deque, posicion: int, valor: float, longitud: int, tipo: str = "max") -> float:
+
+    """
+    Agrega un valor a un deque monótono de candidatos ([posición, valor]) y regresa el extremo de la ventana de 'longitud'
+    barras (NaN si todavía no hay 'longitud' barras). Ver Streaming.ExtremoMovil.
+    """
+
+    while len(candidatos) > 0 and (candidatos[-1][1] <= valor if tipo == "max" else candidatos[-1][1] >= valor):
+        candidatos.pop()
+    candidatos.append([posicion, valor])
+    while candidatos[0][0] <= posicion - longitud:
+        candidatos.popleft()
+
+    return candidatos[0][1] if posicion + 1 >= longitud else np.nan
+
+# Definir clase base
+class MaquinaEstado(IndicadorStreaming):
+
+    """
+    Indicador dependiente de la trayectoria (SAR Parabólico, SuperTendencia, Chandelier Exit) como máquina de estados: su
+    valor actual depende de todo el historial, pero solo a través de un estado pequeño (tendencia, punto extremo, factor de
+    aceleración, bandas ajustadas, ...). El estado se actualiza en O(1) al cerrar cada vela y se puede guardar (estado o
+    a_json) y restaurar (desde_estado o desde_json), por lo que un proceso en vivo puede reanudarse después de reiniciarse
+    sin volver a procesar todo el historial: basta con actualizarlo con las velas que cerraron desde que se guardó.
+
+    Cada clase define sus parámetros ('parametros') y los atributos que forman su estado ('campos').
+    """
+
+    parametros = ()
+    campos = ()
+
+    # Estado actual
+    def estado(self) -> dict:
+
+        """
+        Regresa el estado de la máquina como un diccionario de tipos básicos (serializable a JSON).
+
+        Salida:
+        -------
+        return : dict : {'clase': ..., 'parametros': {...}, 'estado': {...}}.
+        """
+
+        estado = {}
+        for campo in self.campos:
+            valor = getattr(self, campo)
+            estado[campo] = list(valor) if isinstance(valor, deque) else valor
+
+        return {"clase": self.__class__.__name__, "parametros": {parametro: getattr(self, parametro) for parametro in self.parametros},
+                "estado": estado}
+
+    # Estado en JSON
+    def a_json(self) -> str:
+
+        """
+        Regresa el estado de la máquina en formato JSON (los valores faltantes se escriben como NaN, como en el módulo json).
+        """
+
+        return json.dumps(self.estado())
+
+    # Crear a partir de un estado
+    @classmethod
+    def desde_estado(cls, estado: dict):
+
+        """
+        Crea una máquina a partir de un estado guardado con .estado().
+
+        Parámetros:
+        -----------
+        estado : dict
+            Estado guardado.
+
+        Salida:
+        -------
+        return : MaquinaEstado : Máquina con el estado restaurado.
+        """
+
+        if estado.get("clase", None) != cls.__name__:
+            raise ValueError(f"El estado es de '{estado.get('clase', None)}', no de '{cls.__name__}'.")
+        faltantes = [campo for campo in cls.campos if campo not in estado["estado"]]
+        if len(faltantes) > 0:
+            raise ValueError(f"El estado de '{cls.__name__}' está incompleto: faltan los campos {faltantes}.")
+        maquina = cls(**estado["parametros"])
+        for campo in cls.campos:
+            valor = estado["estado"][campo]
+            # Los deques se llenan en lugar de reemplazarse para conservar su longitud máxima
+            if isinstance(getattr(maquina, campo), deque):
+                getattr(maquina, campo).extend(valor)
+            else:
+                setattr(maquina, campo, valor)
+
+        return maquina
+
+    # Crear a partir de JSON
+    @classmethod
+    def desde_json(cls, texto: str):
+
+        """
+        Crea una máquina a partir de un estado en formato JSON (ver a_json).
+        """
+
+        return cls.desde_estado(json.loads(texto))
+
+# SAR Parabólico
+class SARParabolico(MaquinaEstado):
+
+    """
+    SAR Parabólico como máquina de estados, igual que el Kernel_Parabolic_SAR de la lección (las dos primeras velas son el
+    cierre). El estado es la tendencia, los puntos extremos de cada tendencia, el factor de aceleración, el último SAR y
+    los máximos y mínimos de las dos velas anteriores. 'valor' es un diccionario {'PSAR': ..., 'UpTrend': ...,
+    'DownTrend': ...}.
+    """
+
+    parametros = ("incremento", "max_paso")
+    campos = ("barras", "tendencia_alcista", "maximo_tendencia", "minimo_tendencia", "factor_aceleracion", "sar",
+              "maximos", "minimos")
+
+    # __init__
+    def __init__(self, incremento: float = 0.02, max_paso: float = 0.20) -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        incremento : float, opcional
+            Incremento del factor de aceleración (por defecto, 0.02).
+
+        max_paso : float, opcional
+            Factor de aceleración máximo (por defecto, 0.20).
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.incremento = incremento
+        self.max_paso = max_paso
+        # Estado
+        self.barras = 0
+        self.tendencia_alcista = True
+        self.maximo_tendencia = np.nan
+        self.minimo_tendencia = np.nan
+        self.factor_aceleracion = incremento
+        self.sar = np.nan
+        self.maximos = deque(maxlen=2)
+        self.minimos = deque(maxlen=2)
+
+
+    # Actualizar con una vela
+    def actualizar(self, barra) -> dict:
+        High, Low, Close = float(barra["High"]), float(barra["Low"]), float(barra["Close"])
+        self.barras += 1
+        # Las dos primeras velas inicializan el SAR con el cierre
+        if self.barras <= 2:
+            if self.barras == 1:
+                self.maximo_tendencia, self.minimo_tendencia = High, Low
+            self.sar = Close
+            self.maximos.append(High)
+            self.minimos.append(Low)
+            return self.valor
+        reversal = False
+        sar_anterior = self.sar
+
+        # Tendencia Alcista
+        if self.tendencia_alcista:
+            sar = sar_anterior + (self.factor_aceleracion * (self.maximo_tendencia - sar_anterior))
+            if Low < sar: # Reversión a tendencia bajista
+                reversal = True
+                sar = self.maximo_tendencia
+                self.minimo_tendencia = Low
+                self.factor_aceleracion = self.incremento
+            else:
+                if High > self.maximo_tendencia:
+                    self.maximo_tendencia = High
+                    self.factor_aceleracion = min(self.factor_aceleracion + self.incremento, self.max_paso)
+                if self.minimos[0] < sar:
+                    sar = self.minimos[0]
+                elif self.minimos[1] < sar:
+                    sar = self.minimos[1]
+
+        # Tendencia Bajista
+        else:
+            sar = sar_anterior - (self.factor_aceleracion * (sar_anterior - self.minimo_tendencia))
+            if High > sar: # Reversión a tendencia alcista
+                reversal = True
+                sar = self.minimo_tendencia
+                self.maximo_tendencia = High
+                self.factor_aceleracion = self.incremento
+            else:
+                if Low < self.minimo_tendencia:
+                    self.minimo_tendencia = Low
+                    self.factor_aceleracion = min(self.factor_aceleracion + self.incremento, self.max_paso)
+                if self.maximos[0] > sar:
+                    sar = self.maximos[0]
+                elif self.maximos[1] > sar:
+                    sar = self.maximos[1]
+
+        self.tendencia_alcista = self.tendencia_alcista != reversal
+        self.sar = sar
+        self.maximos.append(High)
+        self.minimos.append(Low)
+        return self.valor
+
+    # Valor actual
+    @property
+    def valor(self) -> dict:
+        if self.barras <= 2:
+            return {"PSAR": self.sar, "UpTrend": np.nan, "DownTrend": np.nan}
+        return {"PSAR": self.sar, "UpTrend": self.sar if self.tendencia_alcista else np.nan,
+                "DownTrend": np.nan if self.tendencia_alcista else self.sar}
+
+# SuperTendencia
+class SuperTendencia(MaquinaEstado):
+
+    """
+    SuperTendencia como máquina de estados, igual que la función SuperTendencia de la lección: el estado es el ATR de
+    Wilder, la tendencia (1 alcista, 0 bajista) y las bandas ajustadas (trinquete) de la vela anterior. 'valor' es un
+    diccionario {'FinalUpperB': ..., 'FinalLowerB': ..., 'SuperTendencia': ...} con la fila de la última vela (NaN en las
+    primeras 'longitud' - 1 velas, que la versión por lotes no incluye).
+    """
+
+    parametros = ("longitud", "factor")
+    campos = ("barras", "atr", "observaciones", "cierre_anterior", "tendencia", "banda_superior", "banda_inferior")
+
+    # __init__
+    def __init__(self, longitud: int = 14, factor: float = 3.0) -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        longitud : int, opcional
+            Ventana del ATR (por defecto, 14).
+
+        factor : float, opcional
+            Multiplicador del ATR (por defecto, 3.0).
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.longitud = longitud
+        self.factor = factor
+        # Estado
+        self.barras = 0
+        self.atr = np.nan
+        self.observaciones = 0
+        self.cierre_anterior = np.nan
+        self.tendencia = 0.0
+        self.banda_superior = np.nan
+        self.banda_inferior = np.nan
+
+
+    # Actualizar con una vela
+    def actualizar(self, barra) -> dict:
+        High, Low, Close = float(barra["High"]), float(barra["Low"]), float(barra["Close"])
+        self.barras += 1
+        # ATR de Wilder (la primera vela no tiene Rango Verdadero)
+        TR = np.max([High - Low, abs(High - self.cierre_anterior), abs(self.cierre_anterior - Low)])
+        if not np.isnan(TR):
+            self.atr = Paso_Media_Exponencial(self.atr, TR, 1 / self.longitud)
+            self.observaciones += 1
+        self.cierre_anterior = Close
+        ATR = self.atr if self.observaciones >= self.longitud else np.nan
+        medio = (High + Low) / 2
+        FinalUpperB = medio + self.factor * ATR
+        FinalLowerB = medio - self.factor * ATR
+
+        # Cambiar la tendencia si el cierre cruza la banda anterior o ajustar la banda activa
+        if self.barras > 1:
+            if Close > self.banda_superior:
+                self.tendencia = 1.0
+            elif Close < self.banda_inferior:
+                self.tendencia = 0.0
+            elif self.tendencia == 1.0 and FinalLowerB < self.banda_inferior:
+                FinalLowerB = self.banda_inferior
+            elif self.tendencia == 0.0 and FinalUpperB > self.banda_superior:
+                FinalUpperB = self.banda_superior
+            # Eliminar la banda inactiva
+            if self.tendencia == 1.0:
+                FinalUpperB = np.nan
+            else:
+                FinalLowerB = np.nan
+        self.banda_superior, self.banda_inferior = FinalUpperB, FinalLowerB
+        return self.valor
+
+    # Valor actual
+    @property
+    def valor(self) -> dict:
+        if self.barras < self.longitud:
+            return {"FinalUpperB": np.nan, "FinalLowerB": np.nan, "SuperTendencia": np.nan}
+        SuperTendencia = np.nan if self.barras == self.longitud else float(np.nansum([self.banda_superior, self.banda_inferior]))
+        return {"FinalUpperB": self.banda_superior, "FinalLowerB": self.banda_inferior, "SuperTendencia": SuperTendencia}
+
+# Chandelier Exit
+class ChandelierExit(MaquinaEstado):
+
+    """
+    Chandelier Exit como máquina de estados, igual que la función Chandelier_Exit de la lección: el estado es el ATR de
+    Wilder, los deques monótonos del máximo y el mínimo móviles, las salidas de la vela anterior y la dirección. 'valor' es
+    un diccionario {'Chand_Exit_Long': ..., 'Chand_Exit_Short': ..., 'dir': ..., 'buy_signals': ..., 'sell_signals': ...}.
+    """
+
+    parametros = ("CE_longitud", "ATR_longitud", "multiplicador")
+    campos = ("barras", "atr", "observaciones", "cierre_anterior", "maximos", "minimos", "salida_larga", "salida_corta",
+              "direccion", "direccion_anterior")
+
+    # __init__
+    def __init__(self, CE_longitud: int = 22, ATR_longitud: int = 22, multiplicador: float = 3.0) -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        CE_longitud : int, opcional
+            Ventana del máximo y el mínimo (por defecto, 22).
+
+        ATR_longitud : int, opcional
+            Ventana del ATR (por defecto, 22).
+
+        multiplicador : float, opcional
+            Multiplicador del ATR (por defecto, 3.0).
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.CE_longitud = CE_longitud
+        self.ATR_longitud = ATR_longitud
+        self.multiplicador = multiplicador
+        # Estado
+        self.barras = 0
+        self.atr = np.nan
+        self.observaciones = 0
+        self.cierre_anterior = np.nan
+        self.maximos = deque()
+        self.minimos = deque()
+        self.salida_larga = np.nan
+        self.salida_corta = np.nan
+        self.direccion = 1.0
+        self.direccion_anterior = 1.0
+
+
+    # Actualizar con una vela
+    def actualizar(self, barra) -> dict:
+        High, Low, Close = float(barra["High"]), float(barra["Low"]), float(barra["Close"])
+        posicion = self.barras
+        self.barras += 1
+        # ATR de Wilder (la primera vela no tiene Rango Verdadero)
+        TR = np.max([High - Low, abs(High - self.cierre_anterior), abs(self.cierre_anterior - Low)])
+        if not np.isnan(TR):
+            self.atr = Paso_Media_Exponencial(self.atr, TR, 1 / self.ATR_longitud)
+            self.observaciones += 1
+        self.cierre_anterior = Close
+        ATR = self.atr if self.observaciones >= self.ATR_longitud else np.nan
+        # Salidas de la vela
+        maximo = Agregar_Extremo(self.maximos, posicion, High, self.CE_longitud, tipo="max")
+        minimo = Agregar_Extremo(self.minimos, posicion, Low, self.CE_longitud, tipo="min")
+        Chand_Exit_Long = maximo - self.multiplicador * ATR
+        Chand_Exit_Short = minimo + self.multiplicador * ATR
+        # Dirección respecto a las salidas de la vela anterior (si no cruza, se conserva)
+        self.direccion_anterior = self.direccion
+        if Close > self.salida_corta:
+            self.direccion = 1.0
+        elif Close < self.salida_larga:
+            self.direccion = -1.0
+        self.salida_larga, self.salida_corta = Chand_Exit_Long, Chand_Exit_Short
+        return self.valor
+
+    # Valor actual
+    @property
+    def valor(self) -> dict:
+        return {"Chand_Exit_Long": self.salida_larga, "Chand_Exit_Short": self.salida_corta, "dir": self.direccion,
+                "buy_signals": self.direccion == 1.0 and self.direccion_anterior == -1.0,
+                "sell_signals": self.direccion == -1.0 and self.direccion_anterior == 1.0}
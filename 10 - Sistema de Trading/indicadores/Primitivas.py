@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+# Importar librerías
+import numpy as np
+import pandas as pd
+
+# Suavizado de Wilder (RMA)
+def Suavizado_Wilder(valores: np.ndarray, longitud: int, semilla=None, suma: bool = False) -> np.ndarray:
+
+    """
+    Suavizado de Wilder (RMA) como filtro recursivo lineal sobre arreglos:
+
+        suma=False : y[k] = (y[k-1] * (longitud - 1) + x[k]) / longitud   (promedio, como el ADX)
+        suma=True  : S[k] = S[k-1] * (1 - 1 / longitud) + x[k]            (sumas suavizadas, como TR, +DM y -DM del DMI)
+
+    Ambas formas son una media exponencial con alpha = 1 / longitud (la suma es 'longitud' veces el promedio), por lo que
+    se calculan con pd.DataFrame.ewm(adjust=False) en lugar de un ciclo de Python. Igual que en la recursión, un valor
+    faltante (NaN) hace que todos los valores siguientes sean NaN.
+
+    Parámetros:
+    -----------
+    valores : np.ndarray
+        Valores a suavizar (1D, o 2D con una serie por columna).
+
+    longitud : int
+        Ventana del suavizado.
+
+    semilla : float|np.ndarray, opcional
+        Valor inicial (y[0] o S[0]); los valores suavizados empiezan después de él. Si es None, el primer valor de
+        'valores' es el valor inicial.
+
+    suma : bool, opcional
+        Si es True, se calculan las sumas suavizadas de Wilder; si es False, el promedio (False por defecto).
+
+    Salida:
+    -------
+    return : np.ndarray : Valores suavizados, empezando por la semilla (len(valores) + 1 valores si se indica la semilla,
+                          len(valores) si no).
+    """
+
+    valores = np.asarray(valores, dtype=np.float64)
+    if semilla is not None:
+        semilla = np.broadcast_to(np.asarray(semilla, dtype=np.float64), valores.shape[1:])
+        valores = np.concatenate([semilla[np.newaxis], valores], axis=0)
+    if valores.shape[0] == 0:
+        return valores.copy()
+    # En la forma de sumas, la semilla se escala para que la media exponencial sea S / longitud
+    if suma:
+        valores = valores.copy()
+        valores[0] = valores[0] / longitud
+    suavizado = pd.DataFrame(valores.reshape(valores.shape[0], -1)).ewm(alpha=1 / longitud, adjust=False).mean().to_numpy()
+    suavizado = suavizado.reshape(valores.shape)
+    if suma:
+        suavizado = suavizado * longitud
+    # Propagar los valores faltantes como en la recursión
+    faltantes = np.logical_or.accumulate(np.isnan(valores), axis=0)
+    if faltantes.any():
+        suavizado[faltantes] = np.nan
+
+    return suavizado
+
+# Barras desde el último evento
+def Barras_Desde(condicion):
+
+    """
+    Número de barras desde la última vez que se cumplió una condición (0 en las barras donde se cumple), por ejemplo, las
+    barras desde la entrada a una posición para una regla de salida por tiempo. La posición del último evento se propaga
+    con un máximo acumulado, sin ciclos de Python. Antes del primer evento se cuentan las barras desde el inicio de la
+    serie más uno (como un contador que empieza en 0 y aumenta en cada barra sin evento).
+
+    Parámetros:
+    -----------
+    condicion : np.ndarray|pd.Series|pd.DataFrame
+        Condición de cada barra (1D, o 2D con una columna por serie).
+
+    Salida:
+    -------
+    return : np.ndarray|pd.Series|pd.DataFrame : Barras desde el último evento (del mismo tipo y forma que 'condicion').
+    """
+
+    arreglo = np.asarray(condicion, dtype=bool)
+    posiciones = np.arange(arreglo.shape[0]).reshape((-1,) + (1,) * (arreglo.ndim - 1))
+    barras = posiciones - np.maximum.accumulate(np.where(arreglo, posiciones, -1), axis=0)
+    if isinstance(condicion, pd.DataFrame):
+        return pd.DataFrame(barras, index=condicion.index, columns=condicion.columns)
+    if isinstance(condicion, pd.Series):
+        return pd.Series(barras, index=condicion.index, name=condicion.name)
+
+    return barras
+
+# Máximos y mínimos móviles de varias ventanas
+def Extremos_Moviles(valores, longitudes: list, tipo: str = "max") -> dict:
+
+    """
+    Máximos (o mínimos) móviles de una serie para varias ventanas a la vez (por ejemplo, 9, 26 y 52 para Ichimoku).
+
+    Se construye una sola vez una tabla de extremos de ventanas de 1, 2, 4, 8, ... barras (cada nivel combina dos
+    ventanas del nivel anterior) y el extremo de una ventana de cualquier longitud L se obtiene combinando las dos
+    ventanas de 2^k <= L barras que la cubren (una al inicio y otra al final). Todas las ventanas comparten la tabla,
+    por lo que el costo es O(n log L) para el conjunto completo, todo con operaciones de NumPy. Igual que
+    rolling(...).max() con min_periods=longitud, una ventana con algún valor faltante da NaN.
+
+    Parámetros:
+    -----------
+    valores : np.ndarray|pd.Series|pd.DataFrame
+        Serie (1D) o panel de series (2D, una columna por serie).
+
+    longitudes : list
+        Longitudes de las ventanas.
+
+    tipo : str, opcional
+        'max' para máximos o 'min' para mínimos (por defecto, 'max').
+
+    Salida:
+    -------
+    return : dict : Extremos móviles de cada ventana ({longitud: arreglo}, del mismo tipo y forma que 'valores').
+    """
+
+    if tipo not in ["max", "min"]:
+        raise ValueError(f"Tipo de extremo '{tipo}' no reconocido (opciones: ['max', 'min']).")
+    funcion = np.maximum if tipo == "max" else np.minimum
+    arreglo = np.asarray(valores, dtype=np.float64)
+    n = arreglo.shape[0]
+    # Niveles necesarios de la tabla: extremos de las ventanas de 2^k barras que empiezan en cada posición
+    niveles = {int(longitud).bit_length() - 1 for longitud in longitudes if 0 < longitud <= n}
+    tabla, tablas = arreglo, {}
+    for k in range(max(niveles, default=-1) + 1):
+        if k > 0:
+            paso = 1 << (k - 1)
+            tabla = funcion(tabla[:-paso], tabla[paso:])
+        if k in niveles:
+            tablas[k] = tabla
+    # Combinar las dos ventanas de 2^k barras que cubren cada ventana
+    extremos = {}
+    for longitud in longitudes:
+        resultado = np.full(arreglo.shape, np.nan)
+        if 0 < longitud <= n:
+            k = int(longitud).bit_length() - 1
+            tabla = tablas[k]
+            resultado[longitud - 1:] = funcion(tabla[:n - longitud + 1], tabla[longitud - (1 << k):n - (1 << k) + 1])
+        if isinstance(valores, pd.DataFrame):
+            resultado = pd.DataFrame(resultado, index=valores.index, columns=valores.columns)
+        elif isinstance(valores, pd.Series):
+            resultado = pd.Series(resultado, index=valores.index, name=valores.name)
+        extremos[longitud] = resultado
+
+    return extremos
+
+# Niveles del Chop Zone
+def Niveles_Chop_Zone(angulos) -> np.ndarray:
+
+    """
+    Clasifica los ángulos de la EMA (en grados) en los 9 niveles del indicador Chop Zone:
+
+        ángulo >= 5           : 0 (alcista fuerte)       ángulo <= -5            : 4 (bajista fuerte)
+        3.57 <= ángulo < 5    : 1                        -5 < ángulo <= -3.57    : 5
+        2.14 <= ángulo < 3.57 : 2                        -3.57 < ángulo <= -2.14 : 6
+        0.71 <= ángulo < 2.14 : 3                        -2.14 < ángulo <= -0.71 : 7
+        resto (y faltantes)   : 8 (neutral)
+
+    En lugar de una cadena de np.where, el tramo de cada ángulo se busca una sola vez con np.searchsorted sobre los
+    umbrales de su valor absoluto, y el nivel se toma de una tabla según el signo del ángulo.
+
+    Parámetros:
+    -----------
+    angulos : np.ndarray|float
+        Ángulos de la EMA.
+
+    Salida:
+    -------
+    return : np.ndarray : Nivel del Chop Zone de cada ángulo (enteros de 0 a 8).
+    """
+
+    angulos = np.asarray(angulos, dtype=np.float64)
+    tramos = np.searchsorted([0.71, 2.14, 3.57, 5], np.abs(angulos), side="right")
+    niveles = np.where(angulos < 0, np.array([8, 7, 6, 5, 4])[tramos], np.array([8, 3, 2, 1, 0])[tramos])
+    niveles[np.isnan(angulos)] = 8
+
+    return niveles
@@ -0,0 +1,1060 @@
+# -*- coding: utf-8 -*-
+# Importar librerías
+from collections import deque
+from copy import deepcopy
+import numpy as np
+import pandas as pd
+# Librerías Propias
+from indicadores.Primitivas import Niveles_Chop_Zone
+
+# Definir clase base
+class IndicadorStreaming:
+
+    """
+    Indicador incremental: en lugar de recalcular todo el historial en cada ciclo, guarda un estado pequeño (sumas
+    móviles, medias exponenciales, buffers circulares de la ventana) y lo actualiza con cada vela nueva en O(1) u
+    O(ventana). Primero se siembra con el historial (sembrar) y después se actualiza con cada vela (actualizar); el valor
+    más reciente está en 'valor' y es el mismo que la última fila de la versión por lotes del indicador.
+
+    Las velas pueden ser cualquier objeto indexable por columna (dict, pd.Series de una fila, ...). Se asume que las
+    velas están limpias (ver LimpiezaDatos), igual que en las estrategias.
+    """
+
+    # __repr__
+    def __repr__(self):
+        return self.__class__.__name__ + ".class"
+
+    # Actualizar con una vela
+    def actualizar(self, barra) -> object:
+
+        """
+        Agrega una vela nueva al estado del indicador.
+
+        Parámetros:
+        -----------
+        barra : dict|pd.Series
+            Vela nueva (columnas 'Open', 'High', 'Low', 'Close', 'Volume').
+
+        Salida:
+        -------
+        return : float|dict : Valor del indicador después de la vela.
+        """
+
+        raise NotImplementedError("El indicador debe implementar 'actualizar'.")
+
+    # Sembrar con el historial
+    def sembrar(self, historial: pd.DataFrame) -> object:
+
+        """
+        Actualiza el indicador con todas las velas de un historial, en orden (una sola vez, antes del modo incremental).
+
+        Parámetros:
+        -----------
+        historial : pd.DataFrame
+            Velas históricas del activo.
+
+        Salida:
+        -------
+        return : float|dict : Valor del indicador después de la última vela.
+        """
+
+        columnas = list(historial.columns)
+        for fila in zip(*[historial[columna].to_numpy() for columna in columnas]):
+            self.actualizar(dict(zip(columnas, fila)))
+
+        return self.valor
+
+# Suma móvil (buffer circular con suma compensada)
+class SumaMovil:
+
+    """
+    Suma de los últimos 'longitud' valores con un buffer circular y suma compensada (Kahan), para que la suma al agregar y
+    quitar valores no acumule error de redondeo. Una ventana con algún valor faltante da NaN (igual que rolling con
+    min_periods=longitud).
+    """
+
+    # __init__
+    def __init__(self, longitud: int) -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        longitud : int
+            Ventana de la suma.
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.longitud = longitud
+        # Atributos Privados
+        self.__ventana = deque(maxlen=longitud)
+        self.__suma = 0.0
+        self.__compensacion = 0.0
+        self.__faltantes = 0
+
+
+    # __repr__
+    def __repr__(self):
+        return self.__class__.__name__ + ".class"
+
+    # Sumar un valor a la suma compensada
+    def __sumar(self, valor: float) -> None:
+        y = valor - self.__compensacion
+        t = self.__suma + y
+        self.__compensacion = (t - self.__suma) - y
+        self.__suma = t
+
+    # Agregar un valor
+    def agregar(self, valor: float) -> float:
+
+        """
+        Agrega un valor a la ventana (y quita el más antiguo si la ventana está completa).
+
+        Parámetros:
+        -----------
+        valor : float
+            Valor nuevo.
+
+        Salida:
+        -------
+        return : float : Suma de la ventana (NaN si la ventana no está completa o tiene valores faltantes).
+        """
+
+        valor = float(valor)
+        if len(self.__ventana) == self.longitud:
+            saliente = self.__ventana[0]
+            if np.isnan(saliente):
+                self.__faltantes -= 1
+            else:
+                self.__sumar(-saliente)
+        self.__ventana.append(valor)
+        if np.isnan(valor):
+            self.__faltantes += 1
+        else:
+            self.__sumar(valor)
+
+        return self.suma
+
+    # Suma de la ventana
+    @property
+    def suma(self) -> float:
+        if len(self.__ventana) < self.longitud or self.__faltantes > 0:
+            return np.nan
+        return self.__suma
+
+# Máximo o mínimo móvil (deque monótono)
+class ExtremoMovil:
+
+    """
+    Máximo (o mínimo) de los últimos 'longitud' valores con un deque monótono: cada valor nuevo descarta del final los
+    valores que ya no pueden ser el extremo de ninguna ventana futura, por lo que el extremo siempre está al inicio del
+    deque y cada valor entra y sale una sola vez (O(1) amortizado por valor). Una ventana con algún valor faltante da NaN
+    (igual que rolling(...).max() con min_periods=longitud).
+    """
+
+    # __init__
+    def __init__(self, longitud: int, tipo: str = "max") -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        longitud : int
+            Ventana del extremo.
+
+        tipo : str, opcional
+            'max' para el máximo o 'min' para el mínimo (por defecto, 'max').
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        if tipo not in ["max", "min"]:
+            raise ValueError(f"Tipo de extremo '{tipo}' no reconocido (opciones: ['max', 'min']).")
+        # Definir atributos
+        self.longitud = longitud
+        self.tipo = tipo
+        # Atributos Privados
+        self.__candidatos = deque()
+        self.__posicion = -1
+        self.__ultimo_faltante = -1
+
+
+    # __repr__
+    def __repr__(self):
+        return self.__class__.__name__ + ".class"
+
+    # Agregar un valor
+    def agregar(self, valor: float) -> float:
+
+        """
+        Agrega un valor a la ventana.
+
+        Parámetros:
+        -----------
+        valor : float
+            Valor nuevo.
+
+        Salida:
+        -------
+        return : float : Extremo de la ventana (NaN si la ventana no está completa o tiene valores faltantes).
+        """
+
+        valor = float(valor)
+        self.__posicion += 1
+        if np.isnan(valor):
+            self.__ultimo_faltante = self.__posicion
+        else:
+            # Descartar los candidatos dominados por el valor nuevo
+            while len(self.__candidatos) > 0 and (self.__candidatos[-1][1] <= valor if self.tipo == "max" else
+                                                  self.__candidatos[-1][1] >= valor):
+                self.__candidatos.pop()
+            self.__candidatos.append((self.__posicion, valor))
+        # Descartar los candidatos que salieron de la ventana
+        while len(self.__candidatos) > 0 and self.__candidatos[0][0] <= self.__posicion - self.longitud:
+            self.__candidatos.popleft()
+
+        return self.extremo
+
+    # Extremo de la ventana
+    @property
+    def extremo(self) -> float:
+        if self.__posicion + 1 < self.longitud or self.__ultimo_faltante > self.__posicion - self.longitud:
+            return np.nan
+        return self.__candidatos[0][1]
+
+# Media Móvil Simple
+class MediaMovilSimple(IndicadorStreaming):
+
+    """
+    Media Móvil Simple (SMA) incremental: igual a df[columna].rolling(window=longitud, min_periods=longitud).mean().
+    """
+
+    # __init__
+    def __init__(self, longitud: int = 21, columna: str = "Close") -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        longitud : int, opcional
+            Ventana de la SMA (por defecto, 21).
+
+        columna : str, opcional
+            Columna de las velas (por defecto, 'Close').
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.longitud = longitud
+        self.columna = columna
+        # Atributos Privados
+        self.__suma = SumaMovil(longitud)
+
+
+    # Actualizar con una vela
+    def actualizar(self, barra) -> float:
+        self.__suma.agregar(barra[self.columna])
+        return self.valor
+
+    # Valor actual
+    @property
+    def valor(self) -> float:
+        return self.__suma.suma / self.longitud
+
+# Media Móvil Exponencial
+class MediaMovilExponencial(IndicadorStreaming):
+
+    """
+    Media Móvil Exponencial (EMA) incremental: igual a df[columna].ewm(span=longitud, min_periods=min_periods,
+    adjust=adjust).mean() (o ewm(alpha=alpha, ...) si se indica 'alpha'). El estado es solo la media actual, su peso y el
+    número de valores observados; la actualización es la misma recursión ponderada de pandas, por lo que los valores
+    coinciden exactamente con la versión por lotes.
+    """
+
+    # __init__
+    def __init__(self, longitud: int = 26, columna: str = "Close", min_periods: int = None, alpha: float = None,
+                 adjust: bool = False) -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        longitud : int, opcional
+            Ventana (span) de la EMA (por defecto, 26).
+
+        columna : str, opcional
+            Columna de las velas (por defecto, 'Close').
+
+        min_periods : int, opcional
+            Mínimo de valores observados para que la EMA sea válida (por defecto, igual a 'longitud').
+
+        alpha : float, opcional
+            Factor de suavizado (por ejemplo, 1 / longitud para el suavizado de Wilder). Si es None, se usa el de la
+            ventana (2 / (longitud + 1)).
+
+        adjust : bool, opcional
+            Parámetro 'adjust' de pd.Series.ewm (False por defecto).
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.longitud = longitud
+        self.columna = columna
+        self.min_periods = longitud if min_periods is None else min_periods
+        self.adjust = adjust
+        # Mismo factor que pandas (a partir del centro de masa)
+        centro_masa = (longitud - 1) / 2 if alpha is None else (1 - alpha) / alpha
+        self.alpha = 1 / (1 + centro_masa)
+        self.observaciones = 0
+        # Atributos Privados
+        self.__media = np.nan
+        self.__peso = 1.0
+
+
+    # Actualizar con un valor
+    def agregar(self, valor: float) -> float:
+
+        """
+        Agrega un valor a la EMA (los valores faltantes se omiten).
+
+        Parámetros:
+        -----------
+        valor : float
+            Valor nuevo.
+
+        Salida:
+        -------
+        return : float : EMA después del valor.
+        """
+
+        valor = float(valor)
+        if self.observaciones == 0:
+            if not np.isnan(valor):
+                self.__media = valor
+                self.observaciones += 1
+            return self.valor
+        # Los valores faltantes solo reducen el peso de la media (igual que ewm con ignore_na=False)
+        nuevo_peso = 1.0 if self.adjust else self.alpha
+        self.__peso *= 1 - self.alpha
+        if not np.isnan(valor):
+            if self.__media != valor:
+                self.__media = (self.__peso * self.__media + nuevo_peso * valor) / (self.__peso + nuevo_peso)
+            self.__peso = self.__peso + nuevo_peso if self.adjust else 1.0
+            self.observaciones += 1
+
+        return self.valor
+
+    # Actualizar con una vela
+    def actualizar(self, barra) -> float:
+        return self.agregar(barra[self.columna])
+
+    # Valor actual
+    @property
+    def valor(self) -> float:
+        return self.__media if self.observaciones >= self.min_periods else np.nan
+
+# MACD
+class MACD(IndicadorStreaming):
+
+    """
+    MACD incremental: dos EMAs del precio y la EMA de su diferencia (línea de señal), igual que la función MACD por lotes.
+    'valor' es un diccionario {'MACD': ..., 'Señal': ...}.
+    """
+
+    # __init__
+    def __init__(self, longitud_rapida: int = 12, longitud_lenta: int = 26, longitud_señal: int = 9,
+                 columna: str = "Close") -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        longitud_rapida : int, opcional
+            Ventana de la EMA rápida (por defecto, 12).
+
+        longitud_lenta : int, opcional
+            Ventana de la EMA lenta (por defecto, 26).
+
+        longitud_señal : int, opcional
+            Ventana de la línea de señal (por defecto, 9).
+
+        columna : str, opcional
+            Columna de las velas (por defecto, 'Close').
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.columna = columna
+        self.rapida = MediaMovilExponencial(longitud_rapida, columna)
+        self.lenta = MediaMovilExponencial(longitud_lenta, columna)
+        self.señal = MediaMovilExponencial(longitud_señal)
+
+
+    # Actualizar con una vela
+    def actualizar(self, barra) -> dict:
+        precio = barra[self.columna]
+        # La línea de señal empieza cuando la línea MACD es válida
+        self.señal.agregar(self.rapida.agregar(precio) - self.lenta.agregar(precio))
+        return self.valor
+
+    # Valor actual
+    @property
+    def valor(self) -> dict:
+        return {"MACD": self.rapida.valor - self.lenta.valor, "Señal": self.señal.valor}
+
+# Índice de Fuerza Relativa
+class IndiceFuerzaRelativa(IndicadorStreaming):
+
+    """
+    Índice de Fuerza Relativa (RSI) incremental: EMAs de las ganancias y las pérdidas de cada vela, igual que la función
+    Indicador_Fuerza_Relativa por lotes (y la Estrategia 3).
+    """
+
+    # __init__
+    def __init__(self, longitud: int = 14, columna: str = "Close") -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        longitud : int, opcional
+            Ventana del RSI (por defecto, 14).
+
+        columna : str, opcional
+            Columna de las velas (por defecto, 'Close').
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.longitud = longitud
+        self.columna = columna
+        self.ganancia = MediaMovilExponencial(longitud)
+        self.perdida = MediaMovilExponencial(longitud)
+        # Atributos Privados
+        self.__anterior = np.nan
+
+
+    # Actualizar con una vela
+    def actualizar(self, barra) -> float:
+        precio = float(barra[self.columna])
+        delta = precio - self.__anterior
+        # La primera vela (sin cambio) cuenta como ganancia y pérdida de 0
+        self.ganancia.agregar(delta if delta >= 0 else 0.0)
+        self.perdida.agregar(-delta if delta < 0 else 0.0)
+        self.__anterior = precio
+        return self.valor
+
+    # Valor actual
+    @property
+    def valor(self) -> float:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            RS = np.float64(self.ganancia.valor) / np.float64(self.perdida.valor)
+            return 100.0 if RS == 0 else float(100 - (100 / (1 + RS)))
+
+# Bandas de Bollinger
+class BandasBollinger(IndicadorStreaming):
+
+    """
+    Bandas de Bollinger incrementales: media y desviación estándar móviles con un buffer circular y el algoritmo de
+    Welford para ventanas deslizantes (al entrar un valor y salir otro, la media y la suma de cuadrados de las
+    desviaciones se corrigen sin recorrer la ventana). 'valor' es un diccionario {'MA': ..., 'BB_Up': ..., 'BB_Down': ...}
+    como la función Bandas_Bollinger por lotes.
+    """
+
+    # __init__
+    def __init__(self, longitud: int = 20, std_dev: float = 2.0, ddof: int = 0, columna: str = "Close") -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        longitud : int, opcional
+            Ventana de las bandas (por defecto, 20).
+
+        std_dev : float, opcional
+            Número de desviaciones estándar (por defecto, 2.0).
+
+        ddof : int, opcional
+            Grados de libertad de la desviación estándar (por defecto, 0).
+
+        columna : str, opcional
+            Columna de las velas (por defecto, 'Close').
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.longitud = longitud
+        self.std_dev = std_dev
+        self.ddof = ddof
+        self.columna = columna
+        # Atributos Privados
+        self.__ventana = deque(maxlen=longitud)
+        self.__media = 0.0
+        self.__M2 = 0.0
+
+
+    # Actualizar con una vela
+    def actualizar(self, barra) -> dict:
+        valor = float(barra[self.columna])
+        if len(self.__ventana) < self.longitud:
+            # Welford: agregar un valor
+            self.__ventana.append(valor)
+            delta = valor - self.__media
+            self.__media += delta / len(self.__ventana)
+            self.__M2 += delta * (valor - self.__media)
+        else:
+            # Welford deslizante: reemplazar el valor más antiguo por el nuevo
+            saliente = self.__ventana[0]
+            self.__ventana.append(valor)
+            media_anterior = self.__media
+            self.__media += (valor - saliente) / self.longitud
+            self.__M2 += (valor - saliente) * (valor - self.__media + saliente - media_anterior)
+        return self.valor
+
+    # Valor actual
+    @property
+    def valor(self) -> dict:
+        if len(self.__ventana) < self.longitud or self.longitud - self.ddof <= 0:
+            return {"MA": np.nan, "BB_Up": np.nan, "BB_Down": np.nan}
+        calc_intermedio = self.std_dev * np.sqrt(max(self.__M2, 0.0) / (self.longitud - self.ddof))
+        return {"MA": self.__media, "BB_Up": self.__media + calc_intermedio, "BB_Down": self.__media - calc_intermedio}
+
+# Índice de Flujo de Dinero
+class IndiceFlujoDinero(IndicadorStreaming):
+
+    """
+    Índice de Flujo de Dinero (MFI) incremental: sumas móviles del flujo de dinero positivo y negativo, igual que la
+    función Indice_Flujo_Dinero por lotes.
+    """
+
+    # __init__
+    def __init__(self, longitud: int = 14) -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        longitud : int, opcional
+            Ventana del MFI (por defecto, 14).
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.longitud = longitud
+        # Atributos Privados
+        self.__positivo = SumaMovil(longitud)
+        self.__negativo = SumaMovil(longitud)
+        self.__anterior = np.nan
+
+
+    # Actualizar con una vela
+    def actualizar(self, barra) -> float:
+        precio_tipico = (float(barra["High"]) + float(barra["Low"]) + float(barra["Close"])) / 3
+        diferencia = precio_tipico - self.__anterior
+        flujo_dinero_bruto = precio_tipico * float(barra["Volume"])
+        self.__positivo.agregar(flujo_dinero_bruto if diferencia >= 0 else 0.0)
+        self.__negativo.agregar(flujo_dinero_bruto if diferencia <= 0 else 0.0)
+        self.__anterior = precio_tipico
+        return self.valor
+
+    # Valor actual
+    @property
+    def valor(self) -> float:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            razon_flujo_dinero = np.float64(self.__positivo.suma) / np.float64(self.__negativo.suma)
+            return float(100 - 100 / (1 + razon_flujo_dinero))
+
+# Volumen de Balance
+class VolumenBalance(IndicadorStreaming):
+
+    """
+    Volumen de Balance (OBV) incremental: suma acumulada del volumen con el signo del cambio del precio, igual que la
+    función On_Balance_Volume por lotes (la primera vela suma todo su volumen).
+    """
+
+    # __init__
+    def __init__(self, columna: str = "Close") -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        columna : str, opcional
+            Columna de las velas (por defecto, 'Close').
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.columna = columna
+        # Atributos Privados
+        self.__OBV = np.nan
+        self.__anterior = np.nan
+
+
+    # Actualizar con una vela
+    def actualizar(self, barra) -> float:
+        precio, volumen = float(barra[self.columna]), float(barra["Volume"])
+        cambio = np.sign(precio - self.__anterior) * volumen
+        cambio = volumen if np.isnan(cambio) else cambio
+        self.__OBV = cambio if np.isnan(self.__OBV) else self.__OBV + cambio
+        self.__anterior = precio
+        return self.valor
+
+    # Valor actual
+    @property
+    def valor(self) -> float:
+        return self.__OBV
+
+# Chop Zone
+class ChopZone(IndicadorStreaming):
+
+    """
+    Chop Zone (CZ) incremental: nivel (0 a 8) del ángulo de la EMA respecto al precio típico, escalado por el rango de
+    máximos y mínimos móviles, igual que la Estrategia 1. El estado son la EMA (y su valor anterior) y los deques
+    monótonos del máximo y el mínimo. Las primeras max(longitud, longitud_ema) velas dan NaN.
+    """
+
+    # __init__
+    def __init__(self, longitud: int = 30, longitud_ema: int = 34, columna: str = "Close") -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        longitud : int, opcional
+            Ventana del máximo y el mínimo móviles (por defecto, 30).
+
+        longitud_ema : int, opcional
+            Ventana de la EMA (por defecto, 34).
+
+        columna : str, opcional
+            Columna de las velas (por defecto, 'Close').
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.longitud = longitud
+        self.longitud_ema = longitud_ema
+        self.columna = columna
+        self.ema = MediaMovilExponencial(longitud_ema, columna)
+        self.maximo = ExtremoMovil(longitud, tipo="max")
+        self.minimo = ExtremoMovil(longitud, tipo="min")
+        self.barras = 0
+        # Atributos Privados
+        self.__CZ = np.nan
+
+
+    # Actualizar con una vela
+    def actualizar(self, barra) -> float:
+        TP = (float(barra["High"]) + float(barra["Low"]) + float(barra["Close"])) / 3
+        precio = barra[self.columna]
+        max_suavizado, min_suavizado = self.maximo.agregar(precio), self.minimo.agregar(precio)
+        ema_anterior, ema = self.ema.valor, self.ema.agregar(precio)
+        self.barras += 1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rango_HL = 25 / (np.float64(max_suavizado) - min_suavizado) * min_suavizado
+            y2_ema = (np.float64(ema_anterior) - ema) / TP * rango_HL
+            angulo_ema0 = np.round(np.rad2deg(np.arccos(1 / np.sqrt(1 + y2_ema ** 2))))
+        angulo_ema1 = - angulo_ema0 if y2_ema > 0 else angulo_ema0
+        self.__CZ = float(Niveles_Chop_Zone(angulo_ema1)) if self.barras > max(self.longitud, self.longitud_ema) else np.nan
+        return self.valor
+
+    # Valor actual
+    @property
+    def valor(self) -> float:
+        return self.__CZ
+
+# Suavizado de Wilder
+class SuavizadoWilder:
+
+    """
+    Suavizado de Wilder (RMA) incremental, igual que Suavizado_Wilder por lotes: el primer valor es la semilla y los
+    siguientes se suavizan con alpha = 1 / longitud. Con suma=True se llevan las sumas suavizadas (la semilla es una suma
+    y el valor es 'longitud' veces el promedio). Un valor faltante hace que todos los valores siguientes sean NaN.
+    """
+
+    # __init__
+    def __init__(self, longitud: int, suma: bool = False) -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        longitud : int
+            Ventana del suavizado.
+
+        suma : bool, opcional
+            Si es True, se llevan las sumas suavizadas de Wilder; si es False, el promedio (False por defecto).
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.longitud = longitud
+        self.suma = suma
+        # Atributos Privados
+        self.__media = MediaMovilExponencial(longitud, alpha=1 / longitud, min_periods=1)
+        self.__faltante = False
+
+
+    # __repr__
+    def __repr__(self):
+        return self.__class__.__name__ + ".class"
+
+    # Agregar un valor
+    def agregar(self, valor: float) -> float:
+
+        """
+        Agrega un valor al suavizado (el primero es la semilla).
+
+        Parámetros:
+        -----------
+        valor : float
+            Valor nuevo.
+
+        Salida:
+        -------
+        return : float : Valor suavizado.
+        """
+
+        valor = float(valor)
+        if np.isnan(valor):
+            self.__faltante = True
+        elif not self.__faltante:
+            # En la forma de sumas, la semilla se escala para que la media exponencial sea S / longitud
+            primero = self.__media.observaciones == 0
+            self.__media.agregar(valor / self.longitud if self.suma and primero else valor)
+
+        return self.valor
+
+    # Valor actual
+    @property
+    def valor(self) -> float:
+        if self.__faltante:
+            return np.nan
+        return self.__media.valor * self.longitud if self.suma else self.__media.valor
+
+# Índice de Movimiento Direccional
+class MovimientoDireccional(IndicadorStreaming):
+
+    """
+    Índice de Movimiento Direccional (DMI) incremental, igual que el DMI por lotes de la Estrategia 2: las sumas de TR, +DM
+    y -DM de las primeras 'suavizado_ADX' velas son las semillas de sus sumas suavizadas de Wilder, y el ADX se siembra con
+    el promedio de los primeros 'suavizado_ADX' valores del DX. 'valor' es un diccionario {'ADX': ..., '+DI': ...,
+    '-DI': ...}.
+
+    Las semillas se guardan en buffers solo hasta que están completas; después, cada vela cuesta O(1). Si 'suavizado_ADX' es
+    mayor que 'longitud_DI', el ADX de las primeras velas (antes de que el promedio de su semilla esté disponible) es NaN.
+    """
+
+    # __init__
+    def __init__(self, suavizado_ADX: int = 14, longitud_DI: int = 14) -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        suavizado_ADX : int, opcional
+            Ventana del suavizado de TR, +DM y -DM (por defecto, 14).
+
+        longitud_DI : int, opcional
+            Ventana del suavizado del ADX (por defecto, 14).
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.suavizado_ADX = suavizado_ADX
+        self.longitud_DI = longitud_DI
+        self.TR = SuavizadoWilder(suavizado_ADX, suma=True)
+        self.PDM = SuavizadoWilder(suavizado_ADX, suma=True)
+        self.MDM = SuavizadoWilder(suavizado_ADX, suma=True)
+        self.ADX = SuavizadoWilder(longitud_DI)
+        self.barras = 0
+        # Atributos Privados
+        self.__anterior = None
+        self.__semillas = {"TR": [], "+DM": [], "-DM": []}
+        self.__DX = []
+        self.__DX_observados = 0
+        self.__PDI = np.nan
+        self.__MDI = np.nan
+
+
+    # Actualizar con una vela
+    def actualizar(self, barra) -> dict:
+        High, Low, Close = float(barra["High"]), float(barra["Low"]), float(barra["Close"])
+        self.barras += 1
+        if self.__anterior is None:
+            # La primera vela no tiene Rango Verdadero ni movimientos direccionales
+            self.__anterior = (High, Low, Close)
+            self.__semillas["TR"].append(np.nan)
+            return self.valor
+        High_anterior, Low_anterior, Close_anterior = self.__anterior
+        self.__anterior = (High, Low, Close)
+        TR = np.max([High - Low, abs(High - Close_anterior), abs(Close_anterior - Low)])
+        movimiento_alto, movimiento_bajo = High - High_anterior, Low_anterior - Low
+        PDM = movimiento_alto if movimiento_alto > movimiento_bajo and movimiento_alto > 0 else 0.0
+        MDM = movimiento_bajo if movimiento_bajo > movimiento_alto and movimiento_bajo > 0 else 0.0
+
+        # Semillas: sumas de las primeras velas (con la misma suma por pares de NumPy que la versión por lotes)
+        if self.__semillas is not None:
+            self.__semillas["TR"].append(TR)
+            self.__semillas["+DM"].append(PDM)
+            self.__semillas["-DM"].append(MDM)
+            if self.barras < self.suavizado_ADX + 1:
+                return self.valor
+            self.TR.agregar(np.nansum(self.__semillas["TR"]))
+            self.PDM.agregar(np.sum(self.__semillas["+DM"]))
+            self.MDM.agregar(np.sum(self.__semillas["-DM"]))
+            self.__semillas = None
+        else:
+            self.TR.agregar(TR)
+            self.PDM.agregar(PDM)
+            self.MDM.agregar(MDM)
+
+        # Indicadores Direccionales y DX
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.__PDI = np.float64(self.PDM.valor) / self.TR.valor * 100
+            self.__MDI = np.float64(self.MDM.valor) / self.TR.valor * 100
+            DX = np.abs(self.__PDI - self.__MDI) / (self.__PDI + self.__MDI) * 100
+        self.__DX_observados += 1
+
+        # ADX: semilla con el promedio de los primeros DX y suavizado a partir del DX número 'longitud_DI'
+        if self.__DX is not None:
+            self.__DX.append(DX)
+            if len(self.__DX) >= self.suavizado_ADX:
+                self.ADX.agregar(np.mean(self.__DX[:self.suavizado_ADX]))
+                for valor in self.__DX[self.longitud_DI:]:
+                    self.ADX.agregar(valor)
+                self.__DX = None
+        elif self.__DX_observados > self.longitud_DI:
+            self.ADX.agregar(DX)
+        return self.valor
+
+    # Valor actual
+    @property
+    def valor(self) -> dict:
+        ADX = self.ADX.valor if self.__DX is None and self.__DX_observados >= self.longitud_DI else np.nan
+        return {"ADX": float(ADX), "+DI": float(self.__PDI), "-DI": float(self.__MDI)}
+
+# Squeeze Momentum
+class SqueezeMomentum(IndicadorStreaming):
+
+    """
+    Squeeze Momentum (SM) incremental, igual que el de la Estrategia 2: Bandas de Bollinger (ventana con Welford), Canales
+    de Keltner (EMA del precio y EMA del Rango Verdadero) y el momentum (media móvil del cambio de 'periodos_momentum'
+    velas del cierre, con un buffer circular de cierres y una suma móvil). 'valor' es un diccionario {'SQZ': ...,
+    'SQZ_ON': ..., 'SQZ_OFF': ..., 'SQZ_NO': ...}.
+    """
+
+    # __init__
+    def __init__(self, longitud_bb: int = 20, desviacion_std_bb: float = 2.0, longitud_kc: int = 20,
+                 multiplicador_kc: float = 1.5, periodos_momentum: int = 12, longitud_momentum: int = 6,
+                 columna: str = "Close") -> None:
+
+        """
+        Constructor.
+
+        Parámetros:
+        -----------
+        longitud_bb : int, opcional
+            Ventana de las Bandas de Bollinger (por defecto, 20).
+
+        desviacion_std_bb : float, opcional
+            Número de desviaciones estándar de las Bandas de Bollinger (por defecto, 2.0).
+
+        longitud_kc : int, opcional
+            Ventana de los Canales de Keltner (por defecto, 20).
+
+        multiplicador_kc : float, opcional
+            Multiplicador del Rango Verdadero en los Canales de Keltner (por defecto, 1.5).
+
+        periodos_momentum : int, opcional
+            Velas del cambio del cierre (por defecto, 12).
+
+        longitud_momentum : int, opcional
+            Ventana de la media del momentum (por defecto, 6).
+
+        columna : str, opcional
+            Columna de las velas para las bandas y los canales (por defecto, 'Close').
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.multiplicador_kc = multiplicador_kc
+        self.columna = columna
+        self.BB = BandasBollinger(longitud_bb, desviacion_std_bb, ddof=1, columna=columna)
+        self.EMA = MediaMovilExponencial(longitud_kc, columna)
+        self.TR_EMA = MediaMovilExponencial(longitud_kc, adjust=True)
+        self.momentum = SumaMovil(longitud_momentum)
+        # Atributos Privados
+        self.__cierres = deque(maxlen=periodos_momentum + 1)
+        self.__valor = {"SQZ": np.nan, "SQZ_ON": False, "SQZ_OFF": False, "SQZ_NO": True}
+
+
+    # Actualizar con una vela
+    def actualizar(self, barra) -> dict:
+        High, Low, Close = float(barra["High"]), float(barra["Low"]), float(barra["Close"])
+        # Bandas de Bollinger y Canales de Keltner
+        BB = self.BB.actualizar(barra)
+        Close_anterior = self.__cierres[-1] if len(self.__cierres) > 0 else np.nan
+        self.TR_EMA.agregar(np.max([High - Low, abs(High - Close_anterior), abs(Close_anterior - Low)]))
+        EMA = self.EMA.agregar(barra[self.columna])
+        Banda_KC_Media_Alta = EMA + self.multiplicador_kc * self.TR_EMA.valor
+        Banda_KC_Media_Baja = EMA - self.multiplicador_kc * self.TR_EMA.valor
+        # Momentum
+        self.__cierres.append(Close)
+        cambio = Close - self.__cierres[0] if len(self.__cierres) == self.__cierres.maxlen else np.nan
+        squeeze = self.momentum.agregar(cambio) / self.momentum.longitud
+        # Condiciones de Squeeze
+        func_on = bool(BB["BB_Down"] > Banda_KC_Media_Baja and BB["BB_Up"] < Banda_KC_Media_Alta)
+        func_off = bool(BB["BB_Down"] < Banda_KC_Media_Baja and BB["BB_Up"] > Banda_KC_Media_Alta)
+        self.__valor = {"SQZ": squeeze, "SQZ_ON": func_on, "SQZ_OFF": func_off, "SQZ_NO": not func_on and not func_off}
+        return self.valor
+
+    # Valor actual
+    @property
+    def valor(self) -> dict:
+        return self.__valor
+
+# Estado incremental de una estrategia
+class EstadoIncremental:
+
+    """
+    Estado de los indicadores incrementales de una estrategia entre ciclos del sistema. Los indicadores se actualizan
+    solo con las velas confirmadas (todas menos la última) que se agregaron desde la llamada anterior; la última vela se
+    evalúa sobre una copia del estado porque puede seguir cambiando (vela en formación).
+
+    El estado se reconstruye con todo el historial si cambian los parámetros o si se revisa el historial (la última vela
+    confirmada ya no está o cambió). Si solo se descartan las velas más antiguas (ventana de descarga móvil), el estado
+    se conserva: su efecto en las medias exponenciales decae como (1 - alpha)^n.
+    """
+
+    # __init__
+    def __init__(self) -> None:
+
+        """
+        Constructor.
+
+        Salida:
+        -------
+        return : NoneType : None
+        """
+
+        # Definir atributos
+        self.reconstrucciones = 0
+        # Atributos Privados
+        self.__estado = None
+
+
+    # __repr__
+    def __repr__(self):
+        return self.__class__.__name__ + ".class"
+
+    # Evaluar la última vela
+    def evaluar(self, df: pd.DataFrame, columnas: list, parametros: tuple, crear) -> tuple:
+
+        """
+        Actualiza el estado con las velas nuevas y evalúa los indicadores en la última vela.
+
+        Parámetros:
+        -----------
+        df : pd.DataFrame
+            Velas del activo (con al menos una vela).
+
+        columnas : list
+            Columnas de las velas que usan los indicadores.
+
+        parametros : tuple
+            Parámetros de la estrategia (si cambian, el estado se reconstruye).
+
+        crear : callable
+            Función sin argumentos que crea los indicadores ({nombre: IndicadorStreaming}).
+
+        Salida:
+        -------
+        return : tuple : Valores de los indicadores en la última vela ({nombre: valor}) y la última vela ({columna: valor}).
+        """
+
+        valores = {columna: df[columna].to_numpy(dtype=np.float64) for columna in columnas}
+        n = df.shape[0]
+
+        # Buscar la última vela confirmada del estado (si no está o cambió, reconstruir el estado)
+        estado, inicio = self.__estado, 0
+        if estado is not None and estado["parametros"] == parametros and estado["columnas"] == columnas:
+            posicion = df.index.searchsorted(estado["fecha"])
+            if posicion < n - 1 and df.index[posicion] == estado["fecha"] and \
+                np.array_equal([valores[columna][posicion] for columna in columnas], estado["vela"], equal_nan=True):
+                inicio = posicion + 1
+            else:
+                estado = None
+        else:
+            estado = None
+        if estado is None:
+            estado = {"parametros": parametros, "columnas": columnas, "indicadores": crear(), "fecha": None, "vela": None}
+            self.reconstrucciones += 1
+
+        # Procesar las velas confirmadas nuevas (todas menos la última)
+        for i in range(inicio, n - 1):
+            barra = {columna: valores[columna][i] for columna in columnas}
+            for indicador in estado["indicadores"].values():
+                indicador.actualizar(barra)
+        if n - 2 >= inicio:
+            estado["fecha"] = df.index[n - 2]
+            estado["vela"] = [valores[columna][n - 2] for columna in columnas]
+        self.__estado = estado if estado["fecha"] is not None else None
+
+        # Evaluar la última vela sobre una copia del estado
+        barra = {columna: valores[columna][n - 1] for columna in columnas}
+        resultado = {nombre: deepcopy(indicador).actualizar(barra) for nombre, indicador in estado["indicadores"].items()}
+
+        return resultado, barra